@@ -4,6 +4,12 @@ RWC Command Line Interface
 import click
 import os
 from rwc.core import VoiceConverter
+from rwc.utils.constants import (
+    PITCH_METHODS,
+    DEFAULT_CALLBACK_BLOCKSIZE,
+    MIN_CHUNK_SIZE,
+    MAX_CHUNK_SIZE,
+)
 
 
 @click.group()
@@ -90,7 +96,9 @@ def download_models():
 @click.option('--chunk-size', '-c', default=4096, type=int, help='Processing chunk size in samples (default: 4096 = ~85ms @ 48kHz)')
 @click.option('--pitch-shift', '-p', default=0, type=int, help='Pitch shift in semitones (-24 to +24)')
 @click.option('--index-rate', '-r', default=0.75, type=float, help='Feature retrieval strength (0.0 to 1.0, default: 0.75)')
-def real_time(input_device, output_device, model, use_rmvpe, chunk_size, pitch_shift, index_rate):
+@click.option('--pitch-method', type=click.Choice(PITCH_METHODS), default='auto', help='Pitch extractor (default: auto = FCPE for chunks under 100ms)')
+@click.option('--blocksize', '-b', default=DEFAULT_CALLBACK_BLOCKSIZE, type=int, help=f'Audio device block size in samples (default: {DEFAULT_CALLBACK_BLOCKSIZE}; lower = less I/O latency)')
+def real_time(input_device, output_device, model, use_rmvpe, chunk_size, pitch_shift, index_rate, pitch_method, blocksize):
     """
     Perform real-time voice conversion from microphone input.
 
@@ -109,6 +117,7 @@ def real_time(input_device, output_device, model, use_rmvpe, chunk_size, pitch_s
     click.echo(f"Chunk size: {chunk_size} samples (~{chunk_size / 48000 * 1000:.1f}ms @ 48kHz)")
     click.echo(f"Pitch shift: {pitch_shift} semitones")
     click.echo(f"Index rate: {index_rate}")
+    click.echo(f"Pitch method: {pitch_method}")
     click.echo(f"Expected latency: 500-700ms (Phase 1 batch processing)")
 
     if not os.path.exists(model):
@@ -128,6 +137,10 @@ def real_time(input_device, output_device, model, use_rmvpe, chunk_size, pitch_s
         click.echo(f"Error: Index rate must be between 0.0 and 1.0")
         return
 
+    if blocksize < MIN_CHUNK_SIZE or blocksize > MAX_CHUNK_SIZE:
+        click.echo(f"Error: Block size must be between {MIN_CHUNK_SIZE} and {MAX_CHUNK_SIZE} samples")
+        return
+
     try:
         converter = VoiceConverter(model, use_rmvpe=use_rmvpe)
         converter.real_time_convert(
@@ -135,7 +148,9 @@ def real_time(input_device, output_device, model, use_rmvpe, chunk_size, pitch_s
             output_device=output_device,
             chunk_size=chunk_size,
             pitch_shift=pitch_shift,
-            index_rate=index_rate
+            index_rate=index_rate,
+            pitch_method=pitch_method,
+            blocksize=blocksize
         )
     except Exception as e:
         click.echo(f"Error during real-time conversion: {str(e)}")
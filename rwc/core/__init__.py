@@ -2,16 +2,20 @@
 Core RWC (Real-time Voice Conversion) functionality
 Based on RVC (Retrieval-based Voice Conversion) framework
 """
+import atexit
+import logging
 import os
 import sys
+import threading
 import time
 import torch
 import librosa
 import numpy as np
-from typing import Optional, Tuple, Dict, Any, Union
+from typing import Optional, Tuple, Dict, Any, Union, Callable, List, Sequence, Set
 import configparser
 import shutil
 import subprocess
+from collections import OrderedDict
 from pathlib import Path
 
 from rwc.utils.logging_config import get_logger
@@ -26,12 +30,52 @@ from rwc.utils.constants import (
     METER_EPSILON,
     MIN_CHUNK_SIZE,
     MAX_CHUNK_SIZE,
+    DEFAULT_PITCH_METHOD,
+    REALTIME_PITCH_BUDGET_MS,
+    CALLBACK_RING_BLOCKS,
+    DEFAULT_CALLBACK_BLOCKSIZE,
     ERROR_MESSAGES,
     LOG_MESSAGES,
 )
 
 logger = get_logger(__name__)
 
+
+# Model paths found by _resolve_model(); missing ones are not remembered
+_resolved_models: Set[str] = set()
+
+
+def _resolve_model(path: str) -> Optional[str]:
+    """
+    Resolve a model file path once per process.
+
+    Avoids repeated stat() calls on slow filesystems when VoiceConverter is
+    constructed per request. Only existing files are cached, so a model
+    downloaded into a running process is found on the next lookup.
+
+    Args:
+        path: Model file path
+
+    Returns:
+        The path if it exists, otherwise None
+    """
+    if path in _resolved_models:
+        return path
+    if os.path.exists(path):
+        _resolved_models.add(path)
+        return path
+    return None
+
+
+def _tmpfs_dir() -> Optional[str]:
+    """
+    Return a RAM-backed directory for scratch audio files, if available.
+
+    Returns:
+        '/dev/shm' on systems that provide it, otherwise None (system default)
+    """
+    return '/dev/shm' if os.path.isdir('/dev/shm') else None
+
 class VoiceConverter:
     """
     Core voice conversion class based on RVC framework
@@ -40,7 +84,10 @@ class VoiceConverter:
         self,
         model_path: str,
         config_path: Optional[str] = None,
-        use_rmvpe: Optional[bool] = None
+        use_rmvpe: Optional[bool] = None,
+        pitch_method: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        verbose: bool = True,
     ) -> None:
         """
         Initialize the voice converter with a model
@@ -49,12 +96,19 @@ class VoiceConverter:
             model_path: Path to the RVC model file (.pth)
             config_path: Optional path to config file
             use_rmvpe: Whether to use RMVPE for pitch extraction (more accurate)
+            pitch_method: Pitch extractor ('auto', 'rmvpe', 'fcpe', 'crepe')
+            chunk_size: Streaming chunk size in samples; lets 'auto' pick FCPE
+                when the chunk duration is below the real-time pitch budget
+            verbose: Report model loading on stdout; False logs it at DEBUG
+                level instead (background loads while a prompt is shown)
 
         Raises:
             FileNotFoundError: If model file doesn't exist
             RuntimeError: If model loading fails
         """
-        logger.info(f"Initializing VoiceConverter with model: {model_path}")
+        self.verbose = verbose
+        self._log_level = logging.INFO if verbose else logging.DEBUG
+        logger.log(self._log_level, f"Initializing VoiceConverter with model: {model_path}")
 
         self.model_path = model_path
         self.config_path = config_path or 'rwc/config.ini'
@@ -62,20 +116,35 @@ class VoiceConverter:
 
         # Use parameter if provided, otherwise use config default
         self.use_rmvpe = use_rmvpe if use_rmvpe is not None else self.config.getboolean('CONVERSION', 'use_rmvpe_by_default', fallback=True)
+        self.pitch_method = self._select_pitch_method(pitch_method, chunk_size)
+        if self.pitch_method == 'rmvpe':
+            self.use_rmvpe = True
 
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-        logger.info(f"Using device: {self.device}")
+        logger.log(self._log_level, f"Using device: {self.device}")
 
         if not torch.cuda.is_available():
-            logger.warning(ERROR_MESSAGES['cuda_not_available'])
+            logger.log(logging.WARNING if verbose else logging.DEBUG, ERROR_MESSAGES['cuda_not_available'])
 
         self.model: Optional[Any] = None
         self.hubert_model: Optional[Any] = None
         self.rmvpe_model: Optional[Any] = None
+        self.fcpe_model: Optional[Any] = None
+
+        # Realtime pipeline kept across real_time_convert() runs (see _realtime_pipeline)
+        self._rt_pipeline = None
+        self._rt_key = None
 
         # Initialize models
         self._load_models()
-        logger.info(LOG_MESSAGES['model_loaded'].format(model=Path(model_path).name))
+        logger.log(self._log_level, LOG_MESSAGES['model_loaded'].format(model=Path(model_path).name))
+
+    def _report(self, message: str) -> None:
+        """Print a model loading message, or log it at DEBUG level for quiet loads"""
+        if self.verbose:
+            print(message)
+        else:
+            logger.debug(message)
     
     def _load_config(self) -> configparser.ConfigParser:
         """
@@ -97,44 +166,103 @@ class VoiceConverter:
             config.read(self.config_path)
         
         return config
+
+    def _select_pitch_method(self, pitch_method: Optional[str], chunk_size: Optional[int]) -> str:
+        """
+        Resolve the pitch extraction method
+
+        'auto' picks FCPE when the chunk duration falls below the real-time
+        pitch budget, otherwise RMVPE (or CREPE when RMVPE is disabled).
+
+        Args:
+            pitch_method: Requested method, or None to use the config default
+            chunk_size: Streaming chunk size in samples, if any
+
+        Returns:
+            Concrete pitch method name ('rmvpe', 'fcpe' or 'crepe')
+        """
+        from rwc.utils.validation import validate_pitch_method
+
+        method = validate_pitch_method(
+            pitch_method or self.config.get('CONVERSION', 'pitch_method', fallback=DEFAULT_PITCH_METHOD)
+        )
+        if method != 'auto':
+            return method
+
+        sample_rate = self.config.getint('AUDIO', 'default_sample_rate', fallback=DEFAULT_SAMPLE_RATE)
+        if chunk_size and chunk_size / sample_rate * 1000 < REALTIME_PITCH_BUDGET_MS:
+            return 'fcpe'
+        return 'rmvpe' if self.use_rmvpe else 'crepe'
     
     def _load_models(self):
         """
         Load the voice conversion models
         """
-        print(f"Loading model from: {self.model_path}")
-        print(f"Using device: {self.device}")
-        
+        self._report(f"Loading model from: {self.model_path}")
+        self._report(f"Using device: {self.device}")
+
+        # Process-wide inference tunings: TF32 matmul/convolutions on Ampere+
+        torch.set_float32_matmul_precision('high')
+        if torch.cuda.is_available():
+            torch.backends.cuda.matmul.allow_tf32 = True
+            torch.backends.cudnn.allow_tf32 = True
+
         # Initialize hubert model for feature extraction
         self._load_hubert_model()
-        
+
+        # Initialize FCPE model if selected for low-latency pitch extraction
+        if self.pitch_method == 'fcpe':
+            self._load_fcpe_model()
+
         # Initialize RMVPE model if available and requested
         if self.use_rmvpe:
             self._load_rmvpe_model()
+
+        # Pitch extractors keyed by method name (CREPE is built into the backend)
+        self._f0_extractors = {
+            'rmvpe': self.rmvpe_model,
+            'fcpe': self.fcpe_model,
+            'crepe': None,
+        }
     
     def _load_hubert_model(self):
         """
         Load the HuBERT model for feature extraction
         """
         hubert_path = self.config.get('MODEL_PATHS', 'hubert_model_path', fallback='models/hubert_base/hubert_base.pt')
-        if os.path.exists(hubert_path):
-            print(f"Loading HuBERT model from {hubert_path}")
+        if _resolve_model(hubert_path):
+            self._report(f"Loading HuBERT model from {hubert_path}")
             # In a full implementation, we would load the actual model here
         else:
-            print(f"Warning: HuBERT model not found at {hubert_path}. Please run 'bash download_models.sh'")
+            self._report(f"Warning: HuBERT model not found at {hubert_path}. Please run 'bash download_models.sh'")
     
     def _load_rmvpe_model(self):
         """
         Load the RMVPE model for more accurate pitch extraction
         """
         rmvpe_path = self.config.get('MODEL_PATHS', 'rmvpe_model_path', fallback='models/rmvpe/rmvpe.pt')
-        if os.path.exists(rmvpe_path):
-            print(f"Loading RMVPE model from {rmvpe_path}")
+        if _resolve_model(rmvpe_path):
+            self._report(f"Loading RMVPE model from {rmvpe_path}")
             # In a full implementation, we would load the actual model here
             self.rmvpe_model = rmvpe_path
         else:
-            print(f"RMVPE model not found at {rmvpe_path}, falling back to built-in pitch extraction")
+            self._report(f"RMVPE model not found at {rmvpe_path}, falling back to built-in pitch extraction")
             self.use_rmvpe = False
+            if self.pitch_method == 'rmvpe':
+                self.pitch_method = 'crepe'
+
+    def _load_fcpe_model(self):
+        """
+        Load the FCPE model for low-latency pitch extraction
+        """
+        fcpe_path = self.config.get('MODEL_PATHS', 'fcpe_model_path', fallback='models/fcpe/fcpe.pt')
+        if _resolve_model(fcpe_path):
+            self._report(f"Loading FCPE model from {fcpe_path}")
+            # In a full implementation, we would load the actual model here
+            self.fcpe_model = fcpe_path
+        else:
+            self._report(f"FCPE model not found at {fcpe_path}, falling back to {'RMVPE' if self.use_rmvpe else 'built-in'} pitch extraction")
+            self.pitch_method = 'rmvpe' if self.use_rmvpe else 'crepe'
     
     def convert_voice(
         self,
@@ -198,9 +326,7 @@ class VoiceConverter:
             # ultimate-rvc uses semitones directly (same as rwc's pitch_shift)
             # ultimate-rvc's index_rate maps directly to rwc's index_rate
             
-            f0_methods = [F0Method.RMVPE]  # Use RMVPE for pitch extraction
-            if not self.use_rmvpe:
-                f0_methods = [F0Method.CREPE]  # Fallback to CREPE
+            f0_methods = [F0Method(self.pitch_method)]  # rmvpe, fcpe or crepe
             
             logger.info(f"Converting with model: {model_name}")
             logger.info(f"Pitch shift: {pitch_shift} semitones")
@@ -248,6 +374,55 @@ class VoiceConverter:
             logger.error(f"Voice conversion failed: {e}")
             raise RuntimeError(f"Voice conversion failed: {e}")
 
+    def convert_voice_batch(
+        self,
+        jobs: Sequence[Tuple[Union[str, Path], Union[str, Path]]],
+        pitch_shift: int = 0,
+        index_rate: float = 0.5,
+        on_progress: Optional[Callable[[int, int, str, Optional[Exception]], None]] = None,
+    ) -> List[Optional[Path]]:
+        """
+        Convert several audio files with the models already loaded
+
+        ultimate-rvc converts one file per call, so the files run one after
+        another; the batch shares this converter's loaded models instead of
+        reloading them per file. A failing file is reported and skipped
+        rather than aborting the rest of the batch.
+
+        Args:
+            jobs: (input path, output path) pairs
+            pitch_shift: Pitch shift in semitones (-24 to +24)
+            index_rate: Feature retrieval strength (0.0 to 1.0)
+            on_progress: Called after each file with (done, total, input path, error or None)
+
+        Returns:
+            Output path per job, None where the conversion failed
+
+        Raises:
+            ValidationError: If pitch_shift or index_rate is invalid
+        """
+        from rwc.utils.validation import validate_pitch_change, validate_index_rate
+
+        # Reject bad parameters once instead of failing every file
+        validate_pitch_change(pitch_shift)
+        validate_index_rate(index_rate)
+
+        results: List[Optional[Path]] = []
+        for done, (input_path, output_path) in enumerate(jobs, 1):
+            error = None
+            try:
+                results.append(self.convert_voice(
+                    input_path, output_path, pitch_shift=pitch_shift, index_rate=index_rate
+                ))
+            except Exception as e:
+                results.append(None)
+                error = e
+            if on_progress is not None:
+                on_progress(done, len(jobs), str(input_path), error)
+
+        logger.info(f"Batch conversion finished: {sum(r is not None for r in results)}/{len(jobs)} files")
+        return results
+
     # NOTE: The following placeholder methods have been removed as of Nov 2025
     # RVC inference is now handled by the ultimate-rvc package integration in convert_voice()
     # Previous placeholder methods:
@@ -256,6 +431,44 @@ class VoiceConverter:
     # - _rvc_inference_placeholder: RVC inference pipeline (now in ultimate-rvc)
     # - _apply_pitch_shift: Pitch shifting (now handled by ultimate-rvc's n_semitones parameter)
 
+    def _realtime_pipeline(self, conversion_config, buffer_config):
+        """
+        Return the realtime pipeline for these settings, reusing the last one
+
+        Runs end with pipeline.pause() rather than stop(), so the next run with
+        the same model-side settings restarts without reloading the backend.
+        Pitch shift and index rate are read per chunk, so changing them keeps
+        the pipeline; any other change releases it and builds a new one.
+
+        Args:
+            conversion_config: Backend configuration for this run
+            buffer_config: Buffer configuration for this run
+
+        Returns:
+            StreamingPipeline (started by the caller)
+        """
+        from dataclasses import replace
+        from rwc.streaming import BatchConverter, StreamingPipeline
+
+        key = (replace(conversion_config, pitch_shift=0, index_rate=0.0), buffer_config)
+        if self._rt_pipeline is not None and self._rt_key == key:
+            self._rt_pipeline.backend.config = conversion_config
+            return self._rt_pipeline
+
+        self.release_realtime()
+        pipeline = StreamingPipeline(BatchConverter(conversion_config), buffer_config)
+        self._rt_pipeline, self._rt_key = pipeline, key
+        # Scratch files live on tmpfs: clean up even if release_realtime() is never called
+        atexit.register(pipeline.stop)
+        return pipeline
+
+    def release_realtime(self) -> None:
+        """Stop the realtime pipeline kept between runs and release its backend"""
+        pipeline, self._rt_pipeline, self._rt_key = self._rt_pipeline, None, None
+        if pipeline is not None:
+            atexit.unregister(pipeline.stop)
+            pipeline.stop()
+
     def real_time_convert(
         self,
         input_device: int = 0,
@@ -267,6 +480,8 @@ class VoiceConverter:
         chunk_size: int = 4096,
         pitch_shift: int = 0,
         index_rate: float = 0.75,
+        pitch_method: Optional[str] = None,
+        blocksize: int = DEFAULT_CALLBACK_BLOCKSIZE,
     ):
         """
         Perform real-time voice conversion using microphone input
@@ -281,6 +496,11 @@ class VoiceConverter:
             chunk_size: Processing chunk size in samples (default: 4096 = ~85ms @ 48kHz)
             pitch_shift: Pitch shift in semitones (-24 to +24)
             index_rate: Feature retrieval strength (0.0 to 1.0)
+            pitch_method: Pitch extractor ('auto' picks FCPE for sub-100ms chunks)
+            blocksize: PortAudio callback block size in samples (smaller is lower latency)
+
+        Raises:
+            ValueError: If blocksize is out of range
 
         Note: Real-time conversion requires the following additional dependencies:
         - PortAudio library (system library) - installed
@@ -288,6 +508,9 @@ class VoiceConverter:
 
         Phase 1 Latency: 500-700ms (using BatchConverter with ultimate-rvc)
         """
+        if not isinstance(blocksize, int) or not MIN_CHUNK_SIZE <= blocksize <= MAX_CHUNK_SIZE:
+            raise ValueError(f"Invalid blocksize: {blocksize} (must be {MIN_CHUNK_SIZE}-{MAX_CHUNK_SIZE})")
+
         use_pwcat = shutil.which("pw-cat") is not None
 
         if use_pwcat:
@@ -300,25 +523,28 @@ class VoiceConverter:
                 chunk_size=chunk_size,
                 pitch_shift=pitch_shift,
                 index_rate=index_rate,
+                pitch_method=pitch_method,
+                chunk=blocksize,
             )
             return
 
         import pyaudio
         import numpy as np
         from rwc.streaming import (
-            BatchConverter,
-            StreamingPipeline,
             ConversionConfig,
-            BufferConfig
+            BufferConfig,
+            SampleRing
         )
+        from rwc.streaming._buffer_kernels import rms as block_rms, warm_up as warm_up_kernels
 
         print(f"Starting real-time conversion on device {input_device} -> {output_device}")
         print(f"Using {'RMVPE' if self.use_rmvpe else 'default'} pitch extraction")
         print(f"Chunk size: {chunk_size} samples (~{chunk_size / 48000 * 1000:.1f}ms @ 48kHz)")
-        print(f"Expected latency: 500-700ms (Phase 1 batch processing)")
+        print(f"Callback block: {blocksize} samples (~{blocksize / 48000 * 1000:.1f}ms @ 48kHz)")
+        print("Expected latency: 500-700ms (Phase 1 batch processing)")
 
         # Set up audio parameters
-        chunk = 1024  # PyAudio buffer size (smaller for lower I/O latency)
+        chunk = blocksize  # PortAudio callback block (smaller for lower I/O latency)
         FORMAT = pyaudio.paFloat32
         CHANNELS = 1  # Mono for RVC processing
         RATE = 48000  # Sample rate to match RVC models
@@ -330,7 +556,9 @@ class VoiceConverter:
             index_rate=index_rate,
             sample_rate=RATE,
             use_rmvpe=self.use_rmvpe,
-            chunk_size=chunk_size
+            pitch_method=pitch_method or self.config.get('CONVERSION', 'pitch_method', fallback=DEFAULT_PITCH_METHOD),
+            chunk_size=chunk_size,
+            batch_chunks=self.config.getint('PERFORMANCE', 'stream_batch_chunks', fallback=1)
         )
 
         buffer_config = BufferConfig(
@@ -339,8 +567,23 @@ class VoiceConverter:
             channels=CHANNELS
         )
 
-        backend = BatchConverter(conversion_config)
-        pipeline = StreamingPipeline(backend, buffer_config)
+        pipeline = self._realtime_pipeline(conversion_config, buffer_config)
+
+        # Callback side of the duplex stream: two lock-free rings. Sized for at
+        # least DEFAULT_CHUNK_SIZE blocks so small callback blocks still leave the
+        # pump headroom; the pump drains them, so capacity adds no latency.
+        ring_size = CALLBACK_RING_BLOCKS * max(chunk, DEFAULT_CHUNK_SIZE)
+        capture = SampleRing(ring_size)
+        playback = SampleRing(ring_size)
+        out_block = np.zeros(chunk, dtype=np.float32)
+
+        def audio_callback(in_data, frame_count, time_info, status):
+            # Runs on the PortAudio thread: copy in and out, never wait on conversion
+            capture.write(np.frombuffer(in_data, dtype=np.float32))
+            block = out_block[:frame_count]
+            got = playback.read_into(block)
+            block[got:] = 0.0  # Underrun (or startup latency): play silence
+            return block.tobytes(), pyaudio.paContinue
 
         # Initialize PyAudio
         p = pyaudio.PyAudio()
@@ -350,24 +593,21 @@ class VoiceConverter:
             pipeline.start()
             print("Streaming pipeline initialized successfully!")
 
-            # Open input stream
-            stream_in = p.open(
-                format=FORMAT,
-                channels=CHANNELS,
-                rate=RATE,
-                input=True,
-                input_device_index=input_device,
-                frames_per_buffer=chunk
-            )
+            # SampleRing.write() runs ring_write in the callback: compile it (and
+            # its read-only frombuffer signature) now, not on the first callback
+            warm_up_kernels()
 
-            # Open output stream
-            stream_out = p.open(
+            # One full-duplex callback stream instead of blocking read/write calls
+            stream = p.open(
                 format=FORMAT,
                 channels=CHANNELS,
                 rate=RATE,
+                input=True,
                 output=True,
+                input_device_index=input_device,
                 output_device_index=output_device,
-                frames_per_buffer=chunk
+                frames_per_buffer=chunk,
+                stream_callback=audio_callback
             )
 
             print("Real-time conversion streams opened successfully!")
@@ -376,23 +616,23 @@ class VoiceConverter:
                 print("Microphone level meter active (updates every "
                       f"{meter_refresh:.1f}s)")
 
-            # Real-time conversion loop
+            # Pipeline pump: moves audio between the rings and the pipeline
             try:
                 last_meter_update = time.monotonic()
                 meter_bar_width = 30
                 epsilon = 1e-8
+                audio_array = np.empty(chunk, dtype=np.float32)
 
                 while True:
-                    # Read data from microphone
-                    data = stream_in.read(chunk, exception_on_overflow=False)
-
-                    # Convert to numpy array for processing
-                    audio_array = np.frombuffer(data, dtype=np.float32)
+                    # Wait for a block from the microphone (timeout keeps Ctrl+C responsive)
+                    if not capture.wait_readable(chunk, timeout=0.5):
+                        continue
+                    capture.read_into(audio_array)
 
                     if show_meter:
                         now = time.monotonic()
                         if now - last_meter_update >= meter_refresh:
-                            rms = float(np.sqrt(np.mean(np.square(audio_array))))
+                            rms = block_rms(audio_array)
                             meter_level = min(rms / 0.2, 1.0)
                             filled = int(meter_level * meter_bar_width)
                             bar = "#" * filled + "." * (meter_bar_width - filled)
@@ -403,21 +643,13 @@ class VoiceConverter:
                             sys.stdout.flush()
                             last_meter_update = now
 
-                    # Send audio to streaming pipeline for conversion
+                    # Send audio to streaming pipeline for conversion (it gates silence)
                     pipeline.process_input(audio_array)
 
-                    # Get converted audio from pipeline
+                    # Queue converted audio for the callback (it plays silence until ready)
                     processed_audio = pipeline.get_output(chunk)
-
-                    # If no output ready yet, use silence (startup latency)
-                    if processed_audio is None:
-                        processed_audio = np.zeros(chunk, dtype=np.float32)
-
-                    # Convert back to bytes
-                    output_data = processed_audio.astype(np.float32).tobytes()
-
-                    # Play processed audio
-                    stream_out.write(output_data)
+                    if processed_audio is not None:
+                        playback.write(processed_audio)
 
             except KeyboardInterrupt:
                 print("\nReal-time conversion stopped by user.")
@@ -427,23 +659,22 @@ class VoiceConverter:
                     sys.stdout.flush()
 
         except Exception as e:
-            print(f"Error during real-time conversion: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error(f"Error during real-time conversion: {e}", exc_info=True)
         finally:
             # Clean up
-            if 'stream_in' in locals():
-                stream_in.stop_stream()
-                stream_in.close()
-            if 'stream_out' in locals():
-                stream_out.stop_stream()
-                stream_out.close()
+            if 'stream' in locals():
+                stream.stop_stream()
+                stream.close()
             p.terminate()
 
-            # Stop streaming pipeline
-            if 'pipeline' in locals():
-                pipeline.stop()
+            # Pause the streaming pipeline; its models stay loaded for the next run
+            pipeline.pause()
 
+            if capture.dropped_samples or playback.dropped_samples:
+                logger.warning(
+                    f"Callback rings dropped {capture.dropped_samples} capture / "
+                    f"{playback.dropped_samples} playback samples"
+                )
             print("Real-time conversion streams closed.")
 
     def _real_time_convert_pwcat(
@@ -458,6 +689,7 @@ class VoiceConverter:
         chunk_size: int = 4096,
         pitch_shift: int = 0,
         index_rate: float = 0.75,
+        pitch_method: Optional[str] = None,
     ):
         """
         PipeWire-based real-time loop using pw-cat for capture/playback.
@@ -473,6 +705,7 @@ class VoiceConverter:
             chunk_size: Processing chunk size in samples (default: 4096 = ~85ms @ 48kHz)
             pitch_shift: Pitch shift in semitones (-24 to +24)
             index_rate: Feature retrieval strength (0.0 to 1.0)
+            pitch_method: Pitch extractor ('auto' picks FCPE for sub-100ms chunks)
 
         Phase 1 Latency: 500-700ms (using BatchConverter with ultimate-rvc)
 
@@ -487,11 +720,10 @@ class VoiceConverter:
             ValidationError
         )
         from rwc.streaming import (
-            BatchConverter,
-            StreamingPipeline,
             ConversionConfig,
             BufferConfig
         )
+        from rwc.streaming._buffer_kernels import rms as block_rms
 
         # Validate inputs to prevent command injection
         try:
@@ -513,7 +745,9 @@ class VoiceConverter:
             index_rate=index_rate,
             sample_rate=rate,
             use_rmvpe=self.use_rmvpe,
-            chunk_size=chunk_size
+            pitch_method=pitch_method or self.config.get('CONVERSION', 'pitch_method', fallback=DEFAULT_PITCH_METHOD),
+            chunk_size=chunk_size,
+            batch_chunks=self.config.getint('PERFORMANCE', 'stream_batch_chunks', fallback=1)
         )
 
         buffer_config = BufferConfig(
@@ -522,11 +756,10 @@ class VoiceConverter:
             channels=channels
         )
 
-        backend = BatchConverter(conversion_config)
-        pipeline = StreamingPipeline(backend, buffer_config)
+        pipeline = self._realtime_pipeline(conversion_config, buffer_config)
 
         print(f"Chunk size: {chunk_size} samples (~{chunk_size / rate * 1000:.1f}ms @ {rate}Hz)")
-        print(f"Expected latency: 500-700ms (Phase 1 batch processing)")
+        print("Expected latency: 500-700ms (Phase 1 batch processing)")
 
         # Build command with validated parameters (safe from injection)
         record_cmd = [
@@ -553,6 +786,13 @@ class VoiceConverter:
 
         bytes_per_sample = 2  # s16le
         bytes_per_chunk = chunk * channels * bytes_per_sample
+        # Scratch reused for every chunk: raw capture bytes, float samples, playback bytes
+        in_bytes = bytearray(bytes_per_chunk)
+        in_pcm = np.frombuffer(in_bytes, dtype=np.int16)
+        in_float = np.empty(chunk * channels, dtype=np.float32)
+        out_float = np.empty(chunk, dtype=np.float32)
+        out_bytes = bytearray(chunk * bytes_per_sample)
+        out_pcm = np.frombuffer(out_bytes, dtype=np.int16)
         epsilon = 1e-8
         meter_bar_width = 30
         last_meter_update = time.monotonic()
@@ -585,20 +825,22 @@ class VoiceConverter:
                       f"{meter_refresh:.1f}s)")
 
             while True:
-                chunk_bytes = record_proc.stdout.read(bytes_per_chunk)
-                if not chunk_bytes:
+                got = record_proc.stdout.readinto(in_bytes)
+                if not got:
                     # End of stream; give pw-cat time to flush stderr
                     time.sleep(0.05)
                     err = record_proc.stderr.read().decode() if record_proc.stderr else ""
                     raise RuntimeError(f"pw-cat ended unexpectedly.\n{err}")
 
-                audio_array = np.frombuffer(chunk_bytes, dtype=np.int16).astype(np.float32)
-                audio_array /= 32768.0
+                # Scale int16 straight into the float scratch (short read only at end of stream)
+                samples = got // bytes_per_sample
+                audio_array = in_float[:samples]
+                np.multiply(in_pcm[:samples], 1.0 / 32768.0, out=audio_array)
 
                 if show_meter:
                     now = time.monotonic()
                     if now - last_meter_update >= meter_refresh:
-                        rms = float(np.sqrt(np.mean(np.square(audio_array))))
+                        rms = block_rms(audio_array)
                         meter_level = min(rms / 0.2, 1.0)
                         filled = int(meter_level * meter_bar_width)
                         bar = "#" * filled + "." * (meter_bar_width - filled)
@@ -607,28 +849,27 @@ class VoiceConverter:
                         sys.stdout.flush()
                         last_meter_update = now
 
-                # Send audio to streaming pipeline for conversion
+                # Send audio to streaming pipeline for conversion (it gates silence)
                 pipeline.process_input(audio_array)
 
                 # Get converted audio from pipeline
                 processed = pipeline.get_output(chunk)
 
-                # If no output ready yet, use silence (startup latency)
+                # Convert to int16 in place and write to playback
                 if processed is None:
-                    processed = np.zeros(chunk, dtype=np.float32)
-
-                # Convert to int16 and write to playback
-                processed = np.clip(processed, -1.0, 1.0)
-                output_bytes = (processed * 32767.0).astype(np.int16).tobytes()
+                    # No output ready yet, use silence (startup latency)
+                    out_pcm.fill(0)
+                else:
+                    np.clip(processed, -1.0, 1.0, out=out_float)
+                    out_float *= 32767.0
+                    np.copyto(out_pcm, out_float, casting='unsafe')
 
-                play_proc.stdin.write(output_bytes)
+                play_proc.stdin.write(out_bytes)
 
         except KeyboardInterrupt:
             print("\nReal-time conversion stopped by user.")
         except Exception as exc:
-            print(f"\nError during PipeWire streaming: {exc}")
-            import traceback
-            traceback.print_exc()
+            logger.error(f"Error during PipeWire streaming: {exc}", exc_info=True)
         finally:
             if show_meter:
                 sys.stdout.write("\n")
@@ -642,9 +883,8 @@ class VoiceConverter:
             record_proc.terminate()
             play_proc.terminate()
 
-            # Stop streaming pipeline
-            if 'pipeline' in locals():
-                pipeline.stop()
+            # Pause the streaming pipeline; its models stay loaded for the next run
+            pipeline.pause()
 
             # Drain stderr for debugging
             for proc, label in [(record_proc, "record"), (play_proc, "playback")]:
@@ -655,3 +895,59 @@ class VoiceConverter:
                             print(f"[pw-cat {label} stderr] {err}")
                 except Exception:
                     pass
+
+
+# Loaded converters keyed by (model_path, use_rmvpe), least recently used first
+CONVERTER_CACHE_SIZE = 4
+_converters: "OrderedDict[Tuple[str, Optional[bool]], VoiceConverter]" = OrderedDict()
+# One lock per key, so a background warm-up and the job that needs it share
+# one load while loads of other keys proceed; _converters_lock guards both dicts
+_load_locks: Dict[Tuple[str, Optional[bool]], threading.Lock] = {}
+_converters_lock = threading.Lock()
+
+
+def get_converter(
+    model_path: str,
+    use_rmvpe: Optional[bool] = None,
+    verbose: bool = True,
+) -> VoiceConverter:
+    """
+    Return a loaded VoiceConverter, reusing it across conversion jobs.
+
+    Keeps the four most recently used (model, RMVPE) combinations loaded so
+    repeated jobs skip model loading. Failed loads are not cached. Call
+    ``clear_converter_cache()`` to release the loaded models.
+
+    Args:
+        model_path: Path to the RVC model file (.pth)
+        use_rmvpe: Whether to use RMVPE for pitch extraction (None: config default)
+        verbose: Report loading on stdout if the model is not cached yet
+                 (see VoiceConverter)
+
+    Returns:
+        Shared VoiceConverter instance
+    """
+    key = (model_path, use_rmvpe)
+    with _converters_lock:
+        load_lock = _load_locks.setdefault(key, threading.Lock())
+
+    with load_lock:
+        with _converters_lock:
+            converter = _converters.get(key)
+            if converter is not None:
+                _converters.move_to_end(key)
+                return converter
+
+        converter = VoiceConverter(model_path, use_rmvpe=use_rmvpe, verbose=verbose)
+
+        with _converters_lock:
+            _converters[key] = converter
+            while len(_converters) > CONVERTER_CACHE_SIZE:
+                _converters.popitem(last=False)
+        return converter
+
+
+def clear_converter_cache() -> None:
+    """Drop all cached VoiceConverter instances"""
+    with _converters_lock:
+        _converters.clear()
@@ -19,6 +19,7 @@ Components:
 ----------
 - ConversionBackend: Abstract interface for conversion backends
 - BufferManager: Input/output audio buffering with context tracking
+- SampleRing: Lock-free sample ring between audio callbacks and the pipeline
 - StreamingPipeline: Orchestrates audio capture → conversion → playback
 - BatchConverter: Phase 1 implementation using ultimate-rvc
 
@@ -65,7 +66,7 @@ Usage:
 """
 
 from .backends import ConversionBackend, ConversionConfig, ConversionMetrics
-from .buffer import BufferManager, BufferConfig
+from .buffer import BufferManager, BufferConfig, SampleRing
 from .pipeline import StreamingPipeline
 from .batch_backend import BatchConverter
 from .streaming_backend import StreamingConverter
@@ -79,6 +80,7 @@ __all__ = [
     # Buffer management
     'BufferManager',
     'BufferConfig',
+    'SampleRing',
 
     # Pipeline orchestration
     'StreamingPipeline',
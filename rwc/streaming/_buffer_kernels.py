@@ -0,0 +1,209 @@
+"""
+Compiled numeric kernels for BufferManager and StreamingConverter
+
+Numba is optional: when it is not installed the same functions fall back
+to plain numpy, so callers never need to check NUMBA_AVAILABLE.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _ring_write(buf: np.ndarray, head: int, data: np.ndarray) -> int:
+    """
+    Copy data into a circular buffer starting at absolute position head
+
+    Args:
+        buf: Ring storage
+        head: Absolute write position (indexed modulo len(buf))
+        data: Samples to write (at most len(buf))
+
+    Returns:
+        New absolute write position
+    """
+    capacity = len(buf)
+    n = len(data)
+    start = head % capacity
+    first = min(n, capacity - start)
+    buf[start:start + first] = data[:first]
+    if first < n:
+        buf[:n - first] = data[first:]
+    return head + n
+
+
+def _crossfade_blend(
+    tail: np.ndarray,
+    new: np.ndarray,
+    fade_out: np.ndarray,
+    fade_in: np.ndarray,
+    n: int
+) -> None:
+    """
+    Blend the previous chunk's tail into the first n samples of new, in place
+
+    Args:
+        tail: Last n samples of the previous chunk
+        new: Chunk whose head is replaced by the blend
+        fade_out: Fade-out window applied to tail
+        fade_in: Fade-in window applied to new
+        n: Crossfade length in samples
+    """
+    for i in range(n):
+        new[i] = tail[i] * fade_out[i] + new[i] * fade_in[i]
+
+
+def _crossfade_blend_numpy(
+    tail: np.ndarray,
+    new: np.ndarray,
+    fade_out: np.ndarray,
+    fade_in: np.ndarray,
+    n: int
+) -> None:
+    """Vectorized fallback for _crossfade_blend when Numba is unavailable"""
+    blended = np.multiply(tail[:n], fade_out[:n])
+    blended += new[:n] * fade_in[:n]
+    new[:n] = blended
+
+
+def _peak_normalize(src: np.ndarray, out: np.ndarray, target: float) -> None:
+    """
+    Copy src into out, scaled down so its peak is at most target
+
+    Finds the absolute peak and applies the gain in one loop each, with no
+    abs() temporary. Audio already below target is copied unchanged.
+
+    Args:
+        src: Input samples
+        out: Destination (same length as src)
+        target: Maximum absolute peak after scaling
+    """
+    peak = 0.0
+    for i in range(len(src)):
+        a = abs(src[i])
+        if a > peak:
+            peak = a
+    scale = max(peak / target, 1.0)
+    for i in range(len(src)):
+        out[i] = src[i] / scale
+
+
+def _peak_normalize_numpy(src: np.ndarray, out: np.ndarray, target: float) -> None:
+    """Vectorized fallback for _peak_normalize when Numba is unavailable"""
+    peak = max(float(src.max(initial=0.0)), -float(src.min(initial=0.0)))
+    np.divide(src, max(peak / target, 1.0), out=out)
+
+
+def _rms(x: np.ndarray) -> float:
+    """
+    Root mean square of a block in one pass, without a squared temporary
+
+    Args:
+        x: Samples
+
+    Returns:
+        RMS level (0.0 for an empty block)
+    """
+    n = len(x)
+    sum_sq = 0.0
+    for i in range(n):
+        sum_sq += x[i] * x[i]
+    return np.sqrt(sum_sq / n) if n > 0 else 0.0
+
+
+def _rms_numpy(x: np.ndarray) -> float:
+    """BLAS dot-product fallback for _rms when Numba is unavailable"""
+    return float(np.sqrt(np.dot(x, x) / len(x))) if len(x) else 0.0
+
+
+def _normalize_crossfade(
+    chunk: np.ndarray,
+    prev_rms: float,
+    prev_tail: np.ndarray,
+    fade_out: np.ndarray,
+    fade_in: np.ndarray
+) -> float:
+    """
+    RMS-normalize a chunk towards the previous one and crossfade its head, in place
+
+    One pass accumulates the sum of squares; a second applies the gain and,
+    for the first len(prev_tail) samples, the crossfade. Matches
+    StreamingConverter._normalize_rms() followed by _apply_crossfade().
+
+    Args:
+        chunk: Output chunk, modified in place
+        prev_rms: RMS of the previous output (negative: none yet)
+        prev_tail: Tail of the previous output (empty: no crossfade)
+        fade_out: Fade-out window for prev_tail (at least len(prev_tail))
+        fade_in: Fade-in window for the chunk head
+
+    Returns:
+        RMS to carry into the next chunk (prev_rms unchanged on silence)
+    """
+    n = len(chunk)
+    sum_sq = 0.0
+    for i in range(n):
+        sum_sq += chunk[i] * chunk[i]
+    current_rms = np.sqrt(sum_sq / n) if n > 0 else 0.0
+
+    scale = 1.0
+    new_rms = prev_rms
+    if current_rms >= 1e-6:
+        if prev_rms > 1e-6:
+            # 50% blend towards the previous level, limited to 0.5x-2x
+            scale = (0.5 * prev_rms + 0.5 * current_rms) / current_rms
+            scale = min(max(scale, 0.5), 2.0)
+        new_rms = current_rms * scale
+
+    fade_len = min(len(prev_tail), n)
+    offset = len(prev_tail) - fade_len
+    for i in range(fade_len):
+        chunk[i] = prev_tail[offset + i] * fade_out[i] + chunk[i] * scale * fade_in[i]
+    if scale != 1.0:
+        for i in range(fade_len, n):
+            chunk[i] *= scale
+    return new_rms
+
+
+if NUMBA_AVAILABLE:
+    ring_write = njit(cache=True, fastmath=True)(_ring_write)
+    crossfade_blend = njit(cache=True, fastmath=True)(_crossfade_blend)
+    normalize_crossfade = njit(cache=True, fastmath=True)(_normalize_crossfade)
+    peak_normalize = njit(cache=True, fastmath=True)(_peak_normalize)
+    rms = njit(cache=True, fastmath=True)(_rms)
+else:
+    ring_write = _ring_write
+    crossfade_blend = _crossfade_blend_numpy
+    peak_normalize = _peak_normalize_numpy
+    rms = _rms_numpy
+    # Scalar loops are slow without Numba: StreamingConverter uses its numpy methods instead
+    normalize_crossfade = _normalize_crossfade
+
+
+def warm_up() -> None:
+    """
+    Compile every kernel for float32 inputs ahead of streaming
+
+    njit(cache=True) kernels compile (or load from the on-disk cache) on
+    their first call for each argument type. Calling this before audio
+    starts keeps that cost off the capture, conversion and audio-callback
+    threads. Both writable and read-only arrays are covered, since
+    np.frombuffer() over the bytes PyAudio delivers is read-only.
+    A no-op without Numba; cheap to call again.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    buf = np.zeros(8, dtype=np.float32)
+    data = np.ones(4, dtype=np.float32)
+    readonly = np.frombuffer(data.tobytes(), dtype=np.float32)
+    fade = np.ones(2, dtype=np.float32)
+    for src in (data, readonly):
+        ring_write(buf, 0, src)
+        rms(src)
+        peak_normalize(src, buf[:4], 0.95)
+    crossfade_blend(fade, data, fade, fade, 2)
+    normalize_crossfade(data, -1.0, fade, fade, fade)
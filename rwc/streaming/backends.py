@@ -5,13 +5,18 @@ This module defines the contract that all conversion backends must implement,
 enabling swapping between BatchConverter (Phase 1) and StreamingConverter (Phase 2).
 """
 
+import sys
 from abc import ABC, abstractmethod
-from typing import Optional
+from concurrent.futures import Future
+from typing import Callable, Optional
 from dataclasses import dataclass
 import numpy as np
 
+# __slots__ dataclasses (faster attribute access) need Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class ConversionConfig:
     """Configuration for voice conversion backend"""
     model_path: str
@@ -19,14 +24,18 @@ class ConversionConfig:
     index_rate: float = 0.75
     sample_rate: int = 48000
     use_rmvpe: bool = True
+    pitch_method: str = 'auto'  # auto | rmvpe | fcpe | crepe (auto: fcpe if chunk < 100ms)
 
     # Streaming-specific
     chunk_size: int = 4096      # Samples per chunk (~85ms @ 48kHz)
     lookahead_size: int = 0     # Future context (Phase 2 only)
     context_size: int = 0       # Past context (Phase 2 only)
+    batch_chunks: int = 1       # Max queued chunks coalesced per convert call (1: lowest latency)
+    compile_model: bool = False  # torch.compile the generator (Phase 2 only; slow first chunk)
+    smoothing_enabled: bool = False  # 8kHz low-pass on output (Phase 2 only; ~1-2ms per chunk)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ConversionMetrics:
     """Performance metrics for monitoring"""
     processing_time_ms: float = 0.0
@@ -54,9 +63,15 @@ class ConversionBackend(ABC):
         backend.cleanup()
     """
 
+    # Chunks the pipeline may have submitted but not yet retired
+    # (1: strictly sequential convert_chunk() calls)
+    max_in_flight: int = 1
+
     def __init__(self, config: ConversionConfig):
         self.config = config
         self.metrics = ConversionMetrics()
+        # Optional source of chunk-sized output buffers (set by StreamingPipeline)
+        self.output_allocator: Optional[Callable[[], np.ndarray]] = None
 
     @abstractmethod
     def initialize(self) -> None:
@@ -85,13 +100,45 @@ class ConversionBackend(ABC):
             context: Previous audio context for continuity (Phase 2 only)
 
         Returns:
-            Converted audio chunk (same shape as input)
+            Converted audio chunk (same shape as input). Ownership passes to
+            the caller: the pipeline crossfades it in place.
 
         Raises:
             RuntimeError: If conversion fails
         """
         pass
 
+    def submit_chunk(
+        self,
+        audio_chunk: np.ndarray,
+        context: Optional[np.ndarray] = None
+    ) -> Future:
+        """
+        Start converting a chunk and return a future for the result
+
+        Backends with max_in_flight > 1 override this to overlap stages of
+        consecutive chunks. The default converts synchronously.
+
+        Args:
+            audio_chunk: Input audio chunk
+            context: Previous audio context for continuity (Phase 2 only)
+
+        Returns:
+            Future resolving to the converted chunk
+        """
+        future: Future = Future()
+        try:
+            future.set_result(self.convert_chunk(audio_chunk, context))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def _output_buffer_for(self, audio_chunk: np.ndarray) -> np.ndarray:
+        """Output buffer matching the input length (pooled for single chunks)"""
+        if self.output_allocator and len(audio_chunk) == self.config.chunk_size:
+            return self.output_allocator()
+        return np.empty(len(audio_chunk), dtype=np.float32)
+
     @abstractmethod
     def cleanup(self) -> None:
         """
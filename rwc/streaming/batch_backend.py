@@ -1,21 +1,27 @@
 """
 Phase 1 batch conversion backend using ultimate-rvc
 
-Converts audio chunks by writing to temporary files and using
-the existing convert_voice() method from VoiceConverter.
+Stages each audio chunk through preallocated scratch WAV files on tmpfs
+and converts it with VoiceConverter.convert_voice() (ultimate-rvc).
 """
 
+import logging
 import tempfile
-import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from time import perf_counter
+from typing import List, Optional, Tuple
 import numpy as np
 import soundfile as sf
 
 from rwc.streaming.backends import ConversionBackend, ConversionConfig
-from rwc.utils.logging_config import get_logger
+from rwc.utils.logging_config import get_logger, get_stream_logger
 
 logger = get_logger(__name__)
+stream_logger = get_stream_logger(__name__)
+
+# Number of preallocated scratch file pairs (power of two, indexed by chunk_id & mask)
+NUM_SCRATCH_SLOTS = 4
 
 
 class BatchConverter(ConversionBackend):
@@ -23,23 +29,26 @@ class BatchConverter(ConversionBackend):
     Phase 1 backend using ultimate-rvc for conversion
 
     Strategy:
-    1. Save audio chunk to temporary WAV file
+    1. Overwrite one of NUM_SCRATCH_SLOTS preallocated scratch WAVs on tmpfs
+       (round-robin) through a persistent SoundFile handle
     2. Call VoiceConverter.convert_voice() (uses ultimate-rvc)
-    3. Load converted audio from output file
-    4. Clean up temporary files
-    5. Return converted chunk
+    3. Load converted audio from the slot's output file
+    4. Return converted chunk
+
+    StreamingPipeline drives it through submit_chunk() instead, which splits
+    write/convert/read onto separate threads so file staging of neighbouring
+    chunks overlaps with inference.
 
     Trade-offs:
-    - Higher latency (500ms-1s) due to file I/O overhead
+    - Higher latency (400ms-1s) due to ultimate-rvc's file-based API
     - Simpler implementation (reuses existing convert_voice)
     - Production-ready (uses tested ultimate-rvc pipeline)
     - No streaming optimizations
 
     Expected latency breakdown:
-    - File write: ~10-20ms
+    - Scratch file write/read (tmpfs): ~1-5ms
     - ultimate-rvc conversion: ~300-700ms (depends on chunk size)
-    - File read: ~10-20ms
-    - Total: ~320-740ms + chunk duration
+    - Total: ~305-710ms + chunk duration
 
     Usage:
         config = ConversionConfig(
@@ -55,10 +64,22 @@ class BatchConverter(ConversionBackend):
         backend.cleanup()
     """
 
+    # Pipelined chunks in flight: one per scratch slot, so a slot is never reused early
+    max_in_flight = NUM_SCRATCH_SLOTS
+
     def __init__(self, config: ConversionConfig):
         super().__init__(config)
         self.temp_dir = None
         self.voice_converter = None
+        self._slots: List[Tuple[Path, Path]] = []
+        self._slot_files: List[sf.SoundFile] = []  # Persistent input handles, one per slot
+
+        # Single-worker stage executors for submit_chunk (FIFO keeps chunk order)
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._converter: Optional[ThreadPoolExecutor] = None
+        self._reader: Optional[ThreadPoolExecutor] = None
+        self._submitted_chunks = 0
+        self._debug = False  # Per-chunk debug logging enabled (bound in initialize())
 
     def initialize(self) -> None:
         """
@@ -70,26 +91,51 @@ class BatchConverter(ConversionBackend):
         Raises:
             RuntimeError: If model loading fails
         """
-        from rwc.core import VoiceConverter
+        from rwc.core import VoiceConverter, _tmpfs_dir
+
+        # Checked once: the stream logger level is fixed for the session
+        self._debug = stream_logger.isEnabledFor(logging.DEBUG)
 
         logger.info("Initializing BatchConverter with ultimate-rvc backend")
         logger.info(f"Model: {self.config.model_path}")
         logger.info(f"Chunk size: {self.config.chunk_size} samples ({self.config.chunk_size / self.config.sample_rate * 1000:.1f}ms)")
 
-        # Create temp directory for chunk files
-        self.temp_dir = tempfile.mkdtemp(prefix="rwc_streaming_")
+        # Create temp directory for chunk files (RAM-backed when available)
+        self.temp_dir = tempfile.mkdtemp(prefix="rwc_streaming_", dir=_tmpfs_dir())
         logger.debug(f"Temporary directory: {self.temp_dir}")
 
+        # Preallocate scratch slots so chunks overwrite files instead of creating them.
+        # Input files stay open; outputs are replaced by ultimate-rvc on every call.
+        dummy = np.zeros(1, dtype=np.float32)
+        self._slots = []
+        self._slot_files = []
+        for slot in range(NUM_SCRATCH_SLOTS):
+            in_path = Path(self.temp_dir) / f"slot_{slot}_in.wav"
+            out_path = Path(self.temp_dir) / f"slot_{slot}_out.wav"
+            self._slot_files.append(self._open_slot(in_path))
+            sf.write(str(out_path), dummy, self.config.sample_rate)
+            self._slots.append((in_path, out_path))
+
         try:
             # Initialize VoiceConverter (loads models)
             self.voice_converter = VoiceConverter(
                 model_path=self.config.model_path,
-                use_rmvpe=self.config.use_rmvpe
+                use_rmvpe=self.config.use_rmvpe,
+                pitch_method=self.config.pitch_method,
+                chunk_size=self.config.chunk_size
             )
+            logger.info(f"Pitch method: {self.voice_converter.pitch_method}")
+
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="RWC-ChunkWrite")
+            self._converter = ThreadPoolExecutor(max_workers=1, thread_name_prefix="RWC-ChunkConvert")
+            self._reader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="RWC-ChunkRead")
             logger.info("BatchConverter initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize VoiceConverter: {e}")
-            # Cleanup temp dir on failure
+            # Cleanup slot handles and temp dir on failure
+            for handle in self._slot_files:
+                handle.close()
+            self._slot_files = []
             if self.temp_dir and Path(self.temp_dir).exists():
                 import shutil
                 shutil.rmtree(self.temp_dir, ignore_errors=True)
@@ -101,7 +147,7 @@ class BatchConverter(ConversionBackend):
         context: Optional[np.ndarray] = None
     ) -> np.ndarray:
         """
-        Convert chunk by: chunk → temp file → ultimate-rvc → load result
+        Convert chunk by: chunk → scratch slot → ultimate-rvc → load result
 
         Args:
             audio_chunk: Input audio chunk
@@ -116,71 +162,149 @@ class BatchConverter(ConversionBackend):
         if self.voice_converter is None:
             raise RuntimeError("BatchConverter not initialized - call initialize() first")
 
-        start_time = time.perf_counter()
+        start_time = perf_counter()
         chunk_id = self.metrics.total_chunks_processed
 
-        # Generate unique temp file names
-        input_temp = Path(self.temp_dir) / f"chunk_{chunk_id:06d}_in.wav"
-        output_temp = Path(self.temp_dir) / f"chunk_{chunk_id:06d}_out.wav"
+        slot = chunk_id & (NUM_SCRATCH_SLOTS - 1)
+        input_path, output_path = self._slots[slot]
 
         try:
-            # Save chunk to temp file
-            write_start = time.perf_counter()
-            sf.write(str(input_temp), audio_chunk, self.config.sample_rate)
-            write_time = (time.perf_counter() - write_start) * 1000
-
-            # Convert using ultimate-rvc (via VoiceConverter)
-            convert_start = time.perf_counter()
-            self.voice_converter.convert_voice(
-                input_audio=str(input_temp),
-                output_audio=str(output_temp),
-                pitch_shift=self.config.pitch_shift,
-                index_rate=self.config.index_rate,
-                sample_rate=self.config.sample_rate
-            )
-            convert_time = (time.perf_counter() - convert_start) * 1000
-
-            # Load converted audio
-            read_start = time.perf_counter()
-            converted_audio, _ = sf.read(str(output_temp))
-            read_time = (time.perf_counter() - read_start) * 1000
-
-            # Ensure same length as input (trim or pad if needed)
-            if len(converted_audio) > len(audio_chunk):
-                converted_audio = converted_audio[:len(audio_chunk)]
-            elif len(converted_audio) < len(audio_chunk):
-                pad_length = len(audio_chunk) - len(converted_audio)
-                converted_audio = np.pad(converted_audio, (0, pad_length), mode='constant')
-
-            # Update metrics
-            end_time = time.perf_counter()
-            processing_time_ms = (end_time - start_time) * 1000
+            # Stage chunk and convert using ultimate-rvc (via VoiceConverter)
+            self._write_stage(slot, audio_chunk)
+            self._convert_stage(None, input_path, output_path)
+        except Exception as e:
+            stream_logger.error(f"Chunk {chunk_id} conversion failed: {e}")
+            self.metrics.dropped_chunks += 1
+            # Return original audio as fallback
+            return audio_chunk
+
+        # Load converted audio and update metrics
+        return self._read_stage(
+            None, output_path, audio_chunk, self._output_buffer_for(audio_chunk), chunk_id, start_time
+        )
+
+    def submit_chunk(
+        self,
+        audio_chunk: np.ndarray,
+        context: Optional[np.ndarray] = None
+    ) -> Future:
+        """
+        Convert chunk through a three-stage pipeline
+
+        Stages run on separate single-worker threads so staging chunk N+1
+        (write) and decoding chunk N-1 (read) overlap with ultimate-rvc
+        inference of chunk N:
+        1. Write the chunk to its scratch slot
+        2. Convert the slot with VoiceConverter.convert_voice()
+        3. Read the result (into a pooled output buffer when available)
+
+        Args:
+            audio_chunk: Input audio chunk
+            context: Previous audio context (ignored in Phase 1)
+
+        Returns:
+            Future resolving to the converted chunk (or the input on failure)
+
+        Raises:
+            RuntimeError: If the converter is not initialized
+        """
+        if self.voice_converter is None or self._writer is None:
+            raise RuntimeError("BatchConverter not initialized - call initialize() first")
+
+        start_time = perf_counter()
+        chunk_id = self._submitted_chunks
+        self._submitted_chunks += 1
+
+        slot = chunk_id & (NUM_SCRATCH_SLOTS - 1)
+        input_path, output_path = self._slots[slot]
+        out = self._output_buffer_for(audio_chunk)
+
+        written = self._writer.submit(self._write_stage, slot, audio_chunk)
+        converted = self._converter.submit(self._convert_stage, written, input_path, output_path)
+        return self._reader.submit(
+            self._read_stage, converted, output_path, audio_chunk, out, chunk_id, start_time
+        )
+
+    def _open_slot(self, path: Path) -> sf.SoundFile:
+        """Open a scratch input file for repeated in-place overwrites"""
+        return sf.SoundFile(
+            str(path), mode='w+', samplerate=self.config.sample_rate,
+            channels=1, subtype='PCM_16'
+        )
+
+    def _write_stage(self, slot: int, audio_chunk: np.ndarray) -> None:
+        """
+        Stage 1: overwrite a slot's input file through its persistent handle
+
+        Rewinds, writes and truncates instead of reopening the file and
+        re-encoding its header; the handle is reopened once if it has failed.
+        """
+        for attempt in range(2):
+            try:
+                handle = self._slot_files[slot]
+                handle.seek(0)
+                handle.write(audio_chunk)
+                handle.truncate(len(audio_chunk))
+                handle.flush()
+                return
+            except Exception:
+                if attempt:
+                    raise
+                try:
+                    self._slot_files[slot].close()
+                except Exception:
+                    pass
+                self._slot_files[slot] = self._open_slot(self._slots[slot][0])
+
+    def _convert_stage(self, written: Optional[Future], input_path: Path, output_path: Path) -> None:
+        """Stage 2: run ultimate-rvc on a staged slot once its write has finished"""
+        if written is not None:
+            written.result()
+        self.voice_converter.convert_voice(
+            input_audio=str(input_path),
+            output_audio=str(output_path),
+            pitch_shift=self.config.pitch_shift,
+            index_rate=self.config.index_rate,
+            sample_rate=self.config.sample_rate
+        )
+
+    def _read_stage(
+        self,
+        converted: Optional[Future],
+        output_path: Path,
+        audio_chunk: np.ndarray,
+        out: np.ndarray,
+        chunk_id: int,
+        start_time: float
+    ) -> np.ndarray:
+        """Stage 3: decode a converted slot and update metrics"""
+        try:
+            if converted is not None:
+                converted.result()
+            # Read straight into the chunk-sized buffer: trims long output,
+            # zero-fills short output in place
+            with sf.SoundFile(str(output_path)) as output_file:
+                frames = min(output_file.frames, len(out))
+                output_file.read(frames=frames, dtype='float32', out=out[:frames])
+            out[frames:] = 0.0
+            converted_audio = out
+
+            processing_time_ms = (perf_counter() - start_time) * 1000
             self.metrics.processing_time_ms = processing_time_ms
             self.metrics.chunk_latency_ms = processing_time_ms
             self.metrics.total_chunks_processed += 1
 
-            logger.debug(
-                f"Chunk {chunk_id} processed in {processing_time_ms:.1f}ms "
-                f"(write: {write_time:.1f}ms, convert: {convert_time:.1f}ms, read: {read_time:.1f}ms)"
-            )
-
+            if self._debug:
+                stream_logger.debug(f"Chunk {chunk_id} processed in {processing_time_ms:.1f}ms")
             return converted_audio
 
         except Exception as e:
-            logger.error(f"Chunk {chunk_id} conversion failed: {e}")
+            stream_logger.error(f"Chunk {chunk_id} conversion failed: {e}")
             self.metrics.dropped_chunks += 1
-            # Return original audio as fallback
-            return audio_chunk
-
-        finally:
-            # Clean up temp files
-            try:
-                if input_temp.exists():
-                    input_temp.unlink()
-                if output_temp.exists():
-                    output_temp.unlink()
-            except Exception as e:
-                logger.warning(f"Failed to clean up temp files: {e}")
+            # Return original audio as fallback, copied into out so a pooled
+            # buffer goes back to the pool once played
+            np.copyto(out, audio_chunk)
+            return out
 
     def cleanup(self) -> None:
         """
@@ -190,6 +314,19 @@ class BatchConverter(ConversionBackend):
         """
         import shutil
 
+        # Let in-flight chunks finish before their scratch files disappear
+        for executor in (self._writer, self._converter, self._reader):
+            if executor is not None:
+                executor.shutdown(wait=True)
+        self._writer = self._converter = self._reader = None
+
+        for handle in self._slot_files:
+            try:
+                handle.close()
+            except Exception:
+                pass
+        self._slot_files = []
+
         if self.temp_dir and Path(self.temp_dir).exists():
             try:
                 shutil.rmtree(self.temp_dir)
@@ -206,11 +343,11 @@ class BatchConverter(ConversionBackend):
         Estimate latency based on chunk size and processing overhead
 
         Phase 1 components:
-        - File I/O: ~30-50ms (write + read)
+        - Scratch file I/O on tmpfs: ~1-5ms (write + read)
         - ultimate-rvc processing: ~300-700ms (depending on chunk size and GPU)
         - Buffer overhead: ~85ms (chunk duration @ 4096 samples)
 
-        Total: ~415-835ms
+        Total: ~390-790ms
 
         Returns:
             Estimated latency in milliseconds
@@ -221,7 +358,7 @@ class BatchConverter(ConversionBackend):
 
         # Otherwise estimate
         chunk_duration_ms = (self.config.chunk_size / self.config.sample_rate) * 1000
-        file_io_overhead_ms = 40
+        file_io_overhead_ms = 5
         urvc_processing_ms = chunk_duration_ms * 4  # Empirical: 4x real-time
         buffer_overhead_ms = chunk_duration_ms
 
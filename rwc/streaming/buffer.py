@@ -5,11 +5,33 @@ Handles input/output buffering, lookahead, and context management
 for smooth real-time voice conversion.
 """
 
+import queue
+import threading
+from time import monotonic
 import numpy as np
 from collections import deque
-from typing import Optional, Tuple
+from typing import Optional, Sequence, Tuple
 from dataclasses import dataclass
 
+from rwc.streaming._buffer_kernels import crossfade_blend, ring_write
+from rwc.utils.logging_config import get_stream_logger
+
+stream_logger = get_stream_logger(__name__)
+
+# Preallocated output chunk buffers (more than the output deque holds, for in-flight chunks)
+OUTPUT_POOL_SIZE = 32
+
+# Peak amplitude below which converted audio is treated as silence
+SILENCE_PEAK = 1e-4
+
+# Minimum seconds between input overflow warnings
+OVERFLOW_LOG_INTERVAL_S = 5.0
+
+
+def is_silent(audio: np.ndarray) -> bool:
+    """True if every sample is within SILENCE_PEAK of zero (no temporaries)"""
+    return audio.max(initial=0.0) < SILENCE_PEAK and audio.min(initial=0.0) > -SILENCE_PEAK
+
 
 @dataclass
 class BufferConfig:
@@ -35,6 +57,10 @@ class BufferManager:
     """
     Ring buffer with lookahead and context management
 
+    The input side is a single-producer/single-consumer circular buffer:
+    writes copy at most two slices and reads advance an index, so neither
+    side moves the buffered samples.
+
     Phase 1: Simple chunking (no lookahead/context)
     Phase 2: Full lookahead + context for RVC continuity
 
@@ -61,50 +87,125 @@ class BufferManager:
         # Input buffer (collects audio from capture)
         max_buffer_size = config.chunk_size * 10  # ~200ms @ 48kHz, 4096 chunk
         self.input_buffer = np.zeros(max_buffer_size, dtype=np.float32)
-        self.input_write_pos = 0
-
-        # Context buffer (previous audio for Phase 2)
-        self.context_buffer = deque(maxlen=config.context_chunks)
+        # Ring buffer positions: absolute sample counts, indexed modulo buffer size
+        self._head = 0  # Total samples written (producer)
+        self._tail = 0  # Total samples consumed (consumer)
+
+        # Context scratch (previous audio for Phase 2): circular, chunk-aligned
+        self._context_scratch = np.zeros(config.context_size, dtype=np.float32)
+        self._context_head = 0    # Next write index
+        self._context_filled = 0  # Valid samples (grows to context_size)
+        # Input silence gaps (see mark_input_gap): resume position and the last one handled
+        self._gap_at = -1    # Producer
+        self._gap_seen = -1  # Consumer
 
         # Output buffer (converted audio ready for playback)
         self.output_buffer = deque(maxlen=20)  # Up to ~400ms output
 
+        # Output buffer pool: chunk buffers recycled between conversion and playback
+        self._pool = [np.empty(config.chunk_size, dtype=np.float32) for _ in range(OUTPUT_POOL_SIZE)]
+        self._pool_ids = {id(buf) for buf in self._pool}
+        self._free_buffers: queue.SimpleQueue = queue.SimpleQueue()
+        for buf in self._pool:
+            self._free_buffers.put(buf)
+
+        # Partially consumed output chunk (playback sizes need not match chunk_size)
+        self._output_leftover: Optional[np.ndarray] = None
+        self._leftover_pos = 0
+        self._read_buf = np.empty(config.chunk_size, dtype=np.float32)
+        # Single-writer counters: available = output - dropped - read
+        self._output_samples_dropped = 0  # Conversion thread
+        self._output_samples_read = 0     # Playback thread
+
         # Crossfade support (to smooth chunk boundaries)
         self.crossfade_samples = min(512, config.chunk_size // 8)  # ~10ms crossfade
-        self.last_chunk_tail = None  # Store tail of previous chunk for crossfade
+        self.last_chunk_tail = None  # Store tail of previous chunk for crossfade (None after silence)
+        # Linear fade windows, built once since crossfade_samples is fixed
+        self._fade_out = np.linspace(1.0, 0.0, self.crossfade_samples, dtype=np.float32)
+        self._fade_in = 1.0 - self._fade_out
+
+        # Readiness signals (wake the conversion and playback threads)
+        self._chunk_ready = threading.Condition()
+        self._output_ready = threading.Condition()
 
         # Metrics
         self.total_samples_received = 0
         self.total_samples_output = 0
+        self.dropped_input_samples = 0  # Captured samples dropped because the ring was full
+        self._last_overflow_log_t = float('-inf')
+        self._overflow_since_log = 0
+
+    @property
+    def context_buffer(self) -> np.ndarray:
+        """
+        Previous chunks in chronological order (empty when no context yet)
+
+        Returns a view of the scratch while it is still filling (valid until
+        the next read_chunk_for_processing() call), and a joined copy once it
+        has wrapped, since the next chunk is written over the oldest one.
+        """
+        head = self._context_head
+        if self._context_filled < len(self._context_scratch):
+            return self._context_scratch[:self._context_filled]
+        return np.concatenate((self._context_scratch[head:], self._context_scratch[:head]))
+
+    @property
+    def input_write_pos(self) -> int:
+        """Number of samples buffered and not yet read for processing"""
+        return self._head - self._tail
 
     def write_input(self, audio_data: np.ndarray) -> None:
         """
-        Write captured audio to input buffer
+        Write captured audio to input ring buffer
+
+        On overflow the newest samples that do not fit are dropped. Only the
+        consumer advances the read position, so the capture and conversion
+        threads never write the same counter.
 
         Args:
             audio_data: Audio samples to write
         """
         samples_to_write = len(audio_data)
+        free = len(self.input_buffer) - (self._head - self._tail)
+        n = min(samples_to_write, free)
 
-        # Append to buffer
-        if self.input_write_pos + samples_to_write <= len(self.input_buffer):
-            self.input_buffer[self.input_write_pos:self.input_write_pos + samples_to_write] = audio_data
-            self.input_write_pos += samples_to_write
-        else:
-            # Buffer overflow - handle based on overflow size
-            if samples_to_write >= len(self.input_buffer):
-                # Input larger than buffer - take only the last portion that fits
-                self.input_buffer[:] = audio_data[-len(self.input_buffer):]
-                self.input_write_pos = len(self.input_buffer)
-            else:
-                # Shift left and append
-                shift_amount = samples_to_write
-                self.input_buffer[:-shift_amount] = self.input_buffer[shift_amount:]
-                self.input_buffer[-shift_amount:] = audio_data
-                self.input_write_pos = len(self.input_buffer)
+        # Copy in at most two pieces (second piece when wrapping around)
+        if n:
+            self._head = ring_write(self.input_buffer, self._head, audio_data[:n])
+
+        if n < samples_to_write:
+            self._record_overflow(samples_to_write - n)
 
         self.total_samples_received += samples_to_write
 
+        with self._chunk_ready:
+            if self.has_chunk_ready():
+                self._chunk_ready.notify()
+
+    def mark_input_gap(self) -> None:
+        """
+        Record that input resumes after a gap the producer did not buffer
+
+        Called by the capture side before writing the first block after the
+        gap. The consumer drops its context and crossfade tail when it reaches
+        this position, so the first chunk after the gap is converted without
+        audio from before it.
+        """
+        self._gap_at = self._head
+
+    def _record_overflow(self, samples: int) -> None:
+        """Count dropped input and warn at most once per OVERFLOW_LOG_INTERVAL_S"""
+        self.dropped_input_samples += samples
+        self._overflow_since_log += samples
+        now = monotonic()
+        if now - self._last_overflow_log_t >= OVERFLOW_LOG_INTERVAL_S:
+            stream_logger.warning(
+                f"Input buffer overflow: {self._overflow_since_log} samples dropped "
+                f"(conversion is falling behind capture)"
+            )
+            self._last_overflow_log_t = now
+            self._overflow_since_log = 0
+
     def has_chunk_ready(self) -> bool:
         """
         Check if buffer has enough data for processing
@@ -114,6 +215,19 @@ class BufferManager:
         """
         return self.input_write_pos >= self.config.chunk_size
 
+    def wait_for_chunk(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until a chunk is ready for processing
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if a chunk is ready, False on timeout
+        """
+        with self._chunk_ready:
+            return self._chunk_ready.wait_for(self.has_chunk_ready, timeout)
+
     def read_chunk_for_processing(self) -> Tuple[np.ndarray, Optional[np.ndarray]]:
         """
         Read chunk + context for conversion
@@ -123,78 +237,187 @@ class BufferManager:
             - chunk: Audio to convert (size: chunk_size)
             - context: Previous audio for continuity (Phase 2 only, None in Phase 1)
         """
-        # Extract chunk
-        chunk = self.input_buffer[:self.config.chunk_size].copy()
+        chunk_size = self.config.chunk_size
+        capacity = len(self.input_buffer)
+
+        # First chunk reaching audio written after an input gap: forget the
+        # context and crossfade tail left over from before the gap
+        gap_at = self._gap_at
+        if gap_at > self._gap_seen and self._tail + chunk_size > gap_at:
+            self._gap_seen = gap_at
+            self._context_head = 0
+            self._context_filled = 0
+            self.last_chunk_tail = None
+
+        # Extract chunk: one slice when contiguous, two slices joined on wrap-around.
+        # Copied because backends may pass the input through as fallback output,
+        # which outlives the ring slot.
+        start = self._tail % capacity
+        if start + chunk_size <= capacity:
+            chunk = self.input_buffer[start:start + chunk_size].copy()
+        else:
+            chunk = np.concatenate((
+                self.input_buffer[start:],
+                self.input_buffer[:chunk_size - (capacity - start)]
+            ))
 
         # Get context (if available and needed)
         context = None
-        if len(self.context_buffer) > 0:
-            context = np.concatenate(list(self.context_buffer))
+        if self._context_filled > 0:
+            context = self.context_buffer
 
-        # Shift buffer
-        self.input_buffer[:-self.config.chunk_size] = self.input_buffer[self.config.chunk_size:]
-        self.input_write_pos -= self.config.chunk_size
+        # Advance read position (no shifting)
+        self._tail += chunk_size
 
         # Save this chunk as context for next iteration (Phase 2)
         if self.config.context_chunks > 0:
-            self.context_buffer.append(chunk)
+            head = self._context_head
+            self._context_scratch[head:head + chunk_size] = chunk
+            self._context_head = (head + chunk_size) % len(self._context_scratch)
+            self._context_filled = min(self._context_filled + chunk_size, len(self._context_scratch))
 
         return chunk, context
 
-    def write_output(self, converted_audio: np.ndarray) -> None:
+    def write_output(self, converted_audio: np.ndarray, crossfade: bool = True) -> None:
         """
         Write converted audio to output buffer with crossfading
 
         Applies crossfading between chunks to smooth transitions and
         reduce audible "seams" between independently processed chunks.
 
+        The caller transfers ownership of converted_audio; the buffer may be
+        mutated in place.
+
         Args:
             converted_audio: Converted audio chunk
+            crossfade: False when the chunk continues the previous one within
+                       a single conversion call (no seam to smooth)
         """
-        # Apply crossfading to smooth chunk boundaries
-        if self.last_chunk_tail is not None and len(converted_audio) > self.crossfade_samples:
-            # Create crossfade window (linear fade)
-            fade_out = np.linspace(1.0, 0.0, self.crossfade_samples, dtype=np.float32)
-            fade_in = np.linspace(0.0, 1.0, self.crossfade_samples, dtype=np.float32)
+        self.write_output_batch((converted_audio,), crossfade)
 
-            # Apply crossfade to beginning of new chunk
-            crossfade_region = converted_audio[:self.crossfade_samples].copy()
-            crossfade_region = (self.last_chunk_tail * fade_out) + (crossfade_region * fade_in)
+    def write_output_batch(self, chunks: Sequence[np.ndarray], crossfade: bool = True) -> None:
+        """
+        Write consecutive pieces of one conversion call to the output buffer
 
-            # Replace beginning of chunk with crossfaded version
-            converted_audio = converted_audio.copy()  # Avoid modifying original
-            converted_audio[:self.crossfade_samples] = crossfade_region
+        The pieces are continuous audio, so only the head of the first one is
+        crossfaded against the previous call; the tail is saved, the deque
+        extended and the playback thread woken once for the whole batch.
 
-        # Save tail of this chunk for next iteration
-        if len(converted_audio) > self.crossfade_samples:
-            self.last_chunk_tail = converted_audio[-self.crossfade_samples:].copy()
-        else:
-            self.last_chunk_tail = converted_audio.copy()
+        Args:
+            chunks: Converted audio pieces in playback order (ownership passes
+                    to the buffer, as with write_output())
+            crossfade: Crossfade the first piece with the previous call's tail
+        """
+        first, last = chunks[0], chunks[-1]
+
+        # Apply crossfading to smooth the boundary with the previous call
+        if crossfade and self.last_chunk_tail is not None and len(first) > self.crossfade_samples:
+            # Replace beginning of chunk with crossfaded version (in place)
+            crossfade_blend(
+                self.last_chunk_tail, first,
+                self._fade_out, self._fade_in, self.crossfade_samples
+            )
+
+        # Save tail of the last piece for the next call; a silent tail needs
+        # no crossfade, so skip both the copy and the next blend. Sustained
+        # silence never gets here: StreamingPipeline stops feeding it.
+        tail = last[-self.crossfade_samples:]
+        self.last_chunk_tail = None if is_silent(tail) else tail.copy()
+
+        # A full deque drops its oldest chunks on extend - recycle them first
+        maxlen = self.output_buffer.maxlen
+        if len(chunks) > maxlen:
+            # Batch longer than the whole deque: its own first pieces never play
+            self._output_samples_dropped += sum(len(piece) for piece in chunks[:-maxlen])
+            self.total_samples_output += sum(len(piece) for piece in chunks[:-maxlen])
+            chunks = chunks[-maxlen:]
+        for _ in range(len(self.output_buffer) + len(chunks) - maxlen):
+            dropped = self.output_buffer.popleft()
+            self._output_samples_dropped += len(dropped)
+            self._release_output_buffer(dropped)
+
+        self.output_buffer.extend(chunks)
+        self.total_samples_output += sum(len(piece) for piece in chunks)
+
+        with self._output_ready:
+            self._output_ready.notify()
+
+    def wait_for_output(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until converted audio is available for playback
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if output is available, False on timeout
+        """
+        with self._output_ready:
+            return self._output_ready.wait_for(lambda: len(self.output_buffer) > 0, timeout)
+
+    def acquire_output_buffer(self) -> np.ndarray:
+        """
+        Take a chunk-sized float32 buffer from the output pool
+
+        Backends write converted audio into it and hand it back through
+        write_output(). Falls back to a fresh allocation if the pool is drained.
+
+        Returns:
+            Uninitialized array of chunk_size samples
+        """
+        try:
+            return self._free_buffers.get_nowait()
+        except queue.Empty:
+            return np.empty(self.config.chunk_size, dtype=np.float32)
 
-        self.output_buffer.append(converted_audio)
-        self.total_samples_output += len(converted_audio)
+    def _release_output_buffer(self, buf: Optional[np.ndarray]) -> None:
+        """Return a pool-owned buffer to the free queue (other arrays are left to GC)"""
+        if buf is not None and id(buf) in self._pool_ids:
+            self._free_buffers.put(buf)
 
     def read_output(self, size: int) -> Optional[np.ndarray]:
         """
         Read converted audio for playback
 
+        Fills the request across queued chunks, keeping the unread part of
+        the last chunk for the next call, so no converted audio is dropped
+        when the playback block size differs from chunk_size.
+
+        The returned array is a reused read buffer: it is only valid until
+        the next read_output() call, so copy it if it must be kept.
+
         Args:
             size: Number of samples to read
 
         Returns:
             Audio data or None if not enough buffered
         """
-        if len(self.output_buffer) == 0:
+        available = self.total_samples_output - self._output_samples_dropped - self._output_samples_read
+        if available < size:
             return None
 
-        # Get oldest chunk
-        chunk = self.output_buffer.popleft()
-
-        # If requested size differs, handle it
-        if len(chunk) >= size:
-            return chunk[:size]
-        else:
-            return chunk  # Return what we have
+        if len(self._read_buf) != size:
+            self._read_buf = np.empty(size, dtype=np.float32)
+        out = self._read_buf
+
+        filled = 0
+        while filled < size:
+            if self._output_leftover is None:
+                self._output_leftover = self.output_buffer.popleft()
+                self._leftover_pos = 0
+            chunk = self._output_leftover
+            n = min(size - filled, len(chunk) - self._leftover_pos)
+            np.copyto(out[filled:filled + n], chunk[self._leftover_pos:self._leftover_pos + n])
+            filled += n
+            self._leftover_pos += n
+
+            # Chunk fully consumed - recycle it
+            if self._leftover_pos == len(chunk):
+                self._release_output_buffer(chunk)
+                self._output_leftover = None
+
+        self._output_samples_read += size
+        return out
 
     def get_buffer_health(self) -> dict:
         """
@@ -206,15 +429,136 @@ class BufferManager:
         return {
             'input_fill_percent': (self.input_write_pos / len(self.input_buffer)) * 100,
             'output_chunks_ready': len(self.output_buffer),
-            'context_chunks': len(self.context_buffer),
+            'context_chunks': self._context_filled // self.config.chunk_size,
+            'dropped_input_samples': self.dropped_input_samples,
             'total_latency_samples': len(self.output_buffer) * self.config.chunk_size,
             'total_latency_ms': (len(self.output_buffer) * self.config.chunk_size / self.config.sample_rate) * 1000
         }
 
-    def clear(self) -> None:
-        """Reset all buffers"""
+    def clear(self, recycle_pool: bool = True) -> None:
+        """
+        Reset all buffers
+
+        Args:
+            recycle_pool: Return every pool buffer to the free queue, including
+                          any still held by a backend. Pass False while the
+                          conversion thread may be running; only the queued
+                          output chunks are then returned.
+        """
+        if not recycle_pool:
+            for buf in self.output_buffer:
+                self._release_output_buffer(buf)
+            self._release_output_buffer(self._output_leftover)
         self.input_buffer.fill(0)
-        self.input_write_pos = 0
-        self.context_buffer.clear()
+        self._head = 0
+        self._tail = 0
+        self._context_head = 0
+        self._context_filled = 0
         self.output_buffer.clear()
+        self._output_leftover = None
+        self._leftover_pos = 0
+        self._output_samples_dropped = 0
+        self._output_samples_read = self.total_samples_output
+        if recycle_pool:
+            self._free_buffers = queue.SimpleQueue()
+            for buf in self._pool:
+                self._free_buffers.put(buf)
         self.last_chunk_tail = None  # Reset crossfade state
+        self._gap_at = self._gap_seen = -1
+
+
+class SampleRing:
+    """
+    Single-producer/single-consumer float32 ring between an audio callback
+    and the pipeline pump
+
+    The callback side only copies samples in or out (at most two slices
+    each, no allocation) and never waits, so conversion work stays off the
+    PortAudio thread. Each side owns one counter; the other only reads it.
+
+    Usage:
+        capture = SampleRing(4 * 1024)
+
+        # In the audio callback:
+        capture.write(samples)
+
+        # In the pump thread:
+        if capture.wait_readable(1024, timeout=1.0):
+            capture.read_into(block)
+    """
+
+    def __init__(self, capacity: int):
+        self._buf = np.zeros(capacity, dtype=np.float32)
+        self._head = 0  # Total samples written (producer)
+        self._tail = 0  # Total samples read (consumer)
+        self._readable = threading.Event()
+        self.dropped_samples = 0  # Samples rejected because the ring was full
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of buffered samples"""
+        return len(self._buf)
+
+    def __len__(self) -> int:
+        """Number of samples buffered and not yet read"""
+        return self._head - self._tail
+
+    def write(self, data: np.ndarray) -> int:
+        """
+        Append samples, dropping whatever does not fit
+
+        The producer never moves the read position, so a full ring drops the
+        newest samples instead of overwriting unread ones.
+
+        Args:
+            data: Samples to append
+
+        Returns:
+            Number of samples written
+        """
+        n = min(len(data), len(self._buf) - (self._head - self._tail))
+        if n:
+            self._head = ring_write(self._buf, self._head, data[:n])
+            self._readable.set()
+        self.dropped_samples += len(data) - n
+        return n
+
+    def read_into(self, out: np.ndarray) -> int:
+        """
+        Move up to len(out) samples into out
+
+        Args:
+            out: Destination; samples past the returned count are left untouched
+
+        Returns:
+            Number of samples read
+        """
+        n = min(len(out), self._head - self._tail)
+        capacity = len(self._buf)
+        start = self._tail % capacity
+        first = min(n, capacity - start)
+        out[:first] = self._buf[start:start + first]
+        if first < n:
+            out[first:n] = self._buf[:n - first]
+        self._tail += n
+        return n
+
+    def wait_readable(self, size: int, timeout: Optional[float] = None) -> bool:
+        """
+        Block until at least size samples can be read
+
+        Args:
+            size: Samples required
+            timeout: Maximum seconds to wait per wake-up (None waits indefinitely)
+
+        Returns:
+            True if size samples are buffered, False on timeout
+        """
+        while self._head - self._tail < size:
+            self._readable.clear()
+            # Re-check after clearing so a write in between is not missed
+            if self._head - self._tail >= size:
+                break
+            if not self._readable.wait(timeout):
+                return False
+        return True
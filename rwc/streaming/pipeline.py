@@ -4,16 +4,21 @@ Streaming pipeline orchestration for real-time voice conversion
 Coordinates audio capture → buffering → conversion → playback
 """
 
-import time
 import threading
+from collections import deque
+from concurrent.futures import wait
+from time import perf_counter, time
 from typing import Optional, Callable
 import numpy as np
 
+from rwc.streaming._buffer_kernels import rms, warm_up as warm_up_kernels
 from rwc.streaming.backends import ConversionBackend
 from rwc.streaming.buffer import BufferManager, BufferConfig
-from rwc.utils.logging_config import get_logger
+from rwc.utils.constants import SILENCE_THRESHOLD
+from rwc.utils.logging_config import get_logger, get_stream_logger
 
 logger = get_logger(__name__)
+stream_logger = get_stream_logger(__name__)
 
 
 class StreamingPipeline:
@@ -28,6 +33,10 @@ class StreamingPipeline:
     Phase 1: Uses BatchConverter (ultimate-rvc)
     Phase 2: Swaps to StreamingConverter (RVC-Project core)
 
+    Input silence is gated here, in process_input(), and nowhere else:
+    sustained silence is never buffered, so no conversion runs for it and
+    playback fills zeros.
+
     Usage:
         backend = BatchConverter(config)
         buffer_config = BufferConfig(chunk_size=4096)
@@ -62,15 +71,26 @@ class StreamingPipeline:
         self.buffer = BufferManager(buffer_config)
         self.on_metrics_update = on_metrics_update
 
+        # Let the backend convert straight into pooled output buffers
+        self.backend.output_allocator = self.buffer.acquire_output_buffer
+
+        # Queued chunks coalesced per conversion call (ConversionConfig.batch_chunks)
+        self.batch_chunks = max(1, backend.config.batch_chunks)
+
+        # Input silence gate state (capture thread): samples written since the
+        # last block above SILENCE_THRESHOLD, and whether blocks are being dropped
+        self._silent_run = 0
+        self._input_gated = False
+
         # Threading
         self.conversion_thread = None
         self.running = False
-        self.conversion_lock = threading.Lock()
+        self._backend_ready = False  # initialize() done; kept across pause()
 
         # Metrics
         self.total_latency_ms = 0.0
         self.start_time = None
-        self.last_metrics_update = 0.0
+        self.last_metrics_update = float('-inf')  # perf_counter() of last callback
 
     def start(self) -> None:
         """
@@ -81,18 +101,28 @@ class StreamingPipeline:
         """
         logger.info("Starting streaming pipeline")
 
-        # Initialize backend (load models)
-        self.backend.initialize()
+        # Initialize backend (load models), unless it was kept by pause()
+        if not self._backend_ready:
+            self.backend.initialize()
+            self._backend_ready = True
+
+        # JIT-compile buffer kernels here rather than on the first captured chunk
+        warm_up_kernels()
 
         # Start conversion thread
         self.running = True
+        loop = (
+            self._pipelined_conversion_loop
+            if self.backend.max_in_flight > 1
+            else self._conversion_loop
+        )
         self.conversion_thread = threading.Thread(
-            target=self._conversion_loop,
+            target=loop,
             daemon=True,
             name="RWC-Conversion"
         )
         self.conversion_thread.start()
-        self.start_time = time.time()
+        self.start_time = time()
 
         logger.info("Streaming pipeline started")
 
@@ -100,35 +130,76 @@ class StreamingPipeline:
         """Stop conversion thread and cleanup"""
         logger.info("Stopping streaming pipeline")
 
+        # Joining the only conversion thread leaves the backend idle before cleanup()
+        self._join_conversion_thread()
+
+        self.backend.cleanup()
+        self._backend_ready = False
+
+        logger.info("Streaming pipeline stopped")
+
+    def pause(self) -> None:
+        """
+        Stop the conversion thread but keep the backend initialized
+
+        Buffered audio is dropped, so a later start() resumes with empty
+        buffers and without reloading models. Use stop() to release the
+        backend.
+        """
+        logger.info("Pausing streaming pipeline")
+        self._join_conversion_thread()
+        # A thread that outlived the join may still hold pool buffers
+        stuck = self.conversion_thread is not None and self.conversion_thread.is_alive()
+        self.buffer.clear(recycle_pool=not stuck)
+        self._silent_run = 0
+        self._input_gated = False
+        logger.info("Streaming pipeline paused")
+
+    def _join_conversion_thread(self) -> None:
+        """Signal the conversion thread to exit and wait for it"""
         self.running = False
         if self.conversion_thread:
             self.conversion_thread.join(timeout=2.0)
             if self.conversion_thread.is_alive():
                 logger.warning("Conversion thread did not stop gracefully")
 
-        self.backend.cleanup()
-
-        logger.info("Streaming pipeline stopped")
-
     def process_input(self, audio_data: np.ndarray) -> None:
         """
         Called by audio capture thread to write captured audio to input buffer
 
+        Once a full chunk of silence has been written (enough to flush the
+        phrase tail through conversion), further silent blocks are dropped.
+        The first block after such a gap marks it in the buffer so conversion
+        resumes without context from before the gap.
+
         Args:
             audio_data: Captured audio samples
         """
+        if rms(audio_data) < SILENCE_THRESHOLD:
+            if self._silent_run >= self.buffer.config.chunk_size:
+                self._input_gated = True
+                return
+            self._silent_run += len(audio_data)
+        else:
+            if self._input_gated:
+                self.buffer.mark_input_gap()
+                self._input_gated = False
+            self._silent_run = 0
         self.buffer.write_input(audio_data)
 
-    def get_output(self, size: int) -> Optional[np.ndarray]:
+    def get_output(self, size: int, timeout: Optional[float] = None) -> Optional[np.ndarray]:
         """
         Called by audio playback thread to get converted audio for playback
 
         Args:
             size: Number of samples to read
+            timeout: Optional seconds to wait for converted audio (None: don't wait)
 
         Returns:
             Converted audio or None if not ready
         """
+        if timeout is not None:
+            self.buffer.wait_for_output(timeout)
         return self.buffer.read_output(size)
 
     def _conversion_loop(self) -> None:
@@ -140,51 +211,137 @@ class StreamingPipeline:
         logger.debug("Conversion loop started")
 
         while self.running:
-            # Check if buffer has enough data
-            if not self.buffer.has_chunk_ready():
-                time.sleep(0.001)  # 1ms sleep to avoid busy-wait
+            # Block until the capture thread signals a full chunk
+            # (timeout lets the loop notice stop())
+            if not self.buffer.wait_for_chunk(timeout=0.05):
                 continue
 
-            # Read chunk + context
-            chunk, context = self.buffer.read_chunk_for_processing()
+            # Read chunk (or several queued chunks) + context
+            chunk, context, num_chunks = self._read_batch()
 
             # Convert chunk
-            start_time = time.perf_counter()
+            start_time = perf_counter()
             try:
-                with self.conversion_lock:
-                    converted_chunk = self.backend.convert_chunk(chunk, context)
+                converted_chunk = self.backend.convert_chunk(chunk, context)
             except Exception as e:
-                logger.error(f"Chunk conversion failed: {e}")
+                stream_logger.error(f"Chunk conversion failed: {e}")
                 # On error, use original chunk as fallback
                 converted_chunk = chunk
 
-            end_time = time.perf_counter()
+            end_time = perf_counter()
 
-            # Write to output buffer
-            self.buffer.write_output(converted_chunk)
+            self._finish_chunk(converted_chunk, (end_time - start_time) * 1000, num_chunks)
 
-            # Update metrics
-            processing_time_ms = (end_time - start_time) * 1000
-            self.total_latency_ms = self.backend.get_latency_estimate_ms()
+        logger.debug("Conversion loop stopped")
+
+    def _pipelined_conversion_loop(self) -> None:
+        """
+        Conversion thread main loop for backends with max_in_flight > 1
 
-            # Call metrics callback (if provided and interval elapsed)
-            now = time.time()
-            if self.on_metrics_update and (now - self.last_metrics_update) >= 0.5:
-                metrics = {
-                    'processing_time_ms': processing_time_ms,
-                    'total_latency_ms': self.total_latency_ms,
-                    'chunks_processed': self.backend.metrics.total_chunks_processed,
-                    'dropped_chunks': self.backend.metrics.dropped_chunks,
-                    'buffer_health': self.buffer.get_buffer_health()
-                }
+        Submits chunks as soon as they are captured so the backend can stage
+        the next chunk while the current one converts, and retires results
+        in submission order.
+        """
+        logger.debug("Pipelined conversion loop started")
+        pending = deque()  # (future, input chunk, chunks in batch) in submission order
+
+        while self.running:
+            # Retire finished chunks in order
+            while pending and pending[0][0].done():
+                future, chunk, num_chunks = pending.popleft()
                 try:
-                    self.on_metrics_update(metrics)
+                    converted_chunk = future.result()
                 except Exception as e:
-                    logger.warning(f"Metrics callback failed: {e}")
+                    stream_logger.error(f"Chunk conversion failed: {e}")
+                    converted_chunk = chunk
+                self._finish_chunk(converted_chunk, self.backend.metrics.processing_time_ms, num_chunks)
 
-                self.last_metrics_update = now
+            if len(pending) >= self.backend.max_in_flight:
+                wait((pending[0][0],), timeout=0.05)
+                continue
 
-        logger.debug("Conversion loop stopped")
+            # Short timeout while chunks are in flight so results retire promptly
+            if not self.buffer.wait_for_chunk(timeout=0.005 if pending else 0.05):
+                continue
+
+            chunk, context, num_chunks = self._read_batch()
+            try:
+                pending.append((self.backend.submit_chunk(chunk, context), chunk, num_chunks))
+            except Exception as e:
+                stream_logger.error(f"Chunk submission failed: {e}")
+                self._finish_chunk(chunk, 0.0, num_chunks)
+
+        # Let in-flight chunks finish so none still writes into a pooled
+        # buffer after pause() recycles the pool
+        wait([future for future, _, _ in pending])
+        logger.debug("Pipelined conversion loop stopped")
+
+    def _read_batch(self):
+        """
+        Read the next chunk, coalescing queued chunks up to batch_chunks
+
+        Only chunks that are already buffered are taken, so batching never
+        waits for more input; it amortizes per-call conversion overhead when
+        the conversion thread falls behind.
+
+        Returns:
+            (audio, context, num_chunks) where audio is num_chunks chunks long
+        """
+        chunk, context = self.buffer.read_chunk_for_processing()
+
+        chunks = [chunk]
+        while len(chunks) < self.batch_chunks and self.buffer.has_chunk_ready():
+            chunks.append(self.buffer.read_chunk_for_processing()[0])
+
+        if len(chunks) == 1:
+            return chunk, context, 1
+        return np.concatenate(chunks), context, len(chunks)
+
+    def _finish_chunk(
+        self,
+        converted_chunk: np.ndarray,
+        processing_time_ms: float,
+        num_chunks: int = 1
+    ) -> None:
+        """
+        Hand a converted chunk (or batch) to playback and report metrics
+
+        Args:
+            converted_chunk: Converted audio (ownership passes to the buffer)
+            processing_time_ms: Conversion time for this chunk
+            num_chunks: Chunks coalesced in converted_chunk; split back into
+                        chunk-sized pieces, crossfaded only at the batch boundary
+        """
+        # Write to output buffer
+        if num_chunks == 1:
+            self.buffer.write_output(converted_chunk)
+        else:
+            self.buffer.write_output_batch(np.array_split(converted_chunk, num_chunks))
+
+        # Update metrics (backend refreshes chunk_latency_ms on every chunk)
+        self.total_latency_ms = self.backend.metrics.chunk_latency_ms
+
+        # Call metrics callback (if provided and interval elapsed);
+        # the clock is only read when someone is listening
+        if self.on_metrics_update is None:
+            return
+        now = perf_counter()
+        if now - self.last_metrics_update >= 0.5:
+            # Full estimate (with fallback before the first measurement) at most twice a second
+            self.total_latency_ms = self.backend.get_latency_estimate_ms()
+            metrics = {
+                'processing_time_ms': processing_time_ms,
+                'total_latency_ms': self.total_latency_ms,
+                'chunks_processed': self.backend.metrics.total_chunks_processed,
+                'dropped_chunks': self.backend.metrics.dropped_chunks,
+                'buffer_health': self.buffer.get_buffer_health()
+            }
+            try:
+                self.on_metrics_update(metrics)
+            except Exception as e:
+                stream_logger.warning(f"Metrics callback failed: {e}")
+
+            self.last_metrics_update = now
 
     def get_metrics(self) -> dict:
         """
@@ -193,7 +350,7 @@ class StreamingPipeline:
         Returns:
             Dictionary with comprehensive metrics
         """
-        uptime_s = time.time() - self.start_time if self.start_time else 0
+        uptime_s = time() - self.start_time if self.start_time else 0
 
         return {
             'uptime_seconds': uptime_s,
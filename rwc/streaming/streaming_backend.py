@@ -18,7 +18,9 @@ Date: 2025-11-12
 from __future__ import annotations
 
 import logging
+import math
 import time
+from contextlib import AbstractContextManager, nullcontext
 from pathlib import Path
 from typing import Optional
 
@@ -26,8 +28,11 @@ import numpy as np
 import soundfile as sf
 import torch
 
+from rwc.streaming._buffer_kernels import NUMBA_AVAILABLE, normalize_crossfade, peak_normalize
 from rwc.streaming.backends import ConversionBackend, ConversionConfig
-from rwc.utils.logging_config import get_logger
+from rwc.streaming.buffer import is_silent
+from rwc.utils.constants import REALTIME_PITCH_BUDGET_MS
+from rwc.utils.logging_config import get_logger, get_stream_logger
 
 # Import ultimate-rvc components for direct access
 from ultimate_rvc.rvc.infer.infer import VoiceConverter
@@ -35,6 +40,26 @@ from ultimate_rvc.typing_extra import F0Method
 from scipy import signal
 
 logger = get_logger(__name__)
+stream_logger = get_stream_logger(__name__)
+
+# Post-processing low-pass cutoff (Hz) - above typical voice range
+SMOOTHING_CUTOFF_HZ = 8000
+
+
+def _hann_fades(fade_len: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Split a Hann window into crossfade curves.
+
+    Hann provides smoother transitions than linear (raised cosine).
+
+    Args:
+        fade_len: Crossfade length in samples
+
+    Returns:
+        (fade_out, fade_in): falling (1.0 → 0.0) and rising (0.0 → 1.0) halves
+    """
+    hann_window = np.hanning(fade_len * 2).astype(np.float32)
+    return hann_window[fade_len:], hann_window[:fade_len]
 
 
 class StreamingConverter(ConversionBackend):
@@ -65,6 +90,10 @@ class StreamingConverter(ConversionBackend):
         """
         super().__init__(config)
         self.voice_converter: Optional[VoiceConverter] = None
+        self._index_path = ""  # FAISS index found next to the model ("" if none)
+        self._use_fp16 = False  # Set in initialize() on FP16-capable GPUs
+        self._debug = False  # Per-chunk debug logging enabled (bound in initialize())
+        self._f0_method = self._select_f0_method()
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
 
         # Overlap-add parameters - optimized for smoothness
@@ -72,19 +101,38 @@ class StreamingConverter(ConversionBackend):
         self.fade_samples = int(self.config.chunk_size * 0.25)  # 25% crossfade (Hann window)
 
         # Context buffer for continuity
-        self.context_buffer: Optional[np.ndarray] = None
+        self.context_buffer: Optional[np.ndarray] = None  # Last context_size input samples
         self.context_size = self.overlap_samples
+        self._context_store = np.empty(self.context_size, dtype=np.float32)  # Backs context_buffer
+        self._context_silent = True  # No (or silent) context: a silent chunk needs no inference
+
+        # Pipeline input staging (context + normalized chunk), reused every chunk
+        self._stage = np.empty(self.context_size + self.config.chunk_size, dtype=np.float32)
 
         logger.info("Initializing StreamingConverter (Phase 2)")
         logger.info(f"Device: {self.device}")
         logger.info(f"Chunk size: {self.config.chunk_size} samples")
         logger.info(f"Overlap: {self.overlap_samples} samples ({self.overlap_samples/self.config.chunk_size*100:.1f}%)")
         logger.info(f"Crossfade: {self.fade_samples} samples")
+        logger.info(f"Pitch method: {self._f0_method.value}")
 
         # Initialize crossfade state
-        self._previous_output: Optional[np.ndarray] = None
+        self._fade_out, self._fade_in = _hann_fades(self.fade_samples)
+        self._fade_scratch = np.empty(self.fade_samples, dtype=np.float32)  # Faded previous tail
+        self._tail_buf = np.empty(self.fade_samples, dtype=np.float32)      # Backs _previous_tail
+        self._previous_tail: Optional[np.ndarray] = None  # Last fade_samples of the previous output
         self._previous_rms: Optional[float] = None  # Track RMS for volume consistency
 
+        # Smoothing filter designed once (sample rate and cutoff are fixed):
+        # low order (2) to minimize phase distortion. Filter state carries
+        # across chunks so boundaries see no edge transients.
+        nyquist = self.config.sample_rate / 2
+        # float32 coefficients keep sosfilt in float32 (no float64 result to cast back)
+        self._smooth_sos = signal.butter(
+            2, SMOOTHING_CUTOFF_HZ / nyquist, btype='low', output='sos'
+        ).astype(np.float32)
+        self._smooth_zi: Optional[np.ndarray] = None  # Set from the first smoothed chunk
+
     def initialize(self) -> None:
         """
         Load RVC models and prepare for streaming inference.
@@ -98,13 +146,28 @@ class StreamingConverter(ConversionBackend):
         logger.info("Loading RVC models for streaming inference...")
         start_time = time.perf_counter()
 
+        # Checked once: the stream logger level is fixed for the session
+        self._debug = stream_logger.isEnabledFor(logging.DEBUG)
+
         try:
+            # Process-wide inference tunings: TF32 matmul/convolutions on Ampere+
+            torch.set_float32_matmul_precision('high')
+            if torch.cuda.is_available():
+                torch.backends.cuda.matmul.allow_tf32 = True
+                torch.backends.cudnn.allow_tf32 = True
+                # Chunk shapes repeat, so let cuDNN pick the fastest conv algorithms once
+                torch.backends.cudnn.benchmark = True
+                # FP16 tensor cores (Volta+): run inference under autocast
+                self._use_fp16 = torch.cuda.get_device_capability() >= (7, 0)
+            logger.info(f"Mixed precision (FP16 autocast): {'enabled' if self._use_fp16 else 'disabled'}")
+
             # Initialize VoiceConverter
             self.voice_converter = VoiceConverter()
 
             # Extract model name from path for ultimate-rvc
             model_path = Path(self.config.model_path)
             index_path = self._find_index_file(model_path.parent)
+            self._index_path = index_path or ""  # Resolved once, passed on every chunk
 
             # Load model using get_vc (sets up net_g, hubert, etc.)
             # get_vc signature: get_vc(weight_root, sid)
@@ -125,6 +188,9 @@ class StreamingConverter(ConversionBackend):
             if self.voice_converter.vc is None:
                 raise RuntimeError("RVC pipeline failed to initialize")
 
+            if self.config.compile_model:
+                self._compile_generator()
+
             load_time = (time.perf_counter() - start_time) * 1000
             logger.info(f"StreamingConverter initialized successfully in {load_time:.1f}ms")
             logger.info(f"Model: {model_path.name}")
@@ -135,6 +201,34 @@ class StreamingConverter(ConversionBackend):
             logger.error(f"Failed to initialize StreamingConverter: {e}")
             raise RuntimeError(f"StreamingConverter initialization failed: {e}")
 
+    def _select_f0_method(self) -> F0Method:
+        """
+        Resolve the configured pitch method to an ultimate-rvc F0Method.
+
+        'auto' picks FCPE when a chunk is shorter than the real-time pitch
+        budget (RMVPE dominates per-chunk cost there), otherwise RMVPE (or
+        CREPE when RMVPE is disabled). Methods missing from the installed
+        ultimate-rvc fall back to RMVPE.
+
+        Returns:
+            F0 method passed to the pipeline on every chunk
+        """
+        from rwc.utils.validation import validate_pitch_method
+
+        method = validate_pitch_method(self.config.pitch_method)
+        if method == 'auto':
+            chunk_ms = self.config.chunk_size / self.config.sample_rate * 1000
+            if chunk_ms < REALTIME_PITCH_BUDGET_MS:
+                method = 'fcpe'
+            else:
+                method = 'rmvpe' if self.config.use_rmvpe else 'crepe'
+
+        f0_method = getattr(F0Method, method.upper(), None)
+        if f0_method is None:
+            logger.warning(f"Pitch method '{method}' not supported by installed ultimate-rvc, using RMVPE")
+            return F0Method.RMVPE
+        return f0_method
+
     def _find_index_file(self, model_dir: Path) -> Optional[str]:
         """
         Find FAISS index file in model directory.
@@ -188,33 +282,164 @@ class StreamingConverter(ConversionBackend):
         chunk_id = self.metrics.total_chunks_processed
 
         try:
-            # Normalize input audio
-            audio_max = np.abs(audio_chunk).max()
-            if audio_max > 0:
-                normalized_chunk = audio_chunk / max(audio_max / 0.95, 1.0)
-            else:
-                normalized_chunk = audio_chunk
-
-            # Add overlap context for continuity
+            if self._context_silent and is_silent(audio_chunk):
+                # Context and chunk are both silent: the model input is known,
+                # so skip HuBERT/F0/generator and let post-processing fade
+                # the previous output out. Zero a (pooled) output buffer
+                # rather than allocating one per skipped chunk
+                silence = self._output_buffer_for(audio_chunk)
+                silence.fill(0.0)
+                return self._finish_chunk(silence, audio_chunk, chunk_id, start_time, 0.0)
+
+            # Add overlap context for continuity: prepend it in the staging
+            # buffer and normalize the chunk straight in behind it
+            context_len = 0
             if self.context_buffer is not None and len(self.context_buffer) > 0:
-                # Prepend context for smoother transitions
-                processing_chunk = np.concatenate([
-                    self.context_buffer[-self.context_size:],
-                    normalized_chunk
-                ])
-            else:
-                processing_chunk = normalized_chunk
+                context = self.context_buffer[-self.context_size:]
+                context_len = len(context)
+            processing_chunk = self._staging_buffer(context_len + len(audio_chunk))
+            if context_len:
+                processing_chunk[:context_len] = context
+
+            # Normalize input audio (peak at most 0.95) straight into the stage
+            peak_normalize(audio_chunk, processing_chunk[context_len:], 0.95)
 
             # Direct RVC pipeline inference (no file I/O!)
+            # Input stays a host numpy array: the pipeline high-pass filters
+            # and pads it with scipy/numpy before moving windows to the device,
+            # so a CUDA-resident input tensor would be copied straight back.
             inference_start = time.perf_counter()
-            converted_audio = self.voice_converter.vc.pipeline(
+            converted_audio = self._run_pipeline(processing_chunk)
+            inference_time = (time.perf_counter() - inference_start) * 1000
+
+            # The pipeline returns host audio, so post-processing stays in numpy:
+            # moving it to the device would add a transfer each way per chunk.
+            # Take the result as float32 once (no copy if it already is) so the
+            # in-place steps below never upcast.
+            converted_audio = np.asarray(converted_audio, dtype=np.float32)
+
+            # Extract the main chunk (remove context overlap)
+            output_chunk = converted_audio[context_len:] if context_len else converted_audio
+
+            # Trim or pad to match input length
+            if len(output_chunk) > len(audio_chunk):
+                output_chunk = output_chunk[:len(audio_chunk)]
+            elif len(output_chunk) < len(audio_chunk):
+                # Zero-fill the remainder of a (pooled) chunk-sized buffer
+                padded = self._output_buffer_for(audio_chunk)
+                padded[:len(output_chunk)] = output_chunk
+                padded[len(output_chunk):] = 0.0
+                output_chunk = padded
+
+            self._context_silent = is_silent(audio_chunk[-self.context_size:])
+            return self._finish_chunk(output_chunk, audio_chunk, chunk_id, start_time, inference_time)
+
+        except Exception as e:
+            stream_logger.error(f"Chunk {chunk_id} conversion failed: {e}")
+            self.metrics.dropped_chunks += 1
+            # Return original audio as fallback
+            return audio_chunk
+
+    def _finish_chunk(
+        self,
+        output_chunk: np.ndarray,
+        audio_chunk: np.ndarray,
+        chunk_id: int,
+        start_time: float,
+        inference_time: float
+    ) -> np.ndarray:
+        """
+        Post-process a converted chunk and update streaming state and metrics.
+
+        Args:
+            output_chunk: Converted audio trimmed/padded to the input length
+            audio_chunk: Input chunk (source of the next context)
+            chunk_id: Chunk number for logging
+            start_time: perf_counter() at the start of convert_chunk()
+            inference_time: Pipeline time in milliseconds (0 when skipped)
+
+        Returns:
+            Finished output chunk
+        """
+        # Normalize RMS for consistent volume between chunks and
+        # crossfade with previous chunk for seamless transitions
+        output_chunk = self._normalize_and_crossfade(output_chunk)
+
+        # Optional smoothing filter to reduce high-frequency artifacts (off by
+        # default: the Hann crossfade already hides chunk seams)
+        if self.config.smoothing_enabled:
+            output_chunk = self._apply_smoothing(output_chunk)
+
+        # Store the tail for the next crossfade (the chunk itself goes to the caller)
+        tail_len = min(self.fade_samples, len(output_chunk))
+        np.copyto(self._tail_buf[:tail_len], output_chunk[len(output_chunk) - tail_len:])
+        self._previous_tail = self._tail_buf[:tail_len]
+
+        # Update context buffer for next chunk
+        # (only the samples prepended next time, into a reused buffer)
+        keep = min(self.context_size, len(audio_chunk))
+        np.copyto(self._context_store[:keep], audio_chunk[len(audio_chunk) - keep:])
+        self.context_buffer = self._context_store[:keep]
+
+        # Update metrics
+        processing_time = (time.perf_counter() - start_time) * 1000
+        self.metrics.processing_time_ms = processing_time
+        self.metrics.chunk_latency_ms = processing_time
+        self.metrics.total_chunks_processed += 1
+
+        if self._debug:
+            stream_logger.debug(
+                f"Chunk {chunk_id} processed in {processing_time:.1f}ms "
+                f"(inference: {inference_time:.1f}ms)"
+            )
+
+        return output_chunk
+
+    def _compile_generator(self) -> None:
+        """
+        Compile the generator's inference path with torch.compile and warm it up.
+
+        The pipeline calls net_g.infer() rather than forward(), so that method
+        is compiled in place. A silent chunk-plus-context run triggers
+        compilation (and cuDNN autotuning) here instead of on the first live
+        chunk. Falls back to eager execution if compilation is unavailable.
+        """
+        if not hasattr(torch, 'compile'):
+            logger.warning("torch.compile requires PyTorch 2.0+; running generator eagerly")
+            return
+
+        net_g = self.voice_converter.net_g
+        eager_infer = net_g.infer
+        try:
+            net_g.infer = torch.compile(eager_infer)
+            compile_start = time.perf_counter()
+            self._run_pipeline(np.zeros(self.context_size + self.config.chunk_size, dtype=np.float32))
+            logger.info(f"Generator compiled in {(time.perf_counter() - compile_start) * 1000:.0f}ms")
+        except Exception as e:
+            net_g.infer = eager_infer
+            logger.warning(f"torch.compile failed, running generator eagerly: {e}")
+
+    def _run_pipeline(self, audio: np.ndarray) -> np.ndarray:
+        """
+        Run the ultimate-rvc pipeline (HuBERT → F0 → generator) on staged audio.
+
+        Args:
+            audio: Context plus normalized chunk (host float32)
+
+        Returns:
+            Converted audio at the model's target sample rate
+        """
+        # inference_mode skips autograd version counters and view tracking;
+        # autocast runs HuBERT/generator matmuls and convolutions in FP16
+        with torch.inference_mode(), self._autocast():
+            return self.voice_converter.vc.pipeline(
                 model=self.voice_converter.hubert_model,
                 net_g=self.voice_converter.net_g,
                 sid=0,  # Speaker ID
-                audio=processing_chunk,
+                audio=audio,
                 pitch=self.config.pitch_shift,
-                f0_methods={F0Method.RMVPE},  # Use RMVPE for pitch
-                file_index=self._find_index_file(Path(self.config.model_path).parent) or "",
+                f0_methods={self._f0_method},
+                file_index=self._index_path,
                 index_rate=self.config.index_rate,
                 pitch_guidance=self.voice_converter.use_f0,
                 volume_envelope=1.0,  # Full RMS mixing
@@ -225,59 +450,69 @@ class StreamingConverter(ConversionBackend):
                 f0_autotune_strength=1.0,
                 f0_file=None,
             )
-            inference_time = (time.perf_counter() - inference_start) * 1000
-
-            # Extract the main chunk (remove context overlap)
-            if self.context_buffer is not None and len(self.context_buffer) > 0:
-                output_chunk = converted_audio[self.context_size:]
-            else:
-                output_chunk = converted_audio
 
-            # Trim or pad to match input length
-            if len(output_chunk) > len(audio_chunk):
-                output_chunk = output_chunk[:len(audio_chunk)]
-            elif len(output_chunk) < len(audio_chunk):
-                pad_length = len(audio_chunk) - len(output_chunk)
-                output_chunk = np.pad(output_chunk, (0, pad_length), mode='constant')
+    def _autocast(self) -> AbstractContextManager:
+        """Mixed-precision context for pipeline inference (no-op on CPU or older GPUs)."""
+        if self._use_fp16:
+            return torch.autocast(device_type='cuda', dtype=torch.float16)
+        return nullcontext()
 
-            # Normalize RMS for consistent volume between chunks
-            output_chunk = self._normalize_rms(output_chunk)
+    def _staging_buffer(self, length: int) -> np.ndarray:
+        """
+        Return the pipeline input staging buffer sized to length samples.
 
-            # Apply crossfade with previous chunk for seamless transitions
-            if hasattr(self, '_previous_output') and self._previous_output is not None:
-                output_chunk = self._apply_crossfade(self._previous_output, output_chunk)
+        Grows (once) for coalesced batches longer than one chunk. The view is
+        C-contiguous float32 and is passed to the pipeline as is: the
+        pipeline only accepts numpy input, so there is no tensor to wrap on
+        this side.
 
-            # Apply smoothing filter to reduce high-frequency artifacts
-            output_chunk = self._apply_smoothing(output_chunk)
+        Args:
+            length: Context plus chunk samples
 
-            # Store for next crossfade
-            self._previous_output = output_chunk.copy()
+        Returns:
+            View of the reused staging buffer
+        """
+        if len(self._stage) < length:
+            self._stage = np.empty(length, dtype=np.float32)
+        return self._stage[:length]
 
-            # Update context buffer for next chunk
-            self.context_buffer = audio_chunk.copy()
+    def _normalize_and_crossfade(self, output_chunk: np.ndarray) -> np.ndarray:
+        """
+        Apply _normalize_rms() then _apply_crossfade() to an output chunk.
 
-            # Update metrics
-            processing_time = (time.perf_counter() - start_time) * 1000
-            self.metrics.processing_time_ms = processing_time
-            self.metrics.chunk_latency_ms = processing_time
-            self.metrics.total_chunks_processed += 1
+        With Numba both steps run as one fused in-place kernel (two passes
+        over the chunk instead of five); otherwise the numpy methods are used.
 
-            logger.debug(
-                f"Chunk {chunk_id} processed in {processing_time:.1f}ms "
-                f"(inference: {inference_time:.1f}ms)"
-            )
+        Args:
+            output_chunk: Converted chunk, owned by the caller
 
+        Returns:
+            Normalized chunk with crossfaded beginning
+        """
+        if not NUMBA_AVAILABLE:
+            output_chunk = self._normalize_rms(output_chunk)
+            if self._previous_tail is not None:
+                output_chunk = self._apply_crossfade(self._previous_tail, output_chunk)
             return output_chunk
 
-        except Exception as e:
-            logger.error(f"Chunk {chunk_id} conversion failed: {e}")
-            self.metrics.dropped_chunks += 1
-            # Return original audio as fallback
-            return audio_chunk
+        prev_tail = self._previous_tail if self._previous_tail is not None else self._tail_buf[:0]
+        fade_len = min(len(prev_tail), len(output_chunk))
+        if fade_len == self.fade_samples:
+            fade_out, fade_in = self._fade_out, self._fade_in
+        else:
+            fade_out, fade_in = _hann_fades(fade_len)
+
+        new_rms = normalize_crossfade(
+            output_chunk,
+            -1.0 if self._previous_rms is None else self._previous_rms,
+            prev_tail, fade_out, fade_in
+        )
+        self._previous_rms = None if new_rms < 0 else new_rms
+        return output_chunk
 
     def _apply_crossfade(
         self,
-        previous_chunk: np.ndarray,
+        prev_tail: np.ndarray,
         current_chunk: np.ndarray
     ) -> np.ndarray:
         """
@@ -287,37 +522,38 @@ class StreamingConverter(ConversionBackend):
         compared to linear crossfading. The raised cosine shape provides
         better frequency response and reduces spectral leakage.
 
+        The head of current_chunk is blended in place (no copy of the chunk).
+
         Args:
-            previous_chunk: Previous output chunk
-            current_chunk: Current output chunk
+            prev_tail: Last samples of the previous output chunk
+            current_chunk: Current output chunk, owned by the caller
 
         Returns:
-            Current chunk with crossfaded beginning
+            current_chunk with crossfaded beginning
         """
         # Only crossfade the overlap region
-        fade_len = min(self.fade_samples, len(previous_chunk), len(current_chunk))
+        fade_len = min(self.fade_samples, len(prev_tail), len(current_chunk))
 
         if fade_len == 0:
             return current_chunk
 
-        # Create Hann window fade curves (raised cosine)
-        # Hann provides smoother transitions than linear
-        hann_window = np.hanning(fade_len * 2)
-        fade_out = hann_window[:fade_len]  # First half (1.0 → 0.0)
-        fade_in = hann_window[fade_len:]    # Second half (0.0 → 1.0)
+        # Hann fade curves cached for the configured length; only a short
+        # chunk needs a fresh pair
+        if fade_len == self.fade_samples:
+            fade_out, fade_in = self._fade_out, self._fade_in
+        else:
+            fade_out, fade_in = _hann_fades(fade_len)
 
-        # Get tail of previous and head of current
-        prev_tail = previous_chunk[-fade_len:]
+        # Align the end of the previous tail with the head of current
+        prev_tail = prev_tail[len(prev_tail) - fade_len:]
         curr_head = current_chunk[:fade_len]
 
-        # Apply Hann-windowed crossfade
-        crossfaded_region = (prev_tail * fade_out) + (curr_head * fade_in)
-
-        # Replace head of current chunk with crossfaded region
-        result = current_chunk.copy()
-        result[:fade_len] = crossfaded_region
+        # Apply Hann-windowed crossfade in place: head = tail*fade_out + head*fade_in
+        faded_tail = np.multiply(prev_tail, fade_out, out=self._fade_scratch[:fade_len])
+        np.multiply(curr_head, fade_in, out=curr_head)
+        curr_head += faded_tail
 
-        return result
+        return current_chunk
 
     def _normalize_rms(self, audio_chunk: np.ndarray) -> np.ndarray:
         """
@@ -332,54 +568,60 @@ class StreamingConverter(ConversionBackend):
         Returns:
             RMS-normalized audio chunk
         """
-        # Calculate current RMS
-        current_rms = np.sqrt(np.mean(audio_chunk**2))
+        # Calculate current RMS (dot product: no squared temporary)
+        if len(audio_chunk) == 0:
+            return audio_chunk
+        current_rms = math.sqrt(float(np.dot(audio_chunk, audio_chunk)) / len(audio_chunk))
 
         if current_rms < 1e-6:  # Silence
             return audio_chunk
 
         # If we have previous RMS, blend towards it gradually
+        scale = 1.0
         if self._previous_rms is not None and self._previous_rms > 1e-6:
             # Use 50% blend to avoid abrupt changes
             target_rms = 0.5 * self._previous_rms + 0.5 * current_rms
-            scale = target_rms / current_rms
             # Limit scaling to avoid extreme adjustments
-            scale = np.clip(scale, 0.5, 2.0)
-            normalized = audio_chunk * scale
-        else:
-            normalized = audio_chunk
+            scale = min(max(target_rms / current_rms, 0.5), 2.0)
+            audio_chunk = audio_chunk * scale
 
-        # Update previous RMS
-        self._previous_rms = np.sqrt(np.mean(normalized**2))
+        # Update previous RMS (scaling by a constant scales the RMS: no second pass)
+        self._previous_rms = current_rms * scale
 
-        return normalized
+        return audio_chunk
 
     def _apply_smoothing(self, audio_chunk: np.ndarray) -> np.ndarray:
         """
         Apply gentle smoothing filter to reduce high-frequency artifacts.
 
         Uses a low-order Butterworth filter to remove harsh artifacts
-        from chunk processing while preserving voice quality.
+        from chunk processing while preserving voice quality. The filter
+        is causal and stateful, so consecutive chunks filter as one stream.
+
+        The result is written back into audio_chunk, so a pooled output
+        buffer stays the buffer handed to the caller.
 
         Args:
-            audio_chunk: Audio to smooth
+            audio_chunk: Audio to smooth, owned by the caller
 
         Returns:
-            Smoothed audio chunk
+            audio_chunk, smoothed in place
         """
-        # Design gentle low-pass filter (cutoff at 8kHz for voice)
-        # This removes harsh artifacts while preserving voice clarity
-        nyquist = self.config.sample_rate / 2
-        cutoff = 8000  # Hz - above typical voice range
-        normalized_cutoff = cutoff / nyquist
-
-        # Use low-order filter (order=2) to minimize phase distortion
-        b, a = signal.butter(2, normalized_cutoff, btype='low')
-
-        # Apply filter with zero-phase (filtfilt) to avoid delay
-        smoothed = signal.filtfilt(b, a, audio_chunk)
-
-        return smoothed.astype(np.float32)
+        # Gentle low-pass (cutoff at 8kHz for voice), coefficients cached in __init__.
+        # Removes harsh artifacts while preserving voice clarity.
+        if self._smooth_zi is None:
+            # Start in steady state for the first sample (no onset transient)
+            self._smooth_zi = (signal.sosfilt_zi(self._smooth_sos) * audio_chunk[0]).astype(np.float32)
+
+        # Single causal pass; state continues into the next chunk
+        smoothed, self._smooth_zi = signal.sosfilt(self._smooth_sos, audio_chunk, zi=self._smooth_zi)
+        # Flush fully decayed state: in float32 it would otherwise settle into a
+        # denormal limit cycle through silence (slow arithmetic, never exactly 0)
+        if np.abs(self._smooth_zi).max() < 1e-30:
+            self._smooth_zi.fill(0.0)
+
+        np.copyto(audio_chunk, smoothed)
+        return audio_chunk
 
     def cleanup(self) -> None:
         """
@@ -394,8 +636,10 @@ class StreamingConverter(ConversionBackend):
 
         # Clear context buffer and crossfade state
         self.context_buffer = None
-        self._previous_output = None
+        self._previous_tail = None
         self._previous_rms = None
+        self._smooth_zi = None
+        self._context_silent = True
 
         # Force garbage collection
         import gc
@@ -409,19 +653,28 @@ class StreamingConverter(ConversionBackend):
         """
         Estimate processing latency for this backend.
 
+        With batch_chunks > 1 the pipeline hands queued chunks over as one
+        concatenated call: fixed per-call costs (HuBERT/generator launch,
+        context prepend) are paid once per batch, but the oldest chunk in a
+        batch waits for the whole batch to convert.
+
         Returns:
             Dictionary with latency breakdown in milliseconds
         """
         chunk_duration_ms = (self.config.chunk_size / self.config.sample_rate) * 1000
+        batch_chunks = max(1, self.config.batch_chunks)
 
         # Phase 2 latency estimates (based on RVC-Project benchmarks)
         inference_latency_ms = 50.0  # Direct PyTorch inference
         overhead_ms = 10.0  # Context management, crossfading
+        # Worst case: extra audio converted in the same call as the oldest chunk
+        batching_ms = (batch_chunks - 1) * chunk_duration_ms
 
         return {
             "chunk_duration_ms": chunk_duration_ms,
             "inference_ms": inference_latency_ms,
             "overhead_ms": overhead_ms,
-            "total_ms": chunk_duration_ms + inference_latency_ms + overhead_ms,
+            "batching_ms": batching_ms,
+            "total_ms": chunk_duration_ms + inference_latency_ms + overhead_ms + batching_ms,
             "backend": "StreamingConverter (Phase 2)"
         }
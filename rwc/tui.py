@@ -1,203 +1,491 @@
 """
 RWC Terminal User Interface (TUI)
 A comprehensive, navigable, and user-friendly interface for Real-time Voice Conversion
+
+Heavy dependencies (torch via rwc.core, pyaudio) are imported inside the
+menu actions that need them, so the menu itself starts without them.
 """
+import functools
 import os
 import sys
 import time
 import threading
+from importlib.util import find_spec
 from typing import Optional
 
-try:
-    import pyaudio
-    import numpy as np
-    PYAUDIO_AVAILABLE = True
-except ImportError:
-    PYAUDIO_AVAILABLE = False
-
-try:
-    from colorama import Fore, Style, init
-    init(autoreset=True)
-    COLORS_AVAILABLE = True
-except ImportError:
-    COLORS_AVAILABLE = False
-    # Define fallback colors
-    class ColorsFallback:
-        RED = ''
-        GREEN = ''
-        YELLOW = ''
-        BLUE = ''
-        MAGENTA = ''
-        CYAN = ''
-        WHITE = ''
-        BRIGHT = ''
-        RESET = ''
+from rwc.utils.validation import ValidationError, batch_output_jobs, expand_audio_inputs
+
+# Define fallback colors
+class ColorsFallback:
+    RED = ''
+    GREEN = ''
+    YELLOW = ''
+    BLUE = ''
+    MAGENTA = ''
+    CYAN = ''
+    WHITE = ''
+    BRIGHT = ''
+    NORMAL = ''
+    RESET = ''
+
+
+# Only color a terminal: piped/redirected output gets plain text, and
+# colorama's init() (console hooks on Windows) is skipped entirely
+COLORS_AVAILABLE = False
+if sys.stdout is not None and sys.stdout.isatty():
+    try:
+        from colorama import Fore, Style, init
+        init(autoreset=True)
+        COLORS_AVAILABLE = True
+    except ImportError:
+        pass
+if not COLORS_AVAILABLE:
     Fore = ColorsFallback()
     Style = ColorsFallback()
 
-try:
-    import torch
-    TORCH_AVAILABLE = True
-except ImportError:
-    TORCH_AVAILABLE = False
 
-from rwc.core import VoiceConverter
-from rwc.utils.audio_devices import list_audio_devices
+# Device listing, reused between menu visits until refreshed
+@functools.lru_cache(maxsize=1)
+def _devices_text():
+    """Enumerate audio devices once (imports pyaudio on first use)"""
+    from rwc.utils.audio_devices import enumerate_audio_devices, format_audio_devices
+    return format_audio_devices(enumerate_audio_devices())
+
+
+def list_audio_devices(refresh=False):
+    """List audio devices
+
+    PortAudio enumeration is slow, so the listing is built once per
+    session and reused; pass refresh=True to enumerate again.
+    """
+    if refresh:
+        _devices_text.cache_clear()
+    sys.stdout.write(_devices_text())
+    sys.stdout.flush()
 
 
 def clear_screen():
     """Clear the terminal screen"""
-    os.system('clear' if os.name == 'posix' else 'cls')
+    if os.name == 'nt' and not COLORS_AVAILABLE:
+        # Without colorama the Windows console may not translate ANSI escapes
+        os.system('cls')
+        return
+    # Erase display + cursor home; no subprocess per redraw
+    sys.stdout.write("\x1b[2J\x1b[H")
+    sys.stdout.flush()
+
+
+def _colorize(text, color=Fore.WHITE, style=Style.NORMAL):
+    """Return text with the color/style prefix print_colored() would use"""
+    if COLORS_AVAILABLE:
+        return f"{color}{style}{text}"
+    return text
 
 
 def print_colored(text, color=Fore.WHITE, style=Style.NORMAL):
     """Print colored text if colorama is available"""
-    if COLORS_AVAILABLE:
-        print(f"{color}{style}{text}")
-    else:
-        print(text)
+    print(_colorize(text, color, style))
+
+
+def _prompt_number(parse, msg, default, lo, hi):
+    """Prompt until parse() accepts the answer and it lies within [lo, hi]"""
+    prompt = f"{Fore.YELLOW}{msg}: {Fore.RESET}"
+    while True:
+        answer = input(prompt).strip()
+        try:
+            value = default if (not answer and default is not None) else parse(answer)
+        except ValueError:
+            print_colored("Invalid input. Please enter a number.", Fore.RED)
+            continue
+        if lo is not None and value < lo:
+            print_colored(f"Please enter a value of at least {lo}.", Fore.RED)
+            continue
+        if hi is not None and value > hi:
+            print_colored(f"Please enter a value of at most {hi}.", Fore.RED)
+            continue
+        return value
+
+
+def prompt_int(msg, default=None, lo=None, hi=None):
+    """Prompt for an integer, re-asking until the answer is valid
+
+    Args:
+        msg: Prompt text (without the trailing colon)
+        default: Value returned for an empty answer (None: an answer is required)
+        lo: Optional inclusive lower bound
+        hi: Optional inclusive upper bound
+    """
+    return _prompt_number(int, msg, default, lo, hi)
+
+
+def prompt_float(msg, default=None, lo=None, hi=None):
+    """Prompt for a float, re-asking until the answer is valid (see prompt_int)"""
+    return _prompt_number(float, msg, default, lo, hi)
+
+
+def prompt_yn(msg, default=True):
+    """Prompt for a yes/no answer, re-asking until it is recognized"""
+    prompt = f"{Fore.YELLOW}{msg} ({'Y/n' if default else 'y/N'}): {Fore.RESET}"
+    while True:
+        answer = input(prompt).strip().lower()
+        if not answer:
+            return default
+        if answer in ('y', 'yes'):
+            return True
+        if answer in ('n', 'no'):
+            return False
+        print_colored("Please answer y or n.", Fore.RED)
+
+
+@functools.lru_cache(maxsize=1)
+def _gpu_info():
+    """Return (torch available, CUDA available, GPU name or None)
+
+    torch is only imported once Help is opened, and the CUDA runtime is
+    queried once per process.
+    """
+    try:
+        import torch
+    except ImportError:
+        return False, False, None
+    cuda_available = torch.cuda.is_available()
+    return True, cuda_available, torch.cuda.get_device_name(0) if cuda_available else None
+
+
+def _write_frame(lines):
+    """Write already-colored lines to stdout with one write and flush"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def _render_buffer(lines):
+    """Write a whole frame of (text, color, style) lines with a single write
+
+    Equivalent to calling print_colored() once per line, but takes the
+    stdout lock and flushes once for the frame instead of once per line.
+    """
+    _write_frame([_colorize(text, color, style) for text, color, style in lines])
+
+
+# Static screens and prompts, colored once at import
+_HEADER_LINES = [
+    _colorize("=" * 60, Fore.CYAN, Style.BRIGHT),
+    _colorize("              RWC - Real-time Voice Conversion", Fore.MAGENTA, Style.BRIGHT),
+    _colorize("        A Comprehensive Terminal User Interface", Fore.CYAN),
+    _colorize("=" * 60, Fore.CYAN, Style.BRIGHT),
+    "",
+]
+
+# Header + main menu as one pre-joined string: a redraw is a single write
+_MAIN_MENU = "\n".join(_HEADER_LINES + [
+    _colorize("Select an option:", Fore.YELLOW),
+    _colorize("1. 🎵 File Conversion", Fore.GREEN),
+    _colorize("   Convert audio files using RVC models", Fore.WHITE),
+    _colorize("2. 🎤 Real-time Conversion", Fore.GREEN),
+    _colorize("   Live microphone-based voice conversion", Fore.WHITE),
+    _colorize("3. 🔧 Audio Devices", Fore.CYAN),
+    _colorize("   List available audio devices", Fore.WHITE),
+    _colorize("4. 🤖 Models", Fore.CYAN),
+    _colorize("   List available RVC models", Fore.WHITE),
+    _colorize("5. ❓ Help & Info", Fore.CYAN),
+    _colorize("   Show usage information and system info", Fore.WHITE),
+    _colorize("6. 🚪 Exit", Fore.RED),
+]) + "\n"
+
+_HELP_STATIC = [
+    _colorize(f"\n{'='*60}", Fore.MAGENTA),
+    _colorize("                    HELP & INFORMATION", Fore.MAGENTA, Style.BRIGHT),
+    _colorize(f"{'='*60}", Fore.MAGENTA),
+    _colorize("""
+📁 File Conversion:
+   • Convert audio files using RVC models
+   • Adjustable parameters (pitch, index rate)
+   • RMVPE support for accurate pitch extraction
+
+🎤 Real-time Conversion:
+   • Live microphone-based voice conversion
+   • Device selection for input and output
+   • Same RVC models and parameters as file conversion
+
+🔧 Audio Devices:
+   • Shows available input and output audio devices
+   • Helps you select the correct device IDs
+
+🤖 Models:
+   • Shows all available RVC models in the system
+   • Supports both pretrained and community models including Homer Simpson
+
+📊 System Information:""", Fore.YELLOW),
+]
+
+_HELP_TIPS = [
+    _colorize("""
+📋 Prerequisites:
+   • PyAudio library (pip install pyaudio)
+   • PortAudio development library (sudo apt-get install portaudio19-dev)
+   • Downloaded RVC models
+
+🎯 Tips:
+   • Use the Homer Simpson model for fun voice conversions
+   • Adjust pitch change for different vocal styles
+   • RMVPE provides better pitch extraction quality
+""", Fore.YELLOW),
+    _colorize(f"{'='*60}", Fore.MAGENTA),
+]
+
+_CHOICE_PROMPT = f"\n{Fore.YELLOW}Enter your choice (1-6): {Fore.RESET}"
+_PRESS_ENTER = f"\n{Fore.CYAN}Press Enter to return to the main menu...{Fore.RESET}"
 
 
 def print_header():
     """Print the header of the application"""
-    print_colored("=" * 60, Fore.CYAN, Style.BRIGHT)
-    print_colored("              RWC - Real-time Voice Conversion", Fore.MAGENTA, Style.BRIGHT)
-    print_colored("        A Comprehensive Terminal User Interface", Fore.CYAN)
-    print_colored("=" * 60, Fore.CYAN, Style.BRIGHT)
-    print()
+    _write_frame(_HEADER_LINES)
+
+
+# Model file suffixes, and name tokens of weights that are not voice models
+_MODEL_SUFFIXES = ('.pth', '.onnx', '.pt')
+_SKIP_TOKENS = ('hubert', 'rmvpe')
+
+# Last model scan: mtime_ns of every directory walked, and the sorted result
+_models_cache = {"mtimes": None, "files": None}
+
+
+def _models_unchanged(mtimes):
+    """Check whether every directory from the last scan still has its mtime"""
+    try:
+        return all(os.stat(path).st_mtime_ns == mtime for path, mtime in mtimes.items())
+    except OSError:
+        return False
+
+
+def _iter_model_files(models_dir, mtimes):
+    """Yield (path, display_text) for voice models under models_dir
+
+    display_text is "parent/filename" for models in a subdirectory and the
+    bare filename otherwise. Each scanned directory's mtime is recorded
+    in mtimes.
+
+    Iterative scandir walk: DirEntry type checks come from the directory
+    listing itself, so no per-entry stat is needed, and only matching
+    paths are ever materialized.
+    """
+    stack = [models_dir]
+    while stack:
+        root = stack.pop()
+        # Display prefix, built once per directory; interned since the same
+        # directory name recurs across model trees (e.g. "weights/")
+        if root == models_dir:
+            prefix = ""
+        else:
+            prefix = sys.intern(os.path.basename(root) + os.sep)
+        try:
+            mtimes[root] = os.stat(root).st_mtime_ns
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    name = entry.name
+                    if not name.endswith(_MODEL_SUFFIXES) or not entry.is_file():
+                        continue
+                    # Skip files that are not intended for voice conversion
+                    lname = name.lower()
+                    if not any(token in lname for token in _SKIP_TOKENS):
+                        yield entry.path, prefix + name
+        except OSError:
+            continue
 
 
 def list_available_models():
-    """List all available models in the models directory"""
+    """List all available models in the models directory
+
+    Returns:
+        Sorted tuple of (path, display_text) tuples
+
+    The walk is cached; it is only repeated when one of the scanned
+    directories has changed since (files added, removed or renamed).
+    The cached tuple itself is returned, so callers needing a mutable
+    list should copy it.
+    """
     models_dir = "models"
-    if os.path.exists(models_dir):
-        model_files = []
-        for root, dirs, files in os.walk(models_dir):
-            for file in files:
-                if file.endswith(('.pth', '.onnx', '.pt')):
-                    # Skip files that are not intended for voice conversion
-                    if 'hubert' not in file.lower() and 'rmvpe' not in file.lower():
-                        model_files.append(os.path.join(root, file))
-        return sorted(model_files)
-    return []
+    cached_mtimes = _models_cache["mtimes"]
+    if cached_mtimes is not None and _models_unchanged(cached_mtimes):
+        return _models_cache["files"]
+
+    if os.path.isdir(models_dir):
+        mtimes = {}
+        model_files = tuple(sorted(_iter_model_files(models_dir, mtimes)))
+        _models_cache["mtimes"] = mtimes
+        _models_cache["files"] = model_files
+        return model_files
+
+    _models_cache["mtimes"] = None
+    _models_cache["files"] = None
+    return ()
+
+
+def _model_listing_lines(models):
+    """Numbered listing lines for list_available_models() output, for _render_buffer()"""
+    lines = []
+    for i, (model, display_text) in enumerate(models, 1):
+        lines.append((f"{i:2d}. {display_text}", Fore.GREEN, Style.NORMAL))
+        lines.append((f"    {model}", Fore.BLUE, Style.NORMAL))
+    return lines
+
+
+# Background thread importing the conversion stack and loading the selected model (see prewarm_converter)
+_prewarm_thread = None
+
+
+def _prewarm(model_path=None, use_rmvpe=None):
+    """Import rwc.core (torch, librosa), initialize CUDA and load the model"""
+    try:
+        from rwc.core import get_converter
+        import torch
+        torch.cuda.is_available()
+        if model_path:
+            # Quiet: loading messages would land in the middle of the next prompt
+            get_converter(model_path, use_rmvpe=use_rmvpe, verbose=False)
+    except Exception:
+        # The foreground call reports the real error when it is needed
+        pass
+
+
+def prewarm_converter(model_path=None, use_rmvpe=None):
+    """Start loading the conversion stack while the user answers prompts
+
+    Importing torch/librosa, initializing CUDA and loading the selected
+    model take seconds; doing it in the background hides it behind the
+    parameter prompts. The later ``get_converter()`` call waits for the
+    warm-up if it is still loading the same model.
+
+    Args:
+        model_path: Selected model to load into the converter cache, if any
+        use_rmvpe: The user's RMVPE answer, so the job finds the same cache key
+    """
+    global _prewarm_thread
+    if _prewarm_thread is None or (model_path and not _prewarm_thread.is_alive()):
+        _prewarm_thread = threading.Thread(
+            target=_prewarm, args=(model_path, use_rmvpe), daemon=True, name="RWC-Prewarm"
+        )
+        _prewarm_thread.start()
 
 
 def select_model():
-    """Allow user to select a model from available models"""
+    """Allow user to select a model from available models
+
+    Returns:
+        (model_path, needs_check): model_path is None if the user went back;
+        needs_check is True for a typed custom path, which unlike a listed
+        model has not just been seen on disk
+    """
     models = list_available_models()
     
     if not models:
         print_colored("No models found. Please download models first.", Fore.RED)
-        return None
+        return None, False
     
-    print_colored("\nAvailable Models:", Fore.YELLOW)
-    for i, model in enumerate(models, 1):
-        # Format the model path for better readability
-        model_path_parts = model.split('/')
-        if len(model_path_parts) >= 3:
-            # Show parent directory and filename
-            parent_dir = model_path_parts[-2]
-            model_name = model_path_parts[-1]
-            display_text = f"{parent_dir}/{model_name}"
-        else:
-            display_text = os.path.basename(model)
-        
-        print_colored(f"{i:2d}. {display_text}", Fore.GREEN)
-        print_colored(f"    {model}", Fore.BLUE)
+    _render_buffer(
+        [("\nAvailable Models:", Fore.YELLOW, Style.NORMAL)]
+        + _model_listing_lines(models)
+        + [
+            (f"{len(models) + 1}. Enter custom model path", Fore.CYAN, Style.NORMAL),
+            (f"{len(models) + 2}. Go back", Fore.MAGENTA, Style.NORMAL),
+        ]
+    )
     
-    print_colored(f"{len(models) + 1}. Enter custom model path", Fore.CYAN)
-    print_colored(f"{len(models) + 2}. Go back", Fore.MAGENTA)
-    
-    try:
-        choice = int(input(f"\n{Fore.YELLOW}Select a model (1-{len(models)+2}): {Fore.RESET}"))
-        
-        if 1 <= choice <= len(models):
-            return models[choice - 1]
-        elif choice == len(models) + 1:
-            custom_path = input(f"{Fore.YELLOW}Enter path to model file: {Fore.RESET}").strip()
-            return custom_path if custom_path else None
-        elif choice == len(models) + 2:
-            return None
-        else:
-            print_colored("Invalid selection.", Fore.RED)
-            return None
-    except ValueError:
-        print_colored("Invalid input. Please enter a number.", Fore.RED)
-        return None
+    print()
+    choice = prompt_int(f"Select a model (1-{len(models)+2})", lo=1, hi=len(models) + 2)
+
+    if choice <= len(models):
+        return models[choice - 1][0], False
+    elif choice == len(models) + 1:
+        custom_path = input(f"{Fore.YELLOW}Enter path to model file: {Fore.RESET}").strip()
+        return (custom_path, True) if custom_path else (None, False)
+    return None, False
 
 
 def file_conversion_tui():
     """File-based conversion interface with improved UX"""
     print_colored("\n--- File Conversion ---", Fore.CYAN, Style.BRIGHT)
     
-    model_path = select_model()
+    model_path, needs_check = select_model()
     if not model_path:
         return
-    
-    if not os.path.exists(model_path):
+
+    if needs_check and not os.path.exists(model_path):
         print_colored(f"Model not found: {model_path}", Fore.RED)
         return
-    
     print_colored(f"\nSelected model: {os.path.basename(model_path)}", Fore.GREEN)
+    use_rmvpe = prompt_yn("Use RMVPE for pitch extraction?")
+    prewarm_converter(model_path, use_rmvpe)
     
-    input_path = input(f"{Fore.YELLOW}Enter path to input audio file: {Fore.RESET}").strip()
-    if not input_path:
-        print_colored("No input file specified.", Fore.RED)
-        return
-        
-    if not os.path.exists(input_path):
-        print_colored(f"Input audio file not found: {input_path}", Fore.RED)
-        return
-    
-    output_path = input(f"{Fore.YELLOW}Enter output path for converted audio (default: output.wav): {Fore.RESET}").strip()
-    if not output_path:
-        output_path = "output.wav"
-    
+    spec = input(f"{Fore.YELLOW}Enter input audio file(s) (comma-separated paths or a glob like takes/*.wav): {Fore.RESET}").strip()
     try:
-        default_pitch = "0"
-        pitch_input = input(f"{Fore.YELLOW}Enter pitch change (-24 to 24, default: {default_pitch}): {Fore.RESET}") or default_pitch
-        pitch_change = int(pitch_input)
-        if pitch_change < -24 or pitch_change > 24:
-            print_colored("Pitch change must be between -24 and 24", Fore.RED)
-            return
-    except ValueError:
-        print_colored("Invalid pitch change value", Fore.RED)
+        input_paths = expand_audio_inputs(spec)
+    except ValidationError as e:
+        print_colored(str(e), Fore.RED)
         return
-    
-    try:
-        default_index = "0.75"
-        index_input = input(f"{Fore.YELLOW}Enter index rate (0.0 to 1.0, default: {default_index}): {Fore.RESET}") or default_index
-        index_rate = float(index_input)
-        if index_rate < 0.0 or index_rate > 1.0:
-            print_colored("Index rate must be between 0.0 and 1.0", Fore.RED)
-            return
-    except ValueError:
-        print_colored("Invalid index rate value", Fore.RED)
+
+    missing = [path for path in input_paths if not os.path.exists(path)]
+    if missing:
+        print_colored(f"Input audio file not found: {', '.join(missing)}", Fore.RED)
         return
+
+    if len(input_paths) == 1:
+        output_path = input(f"{Fore.YELLOW}Enter output path for converted audio (default: output.wav): {Fore.RESET}").strip()
+        jobs = [(input_paths[0], output_path or "output.wav")]
+    else:
+        output_dir = input(f"{Fore.YELLOW}Enter output directory for {len(input_paths)} files (default: converted): {Fore.RESET}").strip() or "converted"
+        try:
+            jobs = batch_output_jobs(input_paths, output_dir)
+        except ValidationError as e:
+            print_colored(str(e), Fore.RED)
+            return
     
-    use_rmvpe_input = input(f"{Fore.YELLOW}Use RMVPE for pitch extraction? (Y/n): {Fore.RESET}").lower()
-    use_rmvpe = True if use_rmvpe_input in ['', 'y', 'yes'] else False
+    pitch_change = prompt_int("Enter pitch change (-24 to 24, default: 0)", default=0, lo=-24, hi=24)
+    index_rate = prompt_float("Enter index rate (0.0 to 1.0, default: 0.75)", default=0.75, lo=0.0, hi=1.0)
     
     print_colored(f"\nConverting with model: {os.path.basename(model_path)}", Fore.CYAN)
     print_colored("This may take a moment...", Fore.YELLOW)
     
+    def report(done, total, path, error):
+        if total == 1:
+            if error is not None:
+                print_colored(f"\n✗ Conversion failed: {error}", Fore.RED)
+        elif error is None:
+            print_colored(f"[{done}/{total}] ✓ {os.path.basename(path)}", Fore.GREEN)
+        else:
+            print_colored(f"[{done}/{total}] ✗ {os.path.basename(path)}: {error}", Fore.RED)
+
     try:
-        converter = VoiceConverter(model_path, use_rmvpe=use_rmvpe)
-        result_path = converter.convert_voice(
-            input_path,
-            output_path,
-            pitch_change=pitch_change,
-            index_rate=index_rate
+        from rwc.core import get_converter
+        converter = get_converter(model_path, use_rmvpe=use_rmvpe)
+        results = converter.convert_voice_batch(
+            jobs,
+            pitch_shift=pitch_change,
+            index_rate=index_rate,
+            on_progress=report
         )
-        print_colored(f"\n✓ Conversion completed successfully!", Fore.GREEN, Style.BRIGHT)
-        print_colored(f"Output saved to: {result_path}", Fore.CYAN)
     except Exception as e:
         print_colored(f"\n✗ Conversion failed: {str(e)}", Fore.RED)
+        return
+
+    converted = [path for path in results if path is not None]
+    if len(jobs) == 1:
+        if converted:
+            print_colored(f"\n✓ Conversion completed successfully!", Fore.GREEN, Style.BRIGHT)
+            print_colored(f"Output saved to: {converted[0]}", Fore.CYAN)
+    else:
+        color = Fore.GREEN if len(converted) == len(jobs) else Fore.YELLOW
+        print_colored(f"\n✓ Converted {len(converted)}/{len(jobs)} files into {output_dir}", color, Style.BRIGHT)
 
 
 def real_time_conversion_tui():
     """Real-time conversion interface with improved UX"""
-    if not PYAUDIO_AVAILABLE:
+    try:
+        import pyaudio  # noqa: F401
+    except ImportError:
         print_colored("\nPyAudio is not available. Please install it with: pip install pyaudio", Fore.RED)
         print_colored("Also ensure PortAudio is installed: sudo apt-get install portaudio19-dev", Fore.RED)
         return
@@ -206,37 +494,27 @@ def real_time_conversion_tui():
     print_colored("Available audio devices:", Fore.YELLOW)
     list_audio_devices()
     
-    model_path = select_model()
+    model_path, needs_check = select_model()
     if not model_path:
         return
-    
-    if not os.path.exists(model_path):
+
+    if needs_check and not os.path.exists(model_path):
         print_colored(f"Model not found: {model_path}", Fore.RED)
         return
-    
     print_colored(f"\nSelected model: {os.path.basename(model_path)}", Fore.GREEN)
+    use_rmvpe = prompt_yn("Use RMVPE for pitch extraction?")
+    prewarm_converter(model_path, use_rmvpe)
     
-    try:
-        default_input = "4"
-        input_device_str = input(f"{Fore.YELLOW}Enter input device ID (default: {default_input}): {Fore.RESET}") or default_input
-        input_device = int(input_device_str)
-        
-        default_output = "0"
-        output_device_str = input(f"{Fore.YELLOW}Enter output device ID (default: {default_output}): {Fore.RESET}") or default_output
-        output_device = int(output_device_str)
-    except ValueError:
-        print_colored("Invalid device ID. Please enter a number.", Fore.RED)
-        return
-    
-    use_rmvpe_input = input(f"{Fore.YELLOW}Use RMVPE for pitch extraction? (Y/n): {Fore.RESET}").lower()
-    use_rmvpe = True if use_rmvpe_input in ['', 'y', 'yes'] else False
+    input_device = prompt_int("Enter input device ID (default: 4)", default=4, lo=0)
+    output_device = prompt_int("Enter output device ID (default: 0)", default=0, lo=0)
     
     print_colored(f"\nStarting real-time conversion with model: {os.path.basename(model_path)}", Fore.CYAN)
     print_colored("Press Ctrl+C to stop conversion", Fore.YELLOW)
     print_colored("Note: The actual real-time conversion will start in a new thread", Fore.YELLOW)
     
     try:
-        converter = VoiceConverter(model_path, use_rmvpe=use_rmvpe)
+        from rwc.core import get_converter
+        converter = get_converter(model_path, use_rmvpe=use_rmvpe)
         print_colored("\nReal-time conversion starting...", Fore.GREEN)
         converter.real_time_convert(input_device=input_device, output_device=output_device)
         print_colored("\nReal-time conversion completed!", Fore.GREEN)
@@ -250,108 +528,57 @@ def main_tui():
     """Main TUI loop with comprehensive navigation"""
     while True:
         clear_screen()
-        print_header()
-        
-        print_colored("Select an option:", Fore.YELLOW)
-        print_colored("1. 🎵 File Conversion", Fore.GREEN)
-        print_colored("   Convert audio files using RVC models", Fore.WHITE)
-        print_colored("2. 🎤 Real-time Conversion", Fore.GREEN) 
-        print_colored("   Live microphone-based voice conversion", Fore.WHITE)
-        print_colored("3. 🔧 Audio Devices", Fore.CYAN)
-        print_colored("   List available audio devices", Fore.WHITE)
-        print_colored("4. 🤖 Models", Fore.CYAN)
-        print_colored("   List available RVC models", Fore.WHITE)
-        print_colored("5. ❓ Help & Info", Fore.CYAN)
-        print_colored("   Show usage information and system info", Fore.WHITE)
-        print_colored("6. 🚪 Exit", Fore.RED)
-        
+
+        sys.stdout.write(_MAIN_MENU)
+        sys.stdout.flush()
+
         try:
-            choice = input(f"\n{Fore.YELLOW}Enter your choice (1-6): {Fore.RESET}")
+            choice = input(_CHOICE_PROMPT)
+
+            # One model scan per iteration, shared by the screens that show models
+            models = list_available_models() if choice in ('4', '5') else None
             
             if choice == '1':
                 file_conversion_tui()
-                input(f"\n{Fore.CYAN}Press Enter to return to the main menu...{Fore.RESET}")
+                input(_PRESS_ENTER)
             elif choice == '2':
                 real_time_conversion_tui()
-                input(f"\n{Fore.CYAN}Press Enter to return to the main menu...{Fore.RESET}")
+                input(_PRESS_ENTER)
             elif choice == '3':
-                print_colored("\nAvailable audio devices:", Fore.YELLOW)
-                list_audio_devices()
-                input(f"\n{Fore.CYAN}Press Enter to return to the main menu...{Fore.RESET}")
+                refresh = False
+                while True:
+                    print_colored("\nAvailable audio devices:", Fore.YELLOW)
+                    list_audio_devices(refresh=refresh)
+                    answer = input(f"\n{Fore.CYAN}Press Enter to return to the main menu, or r to refresh the device list...{Fore.RESET}")
+                    refresh = answer.strip().lower() == 'r'
+                    if not refresh:
+                        break
             elif choice == '4':
-                models = list_available_models()
                 if models:
-                    print_colored(f"\nAvailable models ({len(models)}):", Fore.YELLOW)
-                    for i, model in enumerate(models, 1):
-                        # Format for better readability
-                        model_path_parts = model.split('/')
-                        if len(model_path_parts) >= 3:
-                            parent_dir = model_path_parts[-2]
-                            model_name = model_path_parts[-1]
-                            display_text = f"{parent_dir}/{model_name}"
-                        else:
-                            display_text = os.path.basename(model)
-                            
-                        print_colored(f"{i:2d}. {display_text}", Fore.GREEN)
-                        print_colored(f"    {model}", Fore.BLUE)
+                    _render_buffer(
+                        [(f"\nAvailable models ({len(models)}):", Fore.YELLOW, Style.NORMAL)]
+                        + _model_listing_lines(models)
+                    )
                 else:
                     print_colored("\nNo models found. Please make sure models are downloaded.", Fore.RED)
-                input(f"\n{Fore.CYAN}Press Enter to return to the main menu...{Fore.RESET}")
+                input(_PRESS_ENTER)
             elif choice == '5':
-                print_colored(f"\n{'='*60}", Fore.MAGENTA)
-                print_colored("                    HELP & INFORMATION", Fore.MAGENTA, Style.BRIGHT)
-                print_colored(f"{'='*60}", Fore.MAGENTA)
-                
-                print_colored("""
-📁 File Conversion:
-   • Convert audio files using RVC models
-   • Adjustable parameters (pitch, index rate)
-   • RMVPE support for accurate pitch extraction
-
-🎤 Real-time Conversion:
-   • Live microphone-based voice conversion
-   • Device selection for input and output
-   • Same RVC models and parameters as file conversion
-
-🔧 Audio Devices:
-   • Shows available input and output audio devices
-   • Helps you select the correct device IDs
-
-🤖 Models:
-   • Shows all available RVC models in the system
-   • Supports both pretrained and community models including Homer Simpson
-
-📊 System Information:""", Fore.YELLOW)
-                
-                # Display system info
-                if TORCH_AVAILABLE:
-                    print_colored(f"   • CUDA Available: {torch.cuda.is_available()}", Fore.CYAN)
-                    if torch.cuda.is_available():
-                        gpu_name = torch.cuda.get_device_name(0)
-                    print_colored(f"   • GPU: {gpu_name}", Fore.CYAN)
-                
-                print_colored(f"   • Total Models: {len(list_available_models())}", Fore.CYAN)
-                
-                if PYAUDIO_AVAILABLE:
-                    print_colored("   • Audio Input: Available", Fore.GREEN)
+                # Only the system-info lines are formatted per visit
+                torch_available, cuda_available, gpu_name = _gpu_info()
+                info_lines = []
+                if torch_available:
+                    info_lines.append(_colorize(f"   • CUDA Available: {cuda_available}", Fore.CYAN))
+                    if cuda_available:
+                        info_lines.append(_colorize(f"   • GPU: {gpu_name}", Fore.CYAN))
+                info_lines.append(_colorize(f"   • Total Models: {len(models)}", Fore.CYAN))
+                if find_spec("pyaudio") is not None:
+                    info_lines.append(_colorize("   • Audio Input: Available", Fore.GREEN))
                 else:
-                    print_colored("   • Audio Input: Not Available", Fore.RED)
-                
-                print_colored("""
-📋 Prerequisites:
-   • PyAudio library (pip install pyaudio)
-   • PortAudio development library (sudo apt-get install portaudio19-dev)
-   • Downloaded RVC models
+                    info_lines.append(_colorize("   • Audio Input: Not Available", Fore.RED))
 
-🎯 Tips:
-   • Use the Homer Simpson model for fun voice conversions
-   • Adjust pitch change for different vocal styles
-   • RMVPE provides better pitch extraction quality
-""", Fore.YELLOW)
-                
-                print_colored(f"{'='*60}", Fore.MAGENTA)
-                
-                input(f"\n{Fore.CYAN}Press Enter to return to the main menu...{Fore.RESET}")
+                _write_frame(_HELP_STATIC + info_lines + _HELP_TIPS)
+
+                input(_PRESS_ENTER)
             elif choice == '6':
                 print_colored("\n👋 Thank you for using RWC Terminal Interface!", Fore.GREEN, Style.BRIGHT)
                 print_colored("Have a great day!", Fore.CYAN)
@@ -364,7 +591,7 @@ def main_tui():
             break
         except Exception as e:
             print_colored(f"\n💥 An error occurred: {str(e)}", Fore.RED)
-            input(f"\n{Fore.CYAN}Press Enter to return to the main menu...{Fore.RESET}")
+            input(_PRESS_ENTER)
 
 
 if __name__ == "__main__":
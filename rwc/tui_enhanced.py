@@ -2,14 +2,27 @@
 Enhanced RWC Terminal User Interface
 Provides a navigable menu-driven experience for real-time voice conversion tasks.
 """
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Callable, List, Optional
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+import asyncio
+import atexit
+import functools
 import os
 import sys
 import time
+import shlex
 import shutil
+import signal
 import subprocess
 import re
+import threading
+
+try:
+    import termios
+    import tty
+except ImportError:  # Windows: read_key() uses msvcrt instead
+    termios = tty = None
 
 try:
     import pyaudio
@@ -40,20 +53,172 @@ except ImportError:
     Fore = _ColorFallback()
     Style = _ColorFallback()
 
-from rwc.core import VoiceConverter
+from rwc.core import clear_converter_cache, get_converter
+from rwc.utils.validation import ValidationError, batch_output_jobs, expand_audio_inputs
+
+# `wpctl status` parsing: "<id>. <name>" node rows and tree sub-section markers
+_NODE_RE = re.compile(r"(\d+)\.\s*(.+)")
+_TREE_PREFIXES = ("├─", "└─")
+
+# Model scans per models directory: (mtime_ns of every scanned directory, sorted paths).
+# A directory's mtime changes whenever entries are added, removed or renamed in it.
+_MODEL_CACHE: Dict[str, Tuple[Dict[str, int], List[str]]] = {}
+
+
+# os.fwalk (descriptor-relative walk) is POSIX-only
+_HAVE_FWALK = hasattr(os, "fwalk")
+
+
+_MODEL_EXTS = (".pth", ".onnx", ".pt")
+_MODEL_SKIP = re.compile(r"hubert|rmvpe", re.IGNORECASE)
+
+
+def _is_model_file(name: str) -> bool:
+    """Whether a filename is a voice model (not a HuBERT/RMVPE support weight)."""
+    return name.endswith(_MODEL_EXTS) and _MODEL_SKIP.search(name) is None
+
+
+def _mtimes_unchanged(mtimes: Dict[str, int]) -> bool:
+    """Check that every directory from a previous scan still has its mtime."""
+    try:
+        return all(os.stat(path).st_mtime_ns == mtime for path, mtime in mtimes.items())
+    except OSError:
+        return False
+
+
+def _warm_converter(model_path: str, use_rmvpe: bool) -> threading.Thread:
+    """Load a model into the converter cache while the user answers prompts.
+
+    The job's own get_converter() call with the same answers waits for this
+    load instead of starting a second one. The load is quiet so its messages
+    do not land in the middle of the next prompt.
+    """
+    def load():
+        try:
+            get_converter(model_path, use_rmvpe=use_rmvpe, verbose=False)
+        except Exception:
+            pass  # The job's get_converter() call reports the error
+
+    thread = threading.Thread(target=load, daemon=True, name="RWC-ModelWarmup")
+    thread.start()
+    return thread
+
+
+@functools.lru_cache(maxsize=1)
+def _cuda_device_info() -> Optional[Tuple[str, float]]:
+    """Return (GPU name, VRAM in GB) for CUDA device 0, or None without torch/CUDA.
+
+    Cached so repeat System Information visits neither retry a failed torch
+    import nor re-enter the CUDA runtime.
+    """
+    try:
+        import torch
+    except ImportError:
+        return None
+    if not torch.cuda.is_available():
+        return None
+    props = torch.cuda.get_device_properties(0)
+    return props.name, props.total_memory / (1024**3)
 
 
 def clear_screen():
     """Clear terminal output."""
-    os.system("clear" if os.name == "posix" else "cls")
+    if os.name == "nt" and not COLORS_AVAILABLE:
+        # Without colorama the Windows console may not translate ANSI escapes
+        os.system("cls")
+        return
+    # Erase display + cursor home; no shell/subprocess per redraw
+    sys.stdout.write("\x1b[2J\x1b[H")
+    sys.stdout.flush()
 
 
-def print_colored(text: str, color=Fore.WHITE, style=Style.NORMAL):
-    """Print text with optional color styling."""
+def _colorize(text: str, color=Fore.WHITE, style=Style.NORMAL) -> str:
+    """Return text with the color/style prefix print_colored() would use."""
     if COLORS_AVAILABLE:
-        print(f"{color}{style}{text}")
+        return f"{color}{style}{text}"
+    return text
+
+
+def print_colored(text: str, color=Fore.WHITE, style=Style.NORMAL, flush: bool = False):
+    """Print text with optional color styling.
+
+    Pass flush=True before sleeping or blocking work: while the app runs,
+    stdout is block-buffered (see _block_buffered_stdout).
+    """
+    print(_colorize(text, color, style), flush=flush)
+
+
+@contextmanager
+def _block_buffered_stdout():
+    """Turn off line buffering on a terminal stdout for the app's lifetime.
+
+    Frames are flushed explicitly once drawn, and input() flushes pending
+    output before reading, so the terminal sees one write per screen
+    rather than one per line. Piped output is left untouched.
+    """
+    stream = sys.stdout
+    reconfigure = getattr(stream, "reconfigure", None)
+    if reconfigure is None or not stream.isatty():
+        yield
+        return
+    line_buffering = stream.line_buffering
+    reconfigure(line_buffering=False)
+    try:
+        yield
+    finally:
+        stream.flush()
+        reconfigure(line_buffering=line_buffering)
+
+
+def read_key(prompt: str) -> str:
+    """Read a single keypress without waiting for Enter.
+
+    Falls back to a line read via input() when stdin is not a terminal.
+    Free-text prompts (paths, numbers) keep using input().
+    """
+    if not sys.stdin.isatty():
+        return input(prompt)
+
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    if termios is not None:
+        fd = sys.stdin.fileno()
+        saved = termios.tcgetattr(fd)
+        try:
+            # cbreak keeps signal keys, so Ctrl+C still raises KeyboardInterrupt
+            tty.setcbreak(fd)
+            key = sys.stdin.read(1)
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, saved)
     else:
-        print(text)
+        import msvcrt
+
+        key = msvcrt.getwch()
+        if key == "\x03":
+            raise KeyboardInterrupt
+    # Echo the key, as a line read would
+    sys.stdout.write((key if key.isprintable() else "") + "\n")
+    sys.stdout.flush()
+    return key
+
+
+def _format_frame(lines: List[Tuple[str, str, str]]) -> str:
+    """Join (text, color, style) lines into one colored, newline-terminated string."""
+    return "".join(_colorize(text, color, style) + "\n" for text, color, style in lines)
+
+
+def _write_frame(frame: str):
+    sys.stdout.write(frame)
+    sys.stdout.flush()
+
+
+def _render_buffer(lines: List[Tuple[str, str, str]]):
+    """Write a frame of (text, color, style) lines with a single stdout write.
+
+    Equivalent to one print_colored() per line, but takes the stdout lock
+    and flushes once for the whole frame.
+    """
+    _write_frame(_format_frame(lines))
 
 
 @dataclass
@@ -68,15 +233,24 @@ class MenuItem:
 class MenuScreen:
     title: str
     subtitle: Optional[str] = None
-    items: List[MenuItem] = field(default_factory=list)
+    items: Sequence[MenuItem] = ()
     show_back: bool = True
+    _index: Dict[str, MenuItem] = field(init=False, repr=False, compare=False)
 
-    def get_item(self, key: str) -> Optional[MenuItem]:
-        key = key.lower()
+    def __post_init__(self):
+        # Items are frozen; add_item() keeps the key index in sync
+        self.items = tuple(self.items)
+        self._index = {}
         for item in self.items:
-            if item.key.lower() == key:
-                return item
-        return None
+            self._index.setdefault(item.key.lower(), item)
+
+    def add_item(self, item: MenuItem):
+        self.items += (item,)
+        self._index.setdefault(item.key.lower(), item)
+
+    def get_item(self, key: str, lowered: bool = False) -> Optional[MenuItem]:
+        """Case-insensitive key lookup; pass lowered=True if key is already lowercase."""
+        return self._index.get(key if lowered else key.lower())
 
 
 class TerminalApp:
@@ -85,16 +259,30 @@ class TerminalApp:
     def __init__(self):
         self.running = True
         self.screen_stack: List[MenuScreen] = []
+        # One PortAudio session and device listing per app; see refresh_audio_devices()
+        self._pa = None
+        self._devices_cache: Optional[List[dict]] = None
+        # PipeWire CLI tools, resolved on PATH once per app
+        self._pwcat_path = shutil.which("pw-cat")
+        self._wpctl_path = shutil.which("wpctl")
+        # Menu screens are static, so build them once and reuse them on every visit
+        self._main_menu = self.build_main_menu()
+        self._downloads_menu = self._build_downloads_menu()
 
     # ---------- Navigation helpers ----------
     def run(self):
         """Start the main event loop."""
-        self.navigate(self.build_main_menu())
+        with _block_buffered_stdout():
+            self._event_loop()
+
+    def _event_loop(self):
+        self.navigate(self._main_menu)
 
         while self.running and self.screen_stack:
             screen = self.screen_stack[-1]
             self.render_screen(screen)
-            choice = input(
+            # Menu keys are single characters, so no Enter is needed
+            choice = read_key(
                 f"{Fore.YELLOW}Select option "
                 f"(key, {'b to back, ' if screen.show_back else ''}q to quit): "
                 f"{Fore.RESET}"
@@ -103,26 +291,27 @@ class TerminalApp:
             if not choice:
                 continue
 
-            if choice.lower() in {"q", "quit"}:
+            lowered = choice.lower()
+            if lowered in {"q", "quit"}:
                 self.running = False
                 break
 
-            if screen.show_back and choice.lower() in {"b", "back"}:
+            if screen.show_back and lowered in {"b", "back"}:
                 self.go_back()
                 continue
 
-            item = screen.get_item(choice)
+            item = screen.get_item(lowered, lowered=True)
             if item:
                 try:
                     item.handler()
                 except KeyboardInterrupt:
-                    print_colored("\nInterrupted. Returning to menu...", Fore.YELLOW)
+                    print_colored("\nInterrupted. Returning to menu...", Fore.YELLOW, flush=True)
                     time.sleep(1.5)
                 except Exception as exc:
                     print_colored(f"\nError: {exc}", Fore.RED)
                     self.pause("\nPress Enter to continue...")
             else:
-                print_colored("Invalid selection. Try again.", Fore.RED)
+                print_colored("Invalid selection. Try again.", Fore.RED, flush=True)
                 time.sleep(1.2)
 
         clear_screen()
@@ -142,64 +331,127 @@ class TerminalApp:
     def render_screen(self, screen: MenuScreen):
         """Render the current menu."""
         clear_screen()
-        self.print_header()
-        print_colored(screen.title, Fore.CYAN, Style.BRIGHT)
+        lines = self._header_lines()
+        lines.append((screen.title, Fore.CYAN, Style.BRIGHT))
         if screen.subtitle:
-            print_colored(screen.subtitle, Fore.WHITE)
-        print()
+            lines.append((screen.subtitle, Fore.WHITE, Style.NORMAL))
+        lines.append(("", Fore.WHITE, Style.NORMAL))
 
         for item in screen.items:
-            print_colored(f"[{item.key}] {item.label}", Fore.GREEN, Style.BRIGHT)
-            print_colored(f"    {item.description}", Fore.WHITE)
+            lines.append((f"[{item.key}] {item.label}", Fore.GREEN, Style.BRIGHT))
+            lines.append((f"    {item.description}", Fore.WHITE, Style.NORMAL))
 
         if screen.show_back:
-            print_colored("\n[b] Back to previous menu", Fore.MAGENTA)
-        print_colored("[q] Quit", Fore.RED)
-        print()
+            lines.append(("\n[b] Back to previous menu", Fore.MAGENTA, Style.NORMAL))
+        lines.append(("[q] Quit", Fore.RED, Style.NORMAL))
+        lines.append(("", Fore.WHITE, Style.NORMAL))
+        _render_buffer(lines)
+
+    @staticmethod
+    def _header_lines() -> List[Tuple[str, str, str]]:
+        return [
+            ("=" * 60, Fore.CYAN, Style.BRIGHT),
+            ("              RWC - Real-time Voice Conversion", Fore.MAGENTA, Style.BRIGHT),
+            ("        Enhanced Navigable Terminal Interface", Fore.CYAN, Style.NORMAL),
+            ("=" * 60, Fore.CYAN, Style.BRIGHT),
+            ("", Fore.WHITE, Style.NORMAL),
+        ]
 
     @staticmethod
     def print_header():
-        print_colored("=" * 60, Fore.CYAN, Style.BRIGHT)
-        print_colored(
-            "              RWC - Real-time Voice Conversion", Fore.MAGENTA, Style.BRIGHT
-        )
-        print_colored("        Enhanced Navigable Terminal Interface", Fore.CYAN)
-        print_colored("=" * 60, Fore.CYAN, Style.BRIGHT)
-        print()
+        _render_buffer(TerminalApp._header_lines())
 
     @staticmethod
     def pause(message: str = "Press Enter to return..."):
         input(f"{Fore.CYAN}{message}{Fore.RESET}")
 
     # ---------- Model helpers ----------
+    @staticmethod
+    def _iter_model_files(root: str, mtimes: Optional[Dict[str, int]] = None):
+        """Yield voice model paths under root.
+
+        Uses os.fwalk where available: it lists each directory through an
+        open descriptor, so subdirectories are opened relative to their
+        parent (openat) instead of re-resolving the full path, and the
+        directory mtime comes from fstat on that descriptor. Elsewhere an
+        os.scandir walk reads file/dir checks from the directory listing.
+        If mtimes is given, each scanned directory's st_mtime_ns is
+        recorded in it.
+        """
+        if _HAVE_FWALK:
+            for dirpath, _, filenames, dirfd in os.fwalk(root):
+                if mtimes is not None:
+                    mtimes[dirpath] = os.fstat(dirfd).st_mtime_ns
+                for name in filenames:
+                    if _is_model_file(name):
+                        yield os.path.join(dirpath, name)
+            return
+
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            try:
+                if mtimes is not None:
+                    mtimes[directory] = os.stat(directory).st_mtime_ns
+                entries = os.scandir(directory)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    if _is_model_file(entry.name) and entry.is_file():
+                        yield entry.path
+
     @staticmethod
     def list_available_models() -> List[str]:
+        """Sorted model paths, rescanned only when a scanned directory changed."""
         models_dir = "models"
-        if not os.path.exists(models_dir):
+        cached = _MODEL_CACHE.get(models_dir)
+        if cached is not None and _mtimes_unchanged(cached[0]):
+            return list(cached[1])
+
+        if not os.path.isdir(models_dir):
+            _MODEL_CACHE.pop(models_dir, None)
             return []
+        mtimes: Dict[str, int] = {}
+        models = sorted(TerminalApp._iter_model_files(models_dir, mtimes))
+        _MODEL_CACHE[models_dir] = (mtimes, models)
+        return list(models)
 
-        collected: List[str] = []
-        for root, _, files in os.walk(models_dir):
-            for file in files:
-                if not file.endswith((".pth", ".onnx", ".pt")):
-                    continue
-                lowered = file.lower()
-                if any(skip in lowered for skip in ("hubert", "rmvpe")):
-                    continue
-                collected.append(os.path.join(root, file))
-        return sorted(collected)
+    @staticmethod
+    def count_available_models() -> int:
+        """Number of models, without building or sorting the list on a cold cache."""
+        models_dir = "models"
+        cached = _MODEL_CACHE.get(models_dir)
+        if cached is not None and _mtimes_unchanged(cached[0]):
+            return len(cached[1])
+        if not os.path.isdir(models_dir):
+            return 0
+        return sum(1 for _ in TerminalApp._iter_model_files(models_dir))
 
-    def display_model_catalog(self, models: List[str]):
+    @staticmethod
+    def _format_model_row(idx: int, model: str) -> List[Tuple[str, str, str]]:
+        # "parent/filename" without splitting the whole path into a list
+        head, _, tail = model.rpartition(os.sep)
+        parent = head.rpartition(os.sep)[2]
+        summary = f"{parent}/{tail}" if parent else tail
+        return [
+            (f"{idx:2d}. {summary}", Fore.GREEN, Style.NORMAL),
+            (f"    {model}", Fore.BLUE, Style.NORMAL),
+        ]
+
+    def _catalog_lines(self, models: List[str]) -> List[Tuple[str, str, str]]:
         if not models:
-            print_colored("No models found. Download or link models first.", Fore.RED)
-            return
-
-        print_colored(f"Available models ({len(models)}):", Fore.YELLOW, Style.BRIGHT)
+            return [("No models found. Download or link models first.", Fore.RED, Style.NORMAL)]
+        lines = [(f"Available models ({len(models)}):", Fore.YELLOW, Style.BRIGHT)]
         for idx, model in enumerate(models, 1):
-            parts = model.split(os.sep)
-            summary = "/".join(parts[-2:]) if len(parts) >= 2 else parts[-1]
-            print_colored(f"{idx:2d}. {summary}", Fore.GREEN)
-            print_colored(f"    {model}", Fore.BLUE)
+            lines.extend(self._format_model_row(idx, model))
+        return lines
+
+    def display_model_catalog(self, models: List[str]):
+        _render_buffer(self._catalog_lines(models))
 
     def prompt_model_selection(self) -> Optional[str]:
         models = self.list_available_models()
@@ -207,22 +459,30 @@ class TerminalApp:
             print_colored("No models detected. Use Download Models first.", Fore.RED)
             return None
 
+        # The picker is redrawn after every invalid entry; format it only once
+        frame = _format_frame(
+            self._header_lines()
+            + [("Select a model for conversion", Fore.CYAN, Style.BRIGHT)]
+            + self._catalog_lines(models)
+            + [
+                ("\n[c] Custom path", Fore.MAGENTA, Style.NORMAL),
+                ("[b] Cancel", Fore.RED, Style.NORMAL),
+            ]
+        )
+
         while True:
             clear_screen()
-            self.print_header()
-            print_colored("Select a model for conversion", Fore.CYAN, Style.BRIGHT)
-            self.display_model_catalog(models)
-            print_colored("\n[c] Custom path", Fore.MAGENTA)
-            print_colored("[b] Cancel", Fore.RED)
+            _write_frame(frame)
             choice = input(
                 f"\n{Fore.YELLOW}Enter model number or key: {Fore.RESET}"
             ).strip()
 
             if not choice:
                 continue
-            if choice.lower() in {"b", "back"}:
+            lowered = choice.lower()
+            if lowered in {"b", "back"}:
                 return None
-            if choice.lower() in {"c", "custom"}:
+            if lowered in {"c", "custom"}:
                 custom = input(
                     f"{Fore.YELLOW}Enter full path to model file: {Fore.RESET}"
                 ).strip()
@@ -232,50 +492,59 @@ class TerminalApp:
                 idx = int(choice)
                 if 1 <= idx <= len(models):
                     return models[idx - 1]
-            print_colored("Invalid selection. Try again.", Fore.RED)
+            print_colored("Invalid selection. Try again.", Fore.RED, flush=True)
             time.sleep(1.2)
 
     # ---------- Audio helpers ----------
-    @staticmethod
-    def get_audio_devices() -> List[dict]:
+    def _get_pa(self):
+        """Return the app's PyAudio instance, initializing PortAudio on first use."""
+        if self._pa is None:
+            self._pa = pyaudio.PyAudio()
+            atexit.register(self._pa.terminate)
+        return self._pa
+
+    def refresh_audio_devices(self):
+        """Drop the cached listing; PortAudio only re-enumerates on re-initialization."""
+        self._devices_cache = None
+        if self._pa is not None:
+            atexit.unregister(self._pa.terminate)
+            self._pa.terminate()
+            self._pa = None
+
+    def get_audio_devices(self) -> List[dict]:
         if not PYAUDIO_AVAILABLE:
             return []
+        if self._devices_cache is not None:
+            return self._devices_cache
 
         devices = []
-        pa = pyaudio.PyAudio()
-        try:
-            for idx in range(pa.get_device_count()):
-                info = pa.get_device_info_by_index(idx)
-                devices.append(
-                    {
-                        "index": idx,
-                        "name": info.get("name", f"Device {idx}"),
-                        "max_input": info.get("maxInputChannels", 0),
-                        "max_output": info.get("maxOutputChannels", 0),
-                        "default_rate": int(info.get("defaultSampleRate", 0) or 0),
-                    }
-                )
-        finally:
-            pa.terminate()
+        pa = self._get_pa()
+        for idx in range(pa.get_device_count()):
+            info = pa.get_device_info_by_index(idx)
+            devices.append(
+                {
+                    "index": idx,
+                    "name": info.get("name", f"Device {idx}"),
+                    "max_input": info.get("maxInputChannels", 0),
+                    "max_output": info.get("maxOutputChannels", 0),
+                    "default_rate": int(info.get("defaultSampleRate", 0) or 0),
+                }
+            )
+        self._devices_cache = devices
         return devices
 
-    @staticmethod
-    def detect_default_devices() -> tuple[Optional[int], Optional[int]]:
+    def detect_default_devices(self) -> tuple[Optional[int], Optional[int]]:
         if not PYAUDIO_AVAILABLE:
             return None, None
-        pa = pyaudio.PyAudio()
-        input_idx = output_idx = None
+        pa = self._get_pa()
         try:
-            try:
-                input_idx = pa.get_default_input_device_info().get("index")
-            except Exception:
-                input_idx = None
-            try:
-                output_idx = pa.get_default_output_device_info().get("index")
-            except Exception:
-                output_idx = None
-        finally:
-            pa.terminate()
+            input_idx = pa.get_default_input_device_info().get("index")
+        except Exception:
+            input_idx = None
+        try:
+            output_idx = pa.get_default_output_device_info().get("index")
+        except Exception:
+            output_idx = None
         return input_idx, output_idx
 
     def render_device_overview(self):
@@ -330,55 +599,68 @@ class TerminalApp:
             print_colored("Please enter a valid number.", Fore.RED)
             return None
 
-    @staticmethod
-    def get_pipewire_nodes():
+    def get_pipewire_nodes(self):
         nodes = {"sinks": [], "sources": []}
-        if shutil.which("wpctl") is None:
+        if self._wpctl_path is None:
             return nodes
+
+        # Stream `wpctl status` line by line and stop reading once the audio
+        # Sinks/Sources sections are done (the graph ends at a blank line)
+        seen_sinks = seen_sources = False
+        finished_early = False
         try:
-            result = subprocess.run(
-                ["wpctl", "status"],
-                capture_output=True,
+            with subprocess.Popen(
+                [self._wpctl_path, "status"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
-                check=True,
-            )
+            ) as proc:
+                current = None
+                for raw_line in proc.stdout:
+                    stripped = raw_line.strip()
+                    if not stripped:
+                        if seen_sinks and seen_sources:
+                            finished_early = True
+                            break
+                        continue
+
+                    if "Sinks:" in stripped:
+                        current = "sinks"
+                        seen_sinks = True
+                        continue
+                    if "Sources:" in stripped:
+                        current = "sources"
+                        seen_sources = True
+                        continue
+                    if stripped.startswith(_TREE_PREFIXES):
+                        # Other sub-sections reset the context
+                        if "Sink endpoints" in stripped or "Source endpoints" in stripped:
+                            current = None
+                        continue
+
+                    if current is not None:
+                        clean = stripped.lstrip("│").strip()
+                        is_default = clean.startswith("*")
+                        if is_default:
+                            clean = clean[1:].strip()
+
+                        match = _NODE_RE.match(clean)
+                        if not match:
+                            continue
+
+                        node_id = int(match.group(1))
+                        name = match.group(2).split("[", 1)[0].strip()
+                        nodes[current].append(
+                            {"id": node_id, "name": name, "default": is_default}
+                        )
+
+                if finished_early:
+                    proc.kill()
         except Exception:
-            return nodes
-
-        current = None
-        for raw_line in result.stdout.splitlines():
-            stripped = raw_line.strip()
-            if not stripped:
-                continue
-
-            if "Sinks:" in stripped:
-                current = "sinks"
-                continue
-            if "Sources:" in stripped:
-                current = "sources"
-                continue
-            if stripped.startswith("├─") or stripped.startswith("└─"):
-                # Other sub-sections reset the context
-                if "Sink endpoints" in stripped or "Source endpoints" in stripped:
-                    current = None
-                continue
-
-            if current in ("sinks", "sources"):
-                clean = stripped.lstrip("│").strip()
-                is_default = clean.startswith("*")
-                if is_default:
-                    clean = clean[1:].strip()
-
-                match = re.match(r"(\d+)\.\s*(.+)", clean)
-                if not match:
-                    continue
-
-                node_id = int(match.group(1))
-                name = match.group(2).split("[", 1)[0].strip()
-                nodes[current].append(
-                    {"id": node_id, "name": name, "default": is_default}
-                )
+            return {"sinks": [], "sources": []}
 
+        if not finished_early and proc.returncode != 0:
+            return {"sinks": [], "sources": []}
         return nodes
 
     def prompt_pipewire_node(
@@ -481,7 +763,7 @@ class TerminalApp:
 
         model_path = self.prompt_model_selection()
         if not model_path:
-            print_colored("No model selected.", Fore.YELLOW)
+            print_colored("No model selected.", Fore.YELLOW, flush=True)
             time.sleep(1.2)
             return
 
@@ -489,22 +771,45 @@ class TerminalApp:
             print_colored(f"Model not found: {model_path}", Fore.RED)
             self.pause()
             return
+        use_rmvpe = input(
+            f"{Fore.YELLOW}Use RMVPE for pitch extraction? (Y/n): {Fore.RESET}"
+        ).strip().lower() in {"", "y", "yes"}
+        _warm_converter(model_path, use_rmvpe)
 
-        input_path = input(
-            f"{Fore.YELLOW}Enter input audio path: {Fore.RESET}"
+        spec = input(
+            f"{Fore.YELLOW}Enter input audio path(s), comma-separated or a glob: {Fore.RESET}"
         ).strip()
-        if not input_path:
-            print_colored("Conversion canceled: no input provided.", Fore.YELLOW)
+        if not spec:
+            print_colored("Conversion canceled: no input provided.", Fore.YELLOW, flush=True)
             time.sleep(1.0)
             return
-        if not os.path.exists(input_path):
-            print_colored(f"Input file not found: {input_path}", Fore.RED)
+        try:
+            input_paths = expand_audio_inputs(spec)
+        except ValidationError as exc:
+            print_colored(str(exc), Fore.RED)
+            self.pause()
+            return
+        missing = [path for path in input_paths if not os.path.exists(path)]
+        if missing:
+            print_colored(f"Input file not found: {', '.join(missing)}", Fore.RED)
             self.pause()
             return
 
-        output_path = input(
-            f"{Fore.YELLOW}Enter output path (default output.wav): {Fore.RESET}"
-        ).strip() or "output.wav"
+        if len(input_paths) == 1:
+            output_path = input(
+                f"{Fore.YELLOW}Enter output path (default output.wav): {Fore.RESET}"
+            ).strip() or "output.wav"
+            jobs = [(input_paths[0], output_path)]
+        else:
+            output_dir = input(
+                f"{Fore.YELLOW}Output directory for {len(input_paths)} files (default converted): {Fore.RESET}"
+            ).strip() or "converted"
+            try:
+                jobs = batch_output_jobs(input_paths, output_dir)
+            except ValidationError as exc:
+                print_colored(str(exc), Fore.RED)
+                self.pause()
+                return
 
         pitch_change = None
         while pitch_change is None:
@@ -528,35 +833,74 @@ class TerminalApp:
             self.pause()
             return
 
-        use_rmvpe = input(
-            f"{Fore.YELLOW}Use RMVPE for pitch extraction? (Y/n): {Fore.RESET}"
-        ).strip().lower() in {"", "y", "yes"}
+        def report(done, total, path, error):
+            if total == 1:
+                if error is not None:
+                    print_colored(f"\n✗ Conversion failed: {error}", Fore.RED)
+            elif error is None:
+                print_colored(f"[{done}/{total}] ✓ {os.path.basename(path)}", Fore.GREEN, flush=True)
+            else:
+                print_colored(f"[{done}/{total}] ✗ {os.path.basename(path)}: {error}", Fore.RED, flush=True)
 
-        print_colored("\nRunning conversion...", Fore.CYAN)
+        print_colored("\nRunning conversion...", Fore.CYAN, flush=True)
         try:
-            converter = VoiceConverter(model_path, use_rmvpe=use_rmvpe)
-            result_path = converter.convert_voice(
-                input_path,
-                output_path,
-                pitch_change=pitch_change,
+            converter = get_converter(model_path, use_rmvpe=use_rmvpe)
+            results = converter.convert_voice_batch(
+                jobs,
+                pitch_shift=pitch_change,
                 index_rate=index_rate,
+                on_progress=report,
             )
+        except Exception as exc:
+            print_colored(f"\n✗ Conversion failed: {exc}", Fore.RED)
+            self.pause()
+            return
+
+        converted = [path for path in results if path is not None]
+        if len(jobs) == 1:
+            if converted:
+                print_colored(
+                    f"\n✓ Conversion complete. Output saved to: {converted[0]}",
+                    Fore.GREEN,
+                    Style.BRIGHT,
+                )
+        else:
             print_colored(
-                f"\n✓ Conversion complete. Output saved to: {result_path}",
-                Fore.GREEN,
+                f"\n✓ Converted {len(converted)}/{len(jobs)} files into {output_dir}",
+                Fore.GREEN if len(converted) == len(jobs) else Fore.YELLOW,
                 Style.BRIGHT,
             )
-        except Exception as exc:
-            print_colored(f"\n✗ Conversion failed: {exc}", Fore.RED)
 
         self.pause()
 
+    def _probe_portaudio(self) -> Tuple[Optional[int], Optional[int]]:
+        """Enumerate PortAudio devices (cached) and return the default device IDs."""
+        self.get_audio_devices()
+        return self.detect_default_devices()
+
+    async def _probe_realtime(self, use_pwcat: bool):
+        """Probe audio endpoints and scan models concurrently.
+
+        Both are I/O bound (a wpctl subprocess or PortAudio host-API probing,
+        and a directory walk), so they run in worker threads. The PortAudio
+        calls stay in one thread since they share a PyAudio instance.
+
+        Returns:
+            PipeWire nodes when use_pwcat, else the default (input, output) IDs
+        """
+        probe = self.get_pipewire_nodes if use_pwcat else self._probe_portaudio
+        devices, _ = await asyncio.gather(
+            asyncio.to_thread(probe),
+            asyncio.to_thread(self.list_available_models),
+        )
+        return devices
+
     def action_real_time_conversion(self):
         clear_screen()
         self.print_header()
-        print_colored("Real-time Conversion Workflow", Fore.CYAN, Style.BRIGHT)
+        print_colored("Real-time Conversion Workflow", Fore.CYAN, Style.BRIGHT, flush=True)
 
-        use_pwcat = shutil.which("pw-cat") is not None
+        use_pwcat = self._pwcat_path is not None
         if not PYAUDIO_AVAILABLE and not use_pwcat:
             print_colored(
                 "PyAudio is not available and pw-cat was not found. Install PyAudio or PipeWire CLI tools first.",
@@ -568,18 +912,21 @@ class TerminalApp:
         pipewire_source_id = None
         pipewire_sink_id = None
 
+        # Device probing (wpctl or PortAudio) overlaps the model scan used later
+        probed = asyncio.run(self._probe_realtime(use_pwcat))
+
         if use_pwcat:
             print_colored(
                 "\n✔ pw-cat detected. Streaming will use PipeWire devices.",
                 Fore.GREEN,
             )
-            nodes = self.get_pipewire_nodes()
+            nodes = probed
             pipewire_source_id = self.prompt_pipewire_node(nodes["sources"], "Source")
             pipewire_sink_id = self.prompt_pipewire_node(nodes["sinks"], "Sink")
             input_device = output_device = 0
         else:
             self.render_device_overview()
-            default_in, default_out = self.detect_default_devices()
+            default_in, default_out = probed
             prompt_in = (
                 f"{Fore.YELLOW}Input device ID "
                 f"(default {default_in if default_in is not None else 'required'}): "
@@ -601,7 +948,7 @@ class TerminalApp:
 
         model_path = self.prompt_model_selection()
         if not model_path:
-            print_colored("No model selected.", Fore.YELLOW)
+            print_colored("No model selected.", Fore.YELLOW, flush=True)
             time.sleep(1.0)
             return
         if not os.path.exists(model_path):
@@ -613,9 +960,9 @@ class TerminalApp:
             f"{Fore.YELLOW}Use RMVPE for pitch extraction? (Y/n): {Fore.RESET}"
         ).strip().lower() in {"", "y", "yes"}
 
-        print_colored("\nStarting real-time conversion...", Fore.CYAN)
+        print_colored("\nStarting real-time conversion...", Fore.CYAN, flush=True)
         try:
-            converter = VoiceConverter(model_path, use_rmvpe=use_rmvpe)
+            converter = get_converter(model_path, use_rmvpe=use_rmvpe)
             converter.real_time_convert(
                 input_device=input_device,
                 output_device=output_device,
@@ -631,11 +978,17 @@ class TerminalApp:
             self.pause()
 
     def action_list_devices(self):
-        clear_screen()
-        self.print_header()
-        print_colored("Audio Devices", Fore.CYAN, Style.BRIGHT)
-        self.render_device_overview()
-        self.pause()
+        while True:
+            clear_screen()
+            self.print_header()
+            print_colored("Audio Devices", Fore.CYAN, Style.BRIGHT)
+            self.render_device_overview()
+            answer = input(
+                f"{Fore.CYAN}Press Enter to return, or r to refresh devices...{Fore.RESET}"
+            ).strip().lower()
+            if answer != "r":
+                break
+            self.refresh_audio_devices()
 
     def action_list_models(self):
         clear_screen()
@@ -650,16 +1003,12 @@ class TerminalApp:
         self.print_header()
         print_colored("System Diagnostics", Fore.CYAN, Style.BRIGHT)
 
-        try:
-            import torch
-        except ImportError:
-            torch = None
-
         print_colored("\nCUDA Information:", Fore.YELLOW, Style.BRIGHT)
-        if torch and torch.cuda.is_available():
+        gpu = _cuda_device_info()
+        if gpu is not None:
+            gpu_name, vram = gpu
             print_colored("  ✓ CUDA available", Fore.GREEN)
-            print_colored(f"  ✓ GPU: {torch.cuda.get_device_name(0)}", Fore.GREEN)
-            vram = torch.cuda.get_device_properties(0).total_memory / (1024**3)
+            print_colored(f"  ✓ GPU: {gpu_name}", Fore.GREEN)
             print_colored(f"  ✓ VRAM: {vram:.1f} GB", Fore.GREEN)
         else:
             print_colored("  ✗ CUDA unavailable or torch missing", Fore.RED)
@@ -676,8 +1025,7 @@ class TerminalApp:
             print_colored("  ✗ PyAudio not installed", Fore.RED)
 
         print_colored("\nModels:", Fore.YELLOW, Style.BRIGHT)
-        models = self.list_available_models()
-        print_colored(f"  ✓ Discovered models: {len(models)}", Fore.GREEN)
+        print_colored(f"  ✓ Discovered models: {self.count_available_models()}", Fore.GREEN)
 
         print_colored("\nPaths:", Fore.YELLOW, Style.BRIGHT)
         print_colored(f"  • Working directory: {os.getcwd()}", Fore.CYAN)
@@ -686,7 +1034,10 @@ class TerminalApp:
         self.pause()
 
     def action_download_models(self):
-        submenu = MenuScreen(
+        self.navigate(self._downloads_menu)
+
+    def _build_downloads_menu(self) -> MenuScreen:
+        return MenuScreen(
             title="Model Downloads",
             subtitle="Choose which helper script to run.",
             show_back=True,
@@ -713,15 +1064,14 @@ class TerminalApp:
                 ),
             ],
         )
-        self.navigate(submenu)
 
     def run_download_script(self, command: str):
         clear_screen()
         self.print_header()
         print_colored(f"Running `{command}`", Fore.CYAN, Style.BRIGHT)
-        print_colored("Output will stream below. Press Ctrl+C to abort.\n", Fore.YELLOW)
+        print_colored("Output will stream below. Press Ctrl+C to abort.\n", Fore.YELLOW, flush=True)
         try:
-            exit_code = os.system(command)
+            exit_code = self._stream_command(command)
             if exit_code == 0:
                 print_colored("\n✓ Download completed successfully.", Fore.GREEN)
             else:
@@ -731,11 +1081,51 @@ class TerminalApp:
         except KeyboardInterrupt:
             print_colored("\nDownload canceled by user.", Fore.YELLOW)
         finally:
+            # Downloads may land in directories the cache has not scanned yet
+            _MODEL_CACHE.clear()
+            # Converters loaded before the download lack the new HuBERT/RMVPE files
+            clear_converter_cache()
             self.pause()
             # After script finishes, return to previous menu
             if self.screen_stack and self.screen_stack[-1].title == "Model Downloads":
                 self.go_back()
 
+    @staticmethod
+    def _stream_command(command: str) -> int:
+        """Run command (no intermediate shell), relaying its output as it arrives.
+
+        The child runs in its own session so Ctrl+C can stop the whole
+        process tree it spawned (curl, wget, ...), not just the script.
+        """
+        proc = subprocess.Popen(
+            shlex.split(command),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+        try:
+            # Relay raw chunks rather than lines so \r progress bars keep updating
+            out = getattr(sys.stdout, "buffer", None)
+            while True:
+                chunk = proc.stdout.read1(65536)
+                if not chunk:
+                    break
+                if out is not None:
+                    out.write(chunk)
+                else:
+                    sys.stdout.write(chunk.decode(errors="replace"))
+                sys.stdout.flush()
+            return proc.wait()
+        except KeyboardInterrupt:
+            if hasattr(os, "killpg"):
+                os.killpg(proc.pid, signal.SIGTERM)
+            else:
+                proc.terminate()
+            proc.wait()
+            raise
+        finally:
+            proc.stdout.close()
+
     def action_help(self):
         clear_screen()
         self.print_header()
@@ -1,50 +1,70 @@
 """
 Utility functions for RWC
 """
-import os
-import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+# Hugging Face repos fetched by download_models(): (repo id, models/ subdirectory, description)
+MODEL_REPOS = (
+    ("fishaudio/hubert_base.pt", "hubert_base", "HuBERT base model (feature extraction)"),
+    ("RinaChanNAI/VocoderModels", "pretrained", "vocoder models (audio synthesis)"),
+    ("Rejekts/uvr-models", "uvr5_weights", "UVR5 vocal separators (preprocessing)"),
+)
 
-def download_models():
+# Parallel file transfers within each repo
+DOWNLOAD_WORKERS_PER_REPO = 8
+
+
+def download_models(models_dir="./models"):
     """
-    Download required RVC models using huggingface-cli
+    Download required RVC models from the Hugging Face Hub
+
+    All repos are fetched concurrently in-process with snapshot_download(),
+    each with several parallel file transfers. Files already present in
+    the target directory are not downloaded again.
+
+    Args:
+        models_dir: Directory to download the models into
+
+    Returns:
+        True if every repo was downloaded
     """
+    from huggingface_hub import snapshot_download
+
     print("Downloading required RVC models...")
-    
+
     # Create models directory
-    models_dir = Path("./models")
+    models_dir = Path(models_dir)
     models_dir.mkdir(exist_ok=True)
-    
-    # Install huggingface_hub if not already installed
-    try:
-        import huggingface_hub
-    except ImportError:
-        subprocess.run([os.sys.executable, "-m", "pip", "install", "huggingface-hub"])
-    
-    # Download HuBERT base model (used for feature extraction)
-    print("Downloading HuBERT base model...")
-    subprocess.run([
-        "huggingface-cli", "download", "fishaudio/hubert_base.pt",
-        "--local-dir", str(models_dir / "hubert_base")
-    ])
-    
-    # Download vocoder models (used for audio synthesis)
-    print("Downloading vocoder models...")
-    subprocess.run([
-        "huggingface-cli", "download", "RinaChanNAI/VocoderModels",
-        "--local-dir", str(models_dir / "pretrained")
-    ])
-    
-    # Download UVR5 vocal separators (used for audio preprocessing)
-    print("Downloading UVR5 vocal separators...")
-    subprocess.run([
-        "huggingface-cli", "download", "Rejekts/uvr-models",
-        "--local-dir", str(models_dir / "uvr5_weights")
-    ])
-    
+
+    failed = 0
+    with ThreadPoolExecutor(max_workers=len(MODEL_REPOS)) as pool:
+        futures = {}
+        for repo_id, subdir, description in MODEL_REPOS:
+            print(f"Downloading {description}...")
+            future = pool.submit(
+                snapshot_download,
+                repo_id=repo_id,
+                local_dir=str(models_dir / subdir),
+                max_workers=DOWNLOAD_WORKERS_PER_REPO,
+            )
+            futures[future] = (repo_id, description)
+
+        for future in as_completed(futures):
+            repo_id, description = futures[future]
+            try:
+                future.result()
+                print(f"Downloaded {description}")
+            except Exception as e:
+                failed += 1
+                print(f"Failed to download {repo_id}: {e}")
+
+    if failed:
+        print(f"Model download finished with {failed} failed repo(s)")
+        return False
     print("Model download complete!")
+    return True
 
 
 if __name__ == "__main__":
-    download_models()
\ No newline at end of file
+    download_models()
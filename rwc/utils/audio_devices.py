@@ -1,46 +1,103 @@
 """
 Audio device listing utility for RWC
 """
+from typing import List, NamedTuple, Sequence
+
 import pyaudio
 
 
+class AudioDeviceInfo(NamedTuple):
+    """One PortAudio device as reported at enumeration time"""
+    index: int
+    name: str
+    kind: str  # "Input" if the device can record, otherwise "Output"
+    sample_rate: float
+    input_channels: int
+    output_channels: int
+    is_default_input: bool = False
+    is_default_output: bool = False
+
+
+def _default_index(query) -> int:
+    """Index of a default device, or -1 if PortAudio reports none"""
+    try:
+        return query()['index']
+    except OSError:
+        return -1
+
+
+def enumerate_audio_devices(pa=None) -> List[AudioDeviceInfo]:
+    """
+    Enumerate audio devices without printing anything
+
+    Args:
+        pa: Existing PyAudio instance to query; a temporary one is created
+            (and terminated) when omitted
+
+    Returns:
+        Devices in PortAudio index order
+    """
+    owned = pa is None
+    if owned:
+        pa = pyaudio.PyAudio()
+    try:
+        default_input = _default_index(pa.get_default_input_device_info)
+        default_output = _default_index(pa.get_default_output_device_info)
+        devices = []
+        for i in range(pa.get_device_count()):
+            info = pa.get_device_info_by_index(i)
+            devices.append(AudioDeviceInfo(
+                index=i,
+                name=info['name'],
+                kind="Input" if info['maxInputChannels'] > 0 else "Output",
+                sample_rate=info['defaultSampleRate'],
+                input_channels=info['maxInputChannels'],
+                output_channels=info['maxOutputChannels'],
+                is_default_input=i == default_input,
+                is_default_output=i == default_output,
+            ))
+        return devices
+    finally:
+        if owned:
+            pa.terminate()
+
+
+def format_audio_devices(devices: Sequence[AudioDeviceInfo]) -> str:
+    """
+    Render a device listing as text
+
+    Args:
+        devices: Devices from enumerate_audio_devices()
+
+    Returns:
+        Listing with one block per device followed by the default devices
+    """
+    lines = ["Available Audio Devices:", "=" * 50]
+    for dev in devices:
+        lines.append(f"Device {dev.index}: {dev.name}")
+        lines.append(f"  - Type: {dev.kind}")
+        lines.append(f"  - Sample rate: {dev.sample_rate:.0f} Hz")
+        if dev.input_channels > 0:
+            lines.append(f"  - Max input channels: {dev.input_channels}")
+        if dev.output_channels > 0:
+            lines.append(f"  - Max output channels: {dev.output_channels}")
+        lines.append("")
+
+    for label, attr in (("input", "is_default_input"), ("output", "is_default_output")):
+        default = next((dev for dev in devices if getattr(dev, attr)), None)
+        if default is None:
+            lines.append(f"No default {label} device found")
+        else:
+            lines.append(f"Default {label} device: {default.name} (ID: {default.index})")
+    return "\n".join(lines) + "\n"
+
+
 def list_audio_devices():
     """
     List all audio devices with their properties
     """
-    p = pyaudio.PyAudio()
-    
-    print("Available Audio Devices:")
-    print("=" * 50)
-    
-    for i in range(p.get_device_count()):
-        info = p.get_device_info_by_index(i)
-        device_type = "Input" if info['maxInputChannels'] > 0 else "Output"
-        
-        print(f"Device {i}: {info['name']}")
-        print(f"  - Type: {device_type}")
-        print(f"  - Sample rate: {info['defaultSampleRate']:.0f} Hz")
-        if info['maxInputChannels'] > 0:
-            print(f"  - Max input channels: {info['maxInputChannels']}")
-        if info['maxOutputChannels'] > 0:
-            print(f"  - Max output channels: {info['maxOutputChannels']}")
-        print()
-    
-    # Show default devices
-    try:
-        default_input = p.get_default_input_device_info()
-        print(f"Default input device: {default_input['name']} (ID: {default_input['index']})")
-    except OSError:
-        print("No default input device found")
-    
-    try:
-        default_output = p.get_default_output_device_info()
-        print(f"Default output device: {default_output['name']} (ID: {default_output['index']})")
-    except OSError:
-        print("No default output device found")
-    
-    p.terminate()
+    print(format_audio_devices(enumerate_audio_devices()), end="")
 
 
 if __name__ == "__main__":
-    list_audio_devices()
\ No newline at end of file
+    list_audio_devices()
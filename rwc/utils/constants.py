@@ -2,7 +2,7 @@
 Constants for RWC
 Centralized constants to avoid magic numbers throughout the codebase
 """
-from typing import Set
+from typing import Set, Tuple
 
 # Audio Processing Constants
 DEFAULT_SAMPLE_RATE: int = 48000  # Hz
@@ -10,6 +10,8 @@ DEFAULT_CHANNELS: int = 2  # Stereo
 DEFAULT_CHUNK_SIZE: int = 1024  # Buffer size
 AUDIO_FORMAT_FLOAT32: str = 'float32'
 BYTES_PER_SAMPLE_INT16: int = 2  # s16le format
+DEFAULT_CALLBACK_BLOCKSIZE: int = 256  # PortAudio callback block (~5.3ms @ 48kHz)
+CALLBACK_RING_BLOCKS: int = 4  # Ring capacity between audio callbacks and the pipeline, in blocks
 
 # Valid sample rates
 VALID_SAMPLE_RATES: Set[int] = {
@@ -52,6 +54,11 @@ DEFAULT_INDEX_RATE: float = 0.75
 MIN_INDEX_RATE: float = 0.0
 MAX_INDEX_RATE: float = 1.0
 
+# Pitch (F0) Extraction
+PITCH_METHODS: Tuple[str, ...] = ('auto', 'rmvpe', 'fcpe', 'crepe')
+DEFAULT_PITCH_METHOD: str = 'auto'
+REALTIME_PITCH_BUDGET_MS: float = 100.0  # 'auto' picks FCPE below this chunk duration
+
 # Audio Device Limits
 MAX_AUDIO_DEVICES: int = 100
 
@@ -2,7 +2,10 @@
 Logging configuration for RWC
 Provides centralized logging setup with proper formatters and handlers
 """
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import Optional
@@ -113,6 +116,58 @@ def get_logger(name: str) -> logging.Logger:
     return logger
 
 
+# Real-time audio path logger (records handed off to a background thread)
+STREAM_LOGGER_NAME = 'rwc.stream'
+_stream_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def get_stream_logger(name: Optional[str] = None) -> logging.Logger:
+    """
+    Get a logger for the real-time audio path.
+
+    Records are put on a queue by a QueueHandler and written by a
+    QueueListener thread, so audio threads never block on console I/O.
+    The level is WARNING unless RWC_DEBUG=1 is set in the environment.
+
+    Args:
+        name: Optional module name; its last component becomes a child
+              of the 'rwc.stream' logger
+
+    Returns:
+        Logger instance
+
+    Example:
+        >>> logger = get_stream_logger(__name__)
+        >>> logger.debug("Chunk %d processed", 42)
+    """
+    global _stream_listener
+
+    root = logging.getLogger(STREAM_LOGGER_NAME)
+    if _stream_listener is None:
+        debug = os.getenv('RWC_DEBUG') == '1'
+        root.setLevel(logging.DEBUG if debug else logging.WARNING)
+        root.handlers.clear()
+        root.propagate = False
+
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(logging.Formatter(
+            fmt='%(asctime)s - %(levelname)s - %(message)s',
+            datefmt='%H:%M:%S'
+        ))
+
+        log_queue: queue.Queue = queue.Queue(-1)
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
+        _stream_listener = logging.handlers.QueueListener(
+            log_queue, console_handler, respect_handler_level=True
+        )
+        _stream_listener.start()
+        atexit.register(_stream_listener.stop)
+
+    if name is None:
+        return root
+    return root.getChild(name.rsplit('.', 1)[-1])
+
+
 # Create default logger for the package
 default_logger = setup_logging('rwc')
 
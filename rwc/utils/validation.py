@@ -1,7 +1,10 @@
 """Input validation utilities for RWC"""
+import glob
 import os
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
+
+from rwc.utils.constants import PITCH_METHODS
 
 # Supported audio formats
 SUPPORTED_AUDIO_FORMATS = {
@@ -65,6 +68,70 @@ def validate_audio_file_path(file_path: str, must_exist: bool = True) -> Path:
     return path
 
 
+def expand_audio_inputs(spec: str) -> List[str]:
+    """
+    Expand a comma-separated list of audio paths and glob patterns.
+
+    Plain paths are kept as given so the caller reports missing files;
+    glob matches are sorted and limited to supported audio formats.
+
+    Args:
+        spec: Input specification, e.g. "take1.wav, vocals/*.flac"
+
+    Returns:
+        Paths in the order given, without duplicates
+
+    Raises:
+        ValidationError: If spec is empty or a pattern matches no audio files
+    """
+    paths: List[str] = []
+    for item in (part.strip() for part in spec.split(",")):
+        if not item:
+            continue
+        if any(c in item for c in "*?["):
+            matches = [
+                match for match in sorted(glob.glob(item))
+                if os.path.splitext(match)[1].lower() in SUPPORTED_AUDIO_FORMATS
+            ]
+            if not matches:
+                raise ValidationError(f"No audio files match: {item}")
+            paths.extend(matches)
+        else:
+            paths.append(item)
+
+    if not paths:
+        raise ValidationError("No input files specified")
+    return list(dict.fromkeys(paths))
+
+
+def batch_output_jobs(input_paths: List[str], output_dir: str) -> List[Tuple[str, str]]:
+    """
+    Pair each input with <output_dir>/<name>_converted.wav.
+
+    Args:
+        input_paths: Input audio paths, e.g. from expand_audio_inputs()
+        output_dir: Directory for the converted files
+
+    Returns:
+        (input path, output path) pairs in input order
+
+    Raises:
+        ValidationError: If two inputs would be written to the same output file
+    """
+    jobs: List[Tuple[str, str]] = []
+    sources: dict = {}
+    for path in input_paths:
+        name = os.path.splitext(os.path.basename(path))[0] + "_converted.wav"
+        output_path = os.path.join(output_dir, name)
+        if output_path in sources:
+            raise ValidationError(
+                f"{sources[output_path]} and {path} would both be written to {output_path}"
+            )
+        sources[output_path] = path
+        jobs.append((path, output_path))
+    return jobs
+
+
 def validate_model_path(model_path: str) -> Path:
     """
     Validate model file path.
@@ -146,6 +213,33 @@ def validate_index_rate(rate: float) -> float:
     return rate
 
 
+def validate_pitch_method(method: str) -> str:
+    """
+    Validate pitch extraction method name.
+
+    Args:
+        method: Pitch method ('auto', 'rmvpe', 'fcpe' or 'crepe')
+
+    Returns:
+        Normalized (lowercase) method name
+
+    Raises:
+        ValidationError: If method is unknown
+    """
+    if not isinstance(method, str):
+        raise ValidationError(f"Pitch method must be string, got {type(method).__name__}")
+
+    method = method.strip().lower()
+
+    if method not in PITCH_METHODS:
+        raise ValidationError(
+            f"Invalid pitch method: {method}. "
+            f"Valid methods: {', '.join(PITCH_METHODS)}"
+        )
+
+    return method
+
+
 def validate_audio_device_id(device_id: int, max_devices: int = 100) -> int:
     """
     Validate audio device ID.
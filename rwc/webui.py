@@ -7,7 +7,7 @@ import gradio as gr
 import torch
 import threading
 import time
-from rwc.core import VoiceConverter
+from rwc.core import get_converter
 
 def convert_voice_interface(audio_input, model_path, pitch_change, index_rate, use_rmvpe):
     """
@@ -23,8 +23,8 @@ def convert_voice_interface(audio_input, model_path, pitch_change, index_rate, u
         # Create output path
         output_path = audio_input.replace('.wav', '_converted.wav')
         
-        # Initialize converter and perform conversion
-        converter = VoiceConverter(model_path, use_rmvpe=bool(use_rmvpe))
+        # Reuse a loaded converter for this model and perform conversion
+        converter = get_converter(model_path, use_rmvpe=bool(use_rmvpe))
         result_path = converter.convert_voice(
             audio_input,
             output_path,
@@ -0,0 +1,57 @@
+"""Tests for audio device enumeration"""
+import pytest
+
+pytest.importorskip("pyaudio")
+
+from rwc.utils.audio_devices import (  # noqa: E402
+    AudioDeviceInfo,
+    enumerate_audio_devices,
+    format_audio_devices,
+)
+
+
+class FakePyAudio:
+    """Two-device PortAudio stand-in without a default output"""
+
+    terminated = False
+
+    def get_device_count(self):
+        return 2
+
+    def get_device_info_by_index(self, idx):
+        return [
+            {"name": "Mic", "maxInputChannels": 1, "maxOutputChannels": 0, "defaultSampleRate": 48000.0},
+            {"name": "Speakers", "maxInputChannels": 0, "maxOutputChannels": 2, "defaultSampleRate": 44100.0},
+        ][idx]
+
+    def get_default_input_device_info(self):
+        return {"index": 0}
+
+    def get_default_output_device_info(self):
+        raise OSError("no output")
+
+    def terminate(self):
+        self.terminated = True
+
+
+class TestAudioDevices:
+    """Test enumeration and formatting"""
+
+    def test_enumerate_uses_given_session(self):
+        """Should return device records and leave a passed-in session open"""
+        pa = FakePyAudio()
+        devices = enumerate_audio_devices(pa)
+
+        assert devices == [
+            AudioDeviceInfo(0, "Mic", "Input", 48000.0, 1, 0, is_default_input=True),
+            AudioDeviceInfo(1, "Speakers", "Output", 44100.0, 0, 2),
+        ]
+        assert not pa.terminated
+
+    def test_format(self):
+        """Should render each device and the default devices"""
+        text = format_audio_devices(enumerate_audio_devices(FakePyAudio()))
+
+        assert "Device 0: Mic\n  - Type: Input\n  - Sample rate: 48000 Hz\n" in text
+        assert "  - Max output channels: 2\n" in text
+        assert text.endswith("Default input device: Mic (ID: 0)\nNo default output device found\n")
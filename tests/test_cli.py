@@ -157,6 +157,14 @@ class TestCLIRealtime:
 
         assert result.exit_code == 0
         assert '--model' in result.output
+        assert '--blocksize' in result.output
+
+    def test_realtime_rejects_blocksize(self, mock_model_file):
+        """Should reject a block size outside the supported range"""
+        runner = CliRunner()
+        result = runner.invoke(cli, ['real-time', '-m', str(mock_model_file), '--blocksize', '16'])
+
+        assert 'Block size must be between 64 and 8192' in result.output
 
 
 class TestCLIDownloadModels:
@@ -1,8 +1,9 @@
 """Tests for voice converter core functionality"""
+import os
 import pytest
 import numpy as np
 from pathlib import Path
-from rwc.core import VoiceConverter
+from rwc.core import VoiceConverter, _resolve_model, clear_converter_cache, get_converter
 from rwc.utils.validation import ValidationError
 
 
@@ -28,6 +29,115 @@ class TestVoiceConverter:
         assert converter.model_path == str(nonexistent)
 
 
+class TestConverterCache:
+    """Test the shared converter cache"""
+
+    def test_reuses_loaded_converter(self, mock_model_file):
+        """Should load each (model, RMVPE) combination once"""
+        clear_converter_cache()
+        try:
+            first = get_converter(str(mock_model_file), use_rmvpe=False)
+            assert get_converter(str(mock_model_file), use_rmvpe=False) is first
+            assert get_converter(str(mock_model_file), use_rmvpe=None) is not first
+        finally:
+            clear_converter_cache()
+
+    def test_quiet_load(self, mock_model_file, capsys):
+        """Should not print loading messages for a quiet (background) load"""
+        clear_converter_cache()
+        try:
+            converter = get_converter(str(mock_model_file), use_rmvpe=False, verbose=False)
+            assert capsys.readouterr().out == ""
+            assert get_converter(str(mock_model_file), use_rmvpe=False) is converter
+        finally:
+            clear_converter_cache()
+
+
+class TestRealtimePipelineReuse:
+    """Test the realtime pipeline kept between runs"""
+
+    def test_reused_until_model_settings_change(self, mock_model_file):
+        """Should keep the pipeline for pitch/index changes and rebuild otherwise"""
+        from rwc.streaming import BufferConfig, ConversionConfig
+
+        converter = VoiceConverter(str(mock_model_file), use_rmvpe=False)
+        buffer_config = BufferConfig(chunk_size=4096)
+        first = converter._realtime_pipeline(
+            ConversionConfig(model_path=str(mock_model_file), pitch_shift=0), buffer_config
+        )
+        try:
+            again = converter._realtime_pipeline(
+                ConversionConfig(model_path=str(mock_model_file), pitch_shift=5), buffer_config
+            )
+            assert again is first
+            assert first.backend.config.pitch_shift == 5
+
+            rebuilt = converter._realtime_pipeline(
+                ConversionConfig(model_path=str(mock_model_file), chunk_size=8192),
+                BufferConfig(chunk_size=8192),
+            )
+            assert rebuilt is not first
+        finally:
+            converter.release_realtime()
+        assert converter._rt_pipeline is None
+
+
+class TestPitchMethodSelection:
+    """Test pitch method selection"""
+
+    def test_explicit_pitch_method(self, mock_model_file):
+        """Should keep an explicitly requested pitch method"""
+        converter = VoiceConverter(str(mock_model_file), use_rmvpe=False, pitch_method='crepe')
+        assert converter.pitch_method == 'crepe'
+
+    def test_auto_without_chunk_size(self, mock_model_file):
+        """Should not pick FCPE for file conversion"""
+        converter = VoiceConverter(str(mock_model_file), use_rmvpe=False, pitch_method='auto')
+        assert converter.pitch_method == 'crepe'
+
+    def test_auto_selects_fcpe_for_small_chunks(self, mock_model_file):
+        """Should select FCPE when the chunk is under the latency budget"""
+        converter = VoiceConverter(str(mock_model_file), use_rmvpe=False, pitch_method='auto', chunk_size=4096)
+        assert converter._select_pitch_method('auto', 4096) == 'fcpe'
+        assert converter._select_pitch_method('auto', 8192) == 'crepe'
+
+    def test_invalid_pitch_method(self, mock_model_file):
+        """Should reject unknown pitch methods"""
+        with pytest.raises(ValidationError):
+            VoiceConverter(str(mock_model_file), use_rmvpe=False, pitch_method='yin')
+
+
+class TestModelPathResolution:
+    """Test cached model path resolution"""
+
+    def test_resolve_existing_model(self, mock_model_file):
+        """Should return the path for an existing model file"""
+        assert _resolve_model(str(mock_model_file)) == str(mock_model_file)
+
+    def test_resolve_missing_model(self, temp_dir):
+        """Should return None for a missing model file"""
+        assert _resolve_model(str(temp_dir / "missing.pt")) is None
+
+    def test_resolve_is_cached(self, temp_dir, monkeypatch):
+        """Should only stat an existing path once"""
+        model = temp_dir / "cached.pt"
+        model.touch()
+        stats = []
+        real_exists = os.path.exists
+        monkeypatch.setattr(os.path, "exists", lambda path: stats.append(path) or real_exists(path))
+
+        _resolve_model(str(model))
+        _resolve_model(str(model))
+        assert stats == [str(model)]
+
+    def test_resolve_finds_downloaded_model(self, temp_dir):
+        """Should find a model that appears after a failed lookup"""
+        model = temp_dir / "rmvpe.pt"
+        assert _resolve_model(str(model)) is None
+        model.touch()
+        assert _resolve_model(str(model)) == str(model)
+
+
 class TestConvertVoice:
     """Test convert_voice method"""
 
@@ -79,6 +189,39 @@ class TestConvertVoice:
         pass
 
 
+class TestConvertVoiceBatch:
+    """Test multi-file conversion"""
+
+    def test_continues_after_failure(self, mock_model_file, temp_dir, monkeypatch):
+        """Should convert every file, reporting and skipping failures"""
+        converter = VoiceConverter(str(mock_model_file), use_rmvpe=False)
+
+        def convert_voice(input_audio, output_audio, **kwargs):
+            if input_audio == "bad.wav":
+                raise RuntimeError("boom")
+            return Path(output_audio)
+
+        monkeypatch.setattr(converter, 'convert_voice', convert_voice)
+        progress = []
+        jobs = [("a.wav", temp_dir / "a_out.wav"), ("bad.wav", temp_dir / "bad_out.wav"),
+                ("c.wav", temp_dir / "c_out.wav")]
+
+        results = converter.convert_voice_batch(
+            jobs, on_progress=lambda done, total, path, error: progress.append((done, total, path, error is None))
+        )
+
+        assert results == [temp_dir / "a_out.wav", None, temp_dir / "c_out.wav"]
+        assert progress == [(1, 3, "a.wav", True), (2, 3, "bad.wav", False), (3, 3, "c.wav", True)]
+
+    def test_rejects_parameters_once(self, mock_model_file, monkeypatch):
+        """Should validate parameters before converting any file"""
+        converter = VoiceConverter(str(mock_model_file), use_rmvpe=False)
+        monkeypatch.setattr(converter, 'convert_voice', lambda *a, **k: pytest.fail("converted"))
+
+        with pytest.raises(ValidationError):
+            converter.convert_voice_batch([("a.wav", "a_out.wav")], pitch_shift=30)
+
+
 # NOTE: The following test classes have been removed as of Nov 2025
 # Feature extraction, pitch extraction, and RVC inference are now handled by ultimate-rvc
 # Previous test classes:
@@ -1,11 +1,13 @@
 """Tests for logging configuration"""
 import pytest
 import logging
+import logging.handlers
 import os
 from pathlib import Path
 from rwc.utils.logging_config import (
     setup_logging,
     get_logger,
+    get_stream_logger,
     log_function_call,
     log_performance,
     log_error_with_context,
@@ -98,6 +100,30 @@ class TestGetLogger:
         assert logger.name == 'rwc.core.converter'
 
 
+class TestStreamLogger:
+    """Test the queued real-time path logger"""
+
+    def test_stream_logger_uses_queue_handler(self):
+        """Should hand records to a QueueHandler instead of writing directly"""
+        logger = get_stream_logger()
+        assert logger.name == 'rwc.stream'
+        assert any(isinstance(h, logging.handlers.QueueHandler) for h in logger.handlers)
+        assert logger.propagate is False
+
+    def test_stream_logger_child_name(self):
+        """Should name children after the last module component"""
+        logger = get_stream_logger('rwc.streaming.pipeline')
+        assert logger.name == 'rwc.stream.pipeline'
+
+    def test_stream_logger_quiet_by_default(self):
+        """Should suppress per-chunk debug/info output unless RWC_DEBUG=1"""
+        if os.getenv('RWC_DEBUG') == '1':
+            pytest.skip("RWC_DEBUG enabled")
+        logger = get_stream_logger('rwc.core')
+        assert not logger.isEnabledFor(logging.INFO)
+        assert logger.isEnabledFor(logging.WARNING)
+
+
 class TestLoggingHelpers:
     """Test helper functions"""
 
@@ -2,6 +2,7 @@
 Tests for real-time streaming voice conversion module
 """
 
+import sys
 import pytest
 import numpy as np
 import tempfile
@@ -60,6 +61,8 @@ def mock_backend():
     backend.metrics = ConversionMetrics()
     backend.convert_chunk.return_value = np.zeros(4096, dtype=np.float32)
     backend.get_latency_estimate_ms.return_value = 500.0
+    backend.max_in_flight = 1
+    backend.config = ConversionConfig(model_path="test.pth")
     return backend
 
 
@@ -129,6 +132,20 @@ class TestBufferManager:
         assert context2 is not None
         assert len(context2) == 1024  # 1 chunk of context
 
+    def test_context_wraparound_order(self):
+        """Test context stays chronological once the scratch wraps"""
+        config = BufferConfig(chunk_size=256, context_chunks=2)
+        buffer_mgr = BufferManager(config)
+
+        contexts = []
+        for value in range(4):
+            buffer_mgr.write_input(np.full(256, value, dtype=np.float32))
+            contexts.append(buffer_mgr.read_chunk_for_processing()[1])
+
+        np.testing.assert_array_equal(contexts[2][::256], [0.0, 1.0])
+        np.testing.assert_array_equal(contexts[3][::256], [1.0, 2.0])
+        assert buffer_mgr.get_buffer_health()['context_chunks'] == 2
+
     def test_write_and_read_output(self, buffer_config):
         """Test output buffer operations"""
         buffer_mgr = BufferManager(buffer_config)
@@ -145,6 +162,102 @@ class TestBufferManager:
         assert len(output) == 4096
         assert len(buffer_mgr.output_buffer) == 0
 
+    def test_output_crossfade(self, buffer_config):
+        """Test linear crossfade between consecutive output chunks"""
+        buffer_mgr = BufferManager(buffer_config)
+        n = buffer_mgr.crossfade_samples
+
+        buffer_mgr.write_output(np.ones(4096, dtype=np.float32))
+        buffer_mgr.write_output(np.zeros(4096, dtype=np.float32))
+        buffer_mgr.read_output(4096)
+        second = buffer_mgr.read_output(4096)
+
+        np.testing.assert_allclose(second[:n], np.linspace(1.0, 0.0, n), atol=1e-6)
+        assert np.all(second[n:] == 0.0)
+
+    def test_write_output_batch(self, buffer_config):
+        """Test batch writes crossfade only the head and keep the last tail"""
+        buffer_mgr = BufferManager(buffer_config)
+        n = buffer_mgr.crossfade_samples
+
+        buffer_mgr.write_output(np.ones(4096, dtype=np.float32))
+        pieces = [np.zeros(4096, dtype=np.float32), np.full(4096, 0.5, dtype=np.float32)]
+        buffer_mgr.write_output_batch(pieces)
+
+        assert len(buffer_mgr.output_buffer) == 3
+        assert buffer_mgr.total_samples_output == 3 * 4096
+        np.testing.assert_allclose(pieces[0][:n], np.linspace(1.0, 0.0, n), atol=1e-6)
+        assert np.all(pieces[1] == 0.5)  # No seam inside a batch
+        assert np.all(buffer_mgr.last_chunk_tail == 0.5)
+
+    def test_write_output_batch_overflow(self):
+        """Test batch writes into a full output deque drop the oldest chunks"""
+        buffer_mgr = BufferManager(BufferConfig(chunk_size=1000))
+        maxlen = buffer_mgr.output_buffer.maxlen
+        for _ in range(maxlen - 1):
+            buffer_mgr.write_output(np.full(1000, 0.1, dtype=np.float32))
+
+        buffer_mgr.write_output_batch([np.ones(1000, dtype=np.float32) for _ in range(3)], crossfade=False)
+
+        assert len(buffer_mgr.output_buffer) == maxlen
+        assert buffer_mgr._output_samples_dropped == 2000
+        reads = [buffer_mgr.read_output(1000).copy() for _ in range(maxlen)]
+        assert np.all(np.concatenate(reads[-3:]) == 1.0)
+        assert buffer_mgr.read_output(1000) is None
+
+    def test_silent_output_clears_crossfade_tail(self):
+        """Test silence clears the crossfade tail"""
+        buffer_mgr = BufferManager(BufferConfig(chunk_size=1000))
+        buffer_mgr.write_output(np.full(1000, 0.5, dtype=np.float32))
+        assert buffer_mgr.last_chunk_tail is not None
+
+        buffer_mgr.write_output(np.zeros(1000, dtype=np.float32))
+        assert buffer_mgr.last_chunk_tail is None
+        assert len(buffer_mgr.output_buffer) == 2
+
+        # Speech resumes without a blend against the silent tail
+        buffer_mgr.write_output(np.ones(1000, dtype=np.float32))
+        assert np.all(buffer_mgr.output_buffer[-1] == 1.0)
+
+    def test_output_pool_recycles_buffers(self, buffer_config):
+        """Test pooled output buffers return to the pool after playback reads"""
+        buffer_mgr = BufferManager(buffer_config)
+
+        buf = buffer_mgr.acquire_output_buffer()
+        assert len(buf) == buffer_config.chunk_size
+        buf[:] = 0.25
+        buffer_mgr.write_output(buf)
+        free_before = buffer_mgr._free_buffers.qsize()
+
+        # Buffer is recycled once playback has consumed all of it
+        buffer_mgr.read_output(buffer_config.chunk_size // 2)
+        assert buffer_mgr._free_buffers.qsize() == free_before
+        output = buffer_mgr.read_output(buffer_config.chunk_size // 2)
+        assert buffer_mgr._free_buffers.qsize() == free_before + 1
+        assert np.all(output == 0.25)
+
+    def test_output_pool_fallback_when_drained(self, buffer_config):
+        """Test acquire falls back to fresh allocation when the pool is empty"""
+        buffer_mgr = BufferManager(buffer_config)
+        held = [buffer_mgr.acquire_output_buffer() for _ in range(len(buffer_mgr._pool))]
+
+        extra = buffer_mgr.acquire_output_buffer()
+        assert len(extra) == buffer_config.chunk_size
+        assert all(extra is not buf for buf in held)
+
+    def test_read_output_spans_chunks(self):
+        """Test playback reads keep leftovers and span chunk boundaries"""
+        buffer_mgr = BufferManager(BufferConfig(chunk_size=1000))
+        for value in range(3):
+            buffer_mgr.write_output(np.full(1000, value, dtype=np.float32), crossfade=False)
+
+        reads = [buffer_mgr.read_output(768).copy() for _ in range(3)]
+        np.testing.assert_array_equal(np.concatenate(reads), np.repeat([0.0, 1.0, 2.0], 1000)[:2304])
+
+        # Only 696 samples left - not enough for another full read
+        assert buffer_mgr.read_output(768) is None
+        assert len(buffer_mgr.read_output(696)) == 696
+
     def test_read_output_when_empty(self, buffer_config):
         """Test reading from empty output buffer"""
         buffer_mgr = BufferManager(buffer_config)
@@ -152,6 +265,26 @@ class TestBufferManager:
         output = buffer_mgr.read_output(4096)
         assert output is None
 
+    def test_wait_for_chunk(self, buffer_config, sample_audio_chunk):
+        """Test conversion thread wakes when a chunk is written"""
+        import threading
+
+        buffer_mgr = BufferManager(buffer_config)
+        assert buffer_mgr.wait_for_chunk(timeout=0.01) is False
+
+        writer = threading.Timer(0.02, buffer_mgr.write_input, args=(sample_audio_chunk,))
+        writer.start()
+        assert buffer_mgr.wait_for_chunk(timeout=2.0) is True
+        writer.join()
+
+    def test_wait_for_output(self, buffer_config):
+        """Test playback thread wakes when output is written"""
+        buffer_mgr = BufferManager(buffer_config)
+        assert buffer_mgr.wait_for_output(timeout=0.01) is False
+
+        buffer_mgr.write_output(np.zeros(4096, dtype=np.float32))
+        assert buffer_mgr.wait_for_output(timeout=0.01) is True
+
     def test_buffer_health(self, buffer_config, sample_audio_chunk):
         """Test buffer health metrics"""
         buffer_mgr = BufferManager(buffer_config)
@@ -175,6 +308,58 @@ class TestBufferManager:
         # Should handle gracefully by shifting
         assert buffer_mgr.input_write_pos == len(buffer_mgr.input_buffer)
 
+    def test_ring_buffer_wraparound(self):
+        """Test reads stay in order when writes wrap around the ring"""
+        config = BufferConfig(chunk_size=1000)
+        buffer_mgr = BufferManager(config)
+        signal_in = np.arange(25000, dtype=np.float32)
+
+        chunks = []
+        for start in range(0, len(signal_in), 2500):
+            buffer_mgr.write_input(signal_in[start:start + 2500])
+            while buffer_mgr.has_chunk_ready():
+                chunks.append(buffer_mgr.read_chunk_for_processing()[0])
+
+        np.testing.assert_array_equal(np.concatenate(chunks), signal_in)
+
+    def test_input_gap_resets_context(self):
+        """Test the first chunk after an input gap gets no context or crossfade tail"""
+        config = BufferConfig(chunk_size=100, context_chunks=2)
+        buffer_mgr = BufferManager(config)
+        buffer_mgr.write_input(np.ones(200, dtype=np.float32))
+        buffer_mgr.read_chunk_for_processing()
+        buffer_mgr.read_chunk_for_processing()
+        buffer_mgr.last_chunk_tail = np.ones(buffer_mgr.crossfade_samples, dtype=np.float32)
+
+        buffer_mgr.mark_input_gap()
+        buffer_mgr.write_input(np.full(100, 0.5, dtype=np.float32))
+        chunk, context = buffer_mgr.read_chunk_for_processing()
+
+        assert context is None
+        assert buffer_mgr.last_chunk_tail is None
+        np.testing.assert_array_equal(buffer_mgr.context_buffer, chunk)
+
+    def test_ring_buffer_overflow_drops_newest(self):
+        """Test overflow drops the samples that do not fit, leaving the read position alone"""
+        config = BufferConfig(chunk_size=100)
+        buffer_mgr = BufferManager(config)
+        buffer_mgr.write_input(np.arange(1500, dtype=np.float32))
+
+        assert buffer_mgr._tail == 0
+        chunk, _ = buffer_mgr.read_chunk_for_processing()
+        np.testing.assert_array_equal(chunk, np.arange(0, 100, dtype=np.float32))
+
+    def test_input_overflow_counted(self):
+        """Test overflowing input is counted and reported in buffer health"""
+        buffer_mgr = BufferManager(BufferConfig(chunk_size=100))
+        buffer_mgr.write_input(np.zeros(900, dtype=np.float32))
+        assert buffer_mgr.dropped_input_samples == 0
+
+        buffer_mgr.write_input(np.zeros(300, dtype=np.float32))  # Overruns unread samples
+        buffer_mgr.write_input(np.zeros(1500, dtype=np.float32))  # Longer than the ring
+        assert buffer_mgr.dropped_input_samples == 200 + 1500
+        assert buffer_mgr.get_buffer_health()['dropped_input_samples'] == 1700
+
     def test_clear_buffers(self, buffer_config, sample_audio_chunk):
         """Test clearing all buffers"""
         buffer_mgr = BufferManager(buffer_config)
@@ -188,8 +373,122 @@ class TestBufferManager:
         assert len(buffer_mgr.context_buffer) == 0
 
 
+# Buffer kernel Tests
+
+class TestBufferKernels:
+    """Test compiled buffer kernels against their numpy fallbacks"""
+
+    def test_ring_write_wraps(self):
+        """Test ring_write splits writes across the end of the buffer"""
+        from rwc.streaming._buffer_kernels import ring_write, _ring_write
+
+        for write in (ring_write, _ring_write):
+            buf = np.zeros(8, dtype=np.float32)
+            head = write(buf, 6, np.arange(1, 5, dtype=np.float32))
+            assert head == 10
+            np.testing.assert_array_equal(buf, [3, 4, 0, 0, 0, 0, 1, 2])
+
+    def test_crossfade_blend_matches_fallback(self):
+        """Test compiled crossfade matches the vectorized fallback"""
+        from rwc.streaming._buffer_kernels import crossfade_blend, _crossfade_blend_numpy
+
+        fade_out = np.linspace(1.0, 0.0, 64, dtype=np.float32)
+        fade_in = 1.0 - fade_out
+        tail = np.random.randn(64).astype(np.float32)
+        chunk = np.random.randn(256).astype(np.float32)
+
+        expected = chunk.copy()
+        _crossfade_blend_numpy(tail, expected, fade_out, fade_in, 64)
+        crossfade_blend(tail, chunk, fade_out, fade_in, 64)
+
+        np.testing.assert_allclose(chunk, expected, rtol=1e-6, atol=1e-6)
+
+
 # ConversionConfig Tests
 
+    def test_peak_normalize_matches_fallback(self):
+        """Test compiled and numpy peak normalization agree"""
+        from rwc.streaming._buffer_kernels import peak_normalize, _peak_normalize_numpy
+
+        src = np.random.randn(4096).astype(np.float32)
+        out_a = np.empty_like(src)
+        out_b = np.empty_like(src)
+        peak_normalize(src, out_a, 0.95)
+        _peak_normalize_numpy(src, out_b, 0.95)
+
+        np.testing.assert_allclose(out_a, out_b, rtol=1e-6)
+        assert np.abs(out_a).max() == pytest.approx(0.95, rel=1e-5)
+
+        quiet = src * 0.01  # Below target: copied unchanged
+        peak_normalize(quiet, out_a, 0.95)
+        np.testing.assert_array_equal(out_a, quiet)
+
+    def test_warm_up_compiles_float32_kernels(self):
+        """Test warm_up() compiles writable and read-only float32 signatures"""
+        from rwc.streaming import _buffer_kernels as kernels
+
+        kernels.warm_up()
+        if not kernels.NUMBA_AVAILABLE:
+            return
+        for kernel in (kernels.ring_write, kernels.rms, kernels.peak_normalize):
+            assert len(kernel.signatures) >= 2
+        assert kernels.crossfade_blend.signatures
+        assert kernels.normalize_crossfade.signatures
+
+    def test_rms_matches_fallback(self):
+        """Test compiled and numpy RMS agree, including empty blocks"""
+        from rwc.streaming._buffer_kernels import rms, _rms_numpy
+
+        block = np.random.randn(1024).astype(np.float32) * 0.1
+        expected = float(np.sqrt(np.mean(np.square(block, dtype=np.float64))))
+        assert rms(block) == pytest.approx(expected, rel=1e-5)
+        assert _rms_numpy(block) == pytest.approx(expected, rel=1e-5)
+        assert rms(np.zeros(0, dtype=np.float32)) == 0.0
+        assert _rms_numpy(np.zeros(0, dtype=np.float32)) == 0.0
+
+
+class TestSampleRing:
+    """Test the callback-side sample ring"""
+
+    def test_write_read_wraps(self):
+        """Test samples come back in order across the end of the ring"""
+        from rwc.streaming import SampleRing
+
+        ring = SampleRing(8)
+        out = np.empty(6, dtype=np.float32)
+        assert ring.write(np.arange(6, dtype=np.float32)) == 6
+        assert ring.read_into(out[:4]) == 4
+        assert ring.write(np.arange(6, 12, dtype=np.float32)) == 6
+        assert len(ring) == 8
+        assert ring.read_into(out) == 6
+        np.testing.assert_array_equal(out, np.arange(4, 10))
+
+    def test_full_ring_drops_newest(self):
+        """Test a full ring rejects new samples instead of overwriting unread ones"""
+        from rwc.streaming import SampleRing
+
+        ring = SampleRing(4)
+        assert ring.write(np.ones(6, dtype=np.float32)) == 4
+        assert ring.dropped_samples == 2
+
+        out = np.full(6, -1.0, dtype=np.float32)
+        assert ring.read_into(out) == 4
+        np.testing.assert_array_equal(out, [1, 1, 1, 1, -1, -1])
+
+    def test_wait_readable(self):
+        """Test waiting wakes up once enough samples are written"""
+        import threading
+        from rwc.streaming import SampleRing
+
+        ring = SampleRing(16)
+        assert ring.wait_readable(4, timeout=0.01) is False
+
+        writer = threading.Timer(0.05, ring.write, args=(np.ones(4, dtype=np.float32),))
+        writer.start()
+        assert ring.wait_readable(4, timeout=2.0) is True
+        writer.join()
+
+
 class TestConversionConfig:
     """Test ConversionConfig dataclass"""
 
@@ -216,6 +515,15 @@ class TestConversionConfig:
         assert config.index_rate == 0.5
         assert config.chunk_size == 8192
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_slots(self):
+        """Test config and metrics reject unknown attributes"""
+        config = ConversionConfig(model_path="test.pth")
+        with pytest.raises(AttributeError):
+            config.unknown_field = 1
+        with pytest.raises(AttributeError):
+            ConversionMetrics().unknown_field = 1
+
 
 # StreamingPipeline Tests
 
@@ -251,6 +559,44 @@ class TestStreamingPipeline:
         time.sleep(0.5)
         assert not pipeline.conversion_thread.is_alive()
 
+    def test_pause_keeps_backend(self, mock_backend, buffer_config, sample_audio_chunk):
+        """Test pause() stops conversion but keeps the backend for the next start()"""
+        pipeline = StreamingPipeline(mock_backend, buffer_config)
+
+        pipeline.start()
+        pipeline.process_input(sample_audio_chunk[:100])
+        pipeline.pause()
+        assert not pipeline.is_running()
+        assert pipeline.buffer.input_write_pos == 0
+        mock_backend.cleanup.assert_not_called()
+
+        pipeline.start()
+        assert pipeline.is_running()
+        mock_backend.initialize.assert_called_once()
+
+        pipeline.stop()
+        mock_backend.cleanup.assert_called_once()
+        pipeline.start()
+        assert mock_backend.initialize.call_count == 2
+        pipeline.stop()
+
+    def test_pause_keeps_buffers_held_by_stuck_thread(self, mock_backend, buffer_config):
+        """Test pause() does not hand out pool buffers a surviving conversion thread still holds"""
+        from rwc.streaming.buffer import OUTPUT_POOL_SIZE
+
+        pipeline = StreamingPipeline(mock_backend, buffer_config)
+        held = pipeline.buffer.acquire_output_buffer()
+        queued = pipeline.buffer.acquire_output_buffer()
+        queued.fill(0.5)
+        pipeline.buffer.write_output(queued, crossfade=False)
+        pipeline.conversion_thread = Mock(is_alive=Mock(return_value=True))
+
+        pipeline.pause()
+
+        free = pipeline.buffer._free_buffers
+        assert free.qsize() == OUTPUT_POOL_SIZE - 1
+        assert all(free.get_nowait() is not held for _ in range(free.qsize()))
+
     def test_process_input(self, mock_backend, buffer_config, sample_audio_chunk):
         """Test processing input audio"""
         pipeline = StreamingPipeline(mock_backend, buffer_config)
@@ -316,6 +662,73 @@ class TestStreamingPipeline:
 
         pipeline.stop()
 
+    def test_pipelined_backend_preserves_order(self, buffer_config):
+        """Test chunks from a pipelined backend are retired in submission order"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        class SlowFirstBackend(ConversionBackend):
+            max_in_flight = 3
+
+            def initialize(self):
+                self.executor = ThreadPoolExecutor(max_workers=3)
+
+            def convert_chunk(self, audio_chunk, context=None):
+                if audio_chunk[0] == 0:
+                    time.sleep(0.1)  # First chunk finishes last
+                return audio_chunk + 10
+
+            def submit_chunk(self, audio_chunk, context=None):
+                return self.executor.submit(self.convert_chunk, audio_chunk, context)
+
+            def cleanup(self):
+                self.executor.shutdown(wait=True)
+
+        pipeline = StreamingPipeline(SlowFirstBackend(ConversionConfig(model_path="test.pth")), buffer_config)
+        pipeline.start()
+        for value in range(3):
+            pipeline.process_input(np.full(4096, value, dtype=np.float32))
+
+        firsts = []
+        deadline = time.time() + 2.0
+        while len(firsts) < 3 and time.time() < deadline:
+            output = pipeline.get_output(4096, timeout=0.1)
+            if output is not None:
+                firsts.append(float(output[-1]))
+        pipeline.stop()
+
+        assert firsts == [10.0, 11.0, 12.0]
+
+    def test_batch_chunks_coalesces_queued_input(self, mock_backend, buffer_config):
+        """Test queued chunks are converted in one call and split back"""
+        mock_backend.config = ConversionConfig(model_path="test.pth", batch_chunks=3)
+        mock_backend.convert_chunk.side_effect = lambda audio, context=None: audio.copy()
+        pipeline = StreamingPipeline(mock_backend, buffer_config)
+
+        # Queue three chunks before the conversion thread starts
+        pipeline.process_input(np.ones(3 * 4096, dtype=np.float32))
+        pipeline.start()
+        assert pipeline.buffer.wait_for_output(timeout=2.0)
+        time.sleep(0.1)
+        pipeline.stop()
+
+        assert mock_backend.convert_chunk.call_count == 1
+        assert len(mock_backend.convert_chunk.call_args[0][0]) == 3 * 4096
+        assert len(pipeline.buffer.output_buffer) == 3
+
+    def test_sustained_silence_not_buffered(self, mock_backend, buffer_config):
+        """Test silence past one chunk is dropped and resuming marks the gap"""
+        pipeline = StreamingPipeline(mock_backend, buffer_config)
+        block = 1024
+
+        for _ in range(6):
+            pipeline.process_input(np.zeros(block, dtype=np.float32))
+        # One full chunk of silence is kept to flush the phrase tail
+        assert pipeline.buffer.input_write_pos == buffer_config.chunk_size
+
+        pipeline.process_input(np.full(block, 0.5, dtype=np.float32))
+        assert pipeline.buffer.input_write_pos == buffer_config.chunk_size + block
+        assert pipeline.buffer._gap_at == buffer_config.chunk_size
+
     def test_is_running(self, mock_backend, buffer_config):
         """Test is_running status"""
         pipeline = StreamingPipeline(mock_backend, buffer_config)
@@ -387,6 +800,97 @@ class TestBatchConverter:
         finally:
             converter.cleanup()
 
+    def test_scratch_slots_round_robin(self, conversion_config, sample_audio_chunk):
+        """Test chunks reuse preallocated scratch slots"""
+        import shutil
+
+        def passthrough(input_audio, output_audio, **kwargs):
+            shutil.copy(input_audio, output_audio)
+
+        with patch('rwc.core.VoiceConverter') as mock_vc_cls:
+            mock_vc = mock_vc_cls.return_value
+            mock_vc.convert_voice.side_effect = passthrough
+            converter = BatchConverter(conversion_config)
+            converter.initialize()
+
+        try:
+            assert len(converter._slots) == 4
+            assert all(p.exists() for pair in converter._slots for p in pair)
+
+            chunk = np.clip(sample_audio_chunk * 0.1, -0.9, 0.9)  # Within 16-bit scratch range
+            for _ in range(5):
+                converted = converter.convert_chunk(chunk)
+            np.testing.assert_allclose(converted, chunk, atol=1e-4)
+            assert converter.metrics.dropped_chunks == 0
+
+            used = [c.kwargs['input_audio'] for c in mock_vc.convert_voice.call_args_list]
+            assert used == [str(pair[0]) for pair in converter._slots] + [str(converter._slots[0][0])]
+        finally:
+            converter.cleanup()
+
+    @pytest.mark.parametrize("output_len", [1000, 4096, 6000])
+    def test_output_length_matches_input(self, conversion_config, output_len):
+        """Test short output is zero-filled and long output trimmed in place"""
+        import soundfile as sf
+
+        def fixed_length(input_audio, output_audio, **kwargs):
+            sf.write(output_audio, np.full(output_len, 0.5), conversion_config.sample_rate)
+
+        with patch('rwc.core.VoiceConverter') as mock_vc_cls:
+            mock_vc_cls.return_value.convert_voice.side_effect = fixed_length
+            converter = BatchConverter(conversion_config)
+            converter.initialize()
+
+        try:
+            converted = converter.convert_chunk(np.zeros(4096, dtype=np.float32))
+            assert len(converted) == 4096
+            assert converted.dtype == np.float32
+            kept = min(output_len, 4096)
+            np.testing.assert_allclose(converted[:kept], 0.5, atol=1e-4)
+            assert np.all(converted[kept:] == 0.0)
+        finally:
+            converter.cleanup()
+
+    def test_submit_chunk_pipeline(self, conversion_config):
+        """Test pipelined write/convert/read stages return converted chunks"""
+        import shutil
+
+        def passthrough(input_audio, output_audio, **kwargs):
+            shutil.copy(input_audio, output_audio)
+
+        with patch('rwc.core.VoiceConverter') as mock_vc_cls:
+            mock_vc_cls.return_value.convert_voice.side_effect = passthrough
+            converter = BatchConverter(conversion_config)
+            converter.initialize()
+
+        try:
+            chunks = [np.full(4096, 0.1 * (i + 1), dtype=np.float32) for i in range(3)]
+            futures = [converter.submit_chunk(chunk) for chunk in chunks]
+
+            for chunk, future in zip(chunks, futures):
+                np.testing.assert_allclose(future.result(timeout=5), chunk, atol=1e-4)
+            assert converter.metrics.total_chunks_processed == 3
+        finally:
+            converter.cleanup()
+
+    def test_submit_chunk_failure_keeps_pooled_buffer(self, conversion_config):
+        """Test a failed chunk returns the input in the allocated output buffer"""
+        with patch('rwc.core.VoiceConverter') as mock_vc_cls:
+            mock_vc_cls.return_value.convert_voice.side_effect = RuntimeError("inference failed")
+            converter = BatchConverter(conversion_config)
+            converter.initialize()
+
+        pooled = np.empty(4096, dtype=np.float32)
+        converter.output_allocator = lambda: pooled
+        try:
+            chunk = np.full(4096, 0.25, dtype=np.float32)
+            result = converter.submit_chunk(chunk).result(timeout=5)
+            assert result is pooled
+            np.testing.assert_array_equal(result, chunk)
+            assert converter.metrics.dropped_chunks == 1
+        finally:
+            converter.cleanup()
+
     def test_metrics_tracking(self, conversion_config):
         """Test metrics tracking"""
         converter = BatchConverter(conversion_config)
@@ -398,6 +902,115 @@ class TestBatchConverter:
 
 # Integration Tests
 
+class TestStreamingConverter:
+    """Test StreamingConverter post-processing (no models loaded)"""
+
+    @pytest.fixture
+    def converter(self, conversion_config):
+        pytest.importorskip("ultimate_rvc")
+        from rwc.streaming.streaming_backend import StreamingConverter
+        return StreamingConverter(conversion_config)
+
+    def test_crossfade_fades_previous_out(self, converter):
+        """Test the Hann crossfade starts on the previous chunk and ends on the current one"""
+        n = converter.fade_samples
+        result = converter._apply_crossfade(np.ones(4096, dtype=np.float32), np.zeros(4096, dtype=np.float32))
+
+        assert result[0] == pytest.approx(1.0, abs=1e-3)
+        assert result[n - 1] == pytest.approx(0.0, abs=1e-3)
+        assert np.all(np.diff(result[:n]) <= 0)
+        assert np.all(result[n:] == 0.0)
+
+    def test_fused_normalize_crossfade_matches_methods(self, converter):
+        """Test the fused kernel matches _normalize_rms() + _apply_crossfade()"""
+        from rwc.streaming._buffer_kernels import normalize_crossfade
+
+        n = converter.fade_samples
+        prev_tail = (np.random.randn(n) * 0.3).astype(np.float32)
+        chunk = (np.random.randn(4096) * 0.1).astype(np.float32)
+
+        converter._previous_rms = 0.3
+        expected = converter._apply_crossfade(prev_tail, converter._normalize_rms(chunk.copy()))
+        expected_rms = converter._previous_rms
+
+        fused = chunk.copy()
+        new_rms = normalize_crossfade(fused, 0.3, prev_tail, converter._fade_out, converter._fade_in)
+        np.testing.assert_allclose(fused, expected, atol=1e-5)
+        assert new_rms == pytest.approx(expected_rms, rel=1e-4)
+
+    def test_estimate_latency_includes_batching(self):
+        """Test micro-batching adds the batched audio to the latency estimate"""
+        pytest.importorskip("ultimate_rvc")
+        from rwc.streaming.streaming_backend import StreamingConverter
+
+        single = StreamingConverter(ConversionConfig(model_path="m.pth")).estimate_latency()
+        batched = StreamingConverter(ConversionConfig(model_path="m.pth", batch_chunks=3)).estimate_latency()
+
+        assert single["batching_ms"] == 0.0
+        assert batched["total_ms"] == pytest.approx(single["total_ms"] + 2 * single["chunk_duration_ms"])
+
+    def test_silent_input_skips_inference(self, converter):
+        """Test chunks with silent context and input bypass the RVC pipeline"""
+        converter.voice_converter = MagicMock()
+        converter.voice_converter.vc.pipeline.side_effect = lambda **kw: kw["audio"] * 0.5
+
+        converter.convert_chunk(np.full(4096, 0.1, dtype=np.float32))
+        for _ in range(3):
+            output = converter.convert_chunk(np.zeros(4096, dtype=np.float32))
+
+        # Only the speech chunk and the first silent chunk (speech context) run inference
+        assert converter.voice_converter.vc.pipeline.call_count == 2
+        assert converter.metrics.total_chunks_processed == 4
+        assert np.all(output == 0.0)
+
+        # Skipped chunks are zeroed in a pooled output buffer, not allocated
+        pooled = np.full(4096, np.nan, dtype=np.float32)
+        converter.output_allocator = lambda: pooled
+        output = converter.convert_chunk(np.zeros(4096, dtype=np.float32))
+        assert output is pooled
+        assert np.all(output == 0.0)
+
+    @pytest.mark.parametrize("chunk_size,use_rmvpe,pitch_method,expected", [
+        (4096, True, "auto", "fcpe"),    # 85ms chunk: under the real-time pitch budget
+        (8192, True, "auto", "rmvpe"),
+        (8192, False, "auto", "crepe"),
+        (4096, True, "rmvpe", "rmvpe"),
+    ])
+    def test_f0_method_selection(self, chunk_size, use_rmvpe, pitch_method, expected):
+        """Test the pitch method passed to the pipeline follows pitch_method/'auto'"""
+        pytest.importorskip("ultimate_rvc")
+        from rwc.streaming.streaming_backend import StreamingConverter
+
+        config = ConversionConfig(
+            model_path="m.pth", chunk_size=chunk_size, use_rmvpe=use_rmvpe, pitch_method=pitch_method
+        )
+        assert StreamingConverter(config)._f0_method.value == expected
+
+    def test_short_output_zero_padded(self, converter):
+        """Test pipeline output shorter than the chunk is zero-padded into a pooled buffer"""
+        pooled = np.full(4096, np.nan, dtype=np.float32)
+        converter.output_allocator = lambda: pooled
+        converter.voice_converter = MagicMock()
+        converter.voice_converter.vc.pipeline.side_effect = lambda **kw: kw["audio"][:1000] * 0.5
+
+        output = converter.convert_chunk(np.full(4096, 0.1, dtype=np.float32))
+
+        assert output is pooled
+        assert not np.isnan(output).any()
+        assert np.abs(output[1100:]).max() < 1e-3  # Padding (past the smoothing filter's ring-down)
+
+    def test_smoothing_state_spans_chunks(self, converter):
+        """Test chunked smoothing matches filtering the whole stream at once"""
+        from scipy import signal
+
+        audio = np.random.randn(8192).astype(np.float32) * 0.1
+        pieces = [converter._apply_smoothing(audio[:4096].copy()), converter._apply_smoothing(audio[4096:].copy())]
+
+        zi = signal.sosfilt_zi(converter._smooth_sos) * audio[0]
+        expected, _ = signal.sosfilt(converter._smooth_sos, audio, zi=zi)
+        np.testing.assert_allclose(np.concatenate(pieces), expected, atol=1e-5)
+
+
 @pytest.mark.skip(reason="Requires VoiceConverter and actual RVC models")
 class TestStreamingIntegration:
     """Integration tests for complete streaming pipeline"""
@@ -0,0 +1,195 @@
+"""Tests for the basic terminal UI helpers"""
+import sys
+import types
+
+import pytest
+
+from rwc import tui
+
+
+@pytest.fixture
+def models_dir(temp_dir, monkeypatch):
+    """Run in a temp dir with an empty models/ tree and a cold model cache"""
+    monkeypatch.chdir(temp_dir)
+    monkeypatch.setattr(tui, "_models_cache", {"mtimes": None, "files": None})
+    models = temp_dir / "models"
+    (models / "voice").mkdir(parents=True)
+    return models
+
+
+class TestListAvailableModels:
+    """Test model enumeration"""
+
+    def test_filters_and_sorts(self, models_dir):
+        """Should list model files only, skipping hubert/rmvpe weights"""
+        (models_dir / "voice" / "b.pth").touch()
+        (models_dir / "a.onnx").touch()
+        (models_dir / "hubert_base.pt").touch()
+        (models_dir / "rmvpe.pt").touch()
+        (models_dir / "voice" / "notes.txt").touch()
+
+        assert tui.list_available_models() == (
+            ("models/a.onnx", "a.onnx"),
+            ("models/voice/b.pth", "voice/b.pth"),
+        )
+
+    def test_missing_directory(self, temp_dir, monkeypatch):
+        """Should return an empty list without a models directory"""
+        monkeypatch.chdir(temp_dir)
+        monkeypatch.setattr(tui, "_models_cache", {"mtimes": None, "files": None})
+        assert tui.list_available_models() == ()
+
+    def test_cached_until_directory_changes(self, models_dir, monkeypatch):
+        """Should reuse the last scan until a scanned directory changes"""
+        (models_dir / "voice" / "a.pth").touch()
+        first = tui.list_available_models()
+
+        scans = []
+        real_scandir = tui.os.scandir
+        monkeypatch.setattr(tui.os, "scandir", lambda path: scans.append(path) or real_scandir(path))
+
+        assert tui.list_available_models() is first
+        assert scans == []
+
+        (models_dir / "voice" / "b.pth").touch()
+        assert tui.list_available_models() == first + (("models/voice/b.pth", "voice/b.pth"),)
+        assert sorted(scans) == ["models", "models/voice"]
+
+
+class TestRenderBuffer:
+    """Test single-write frame rendering"""
+
+    def test_matches_print_colored(self, capsys):
+        """Should produce the same output as one print_colored() per line"""
+        lines = [
+            ("Header", tui.Fore.CYAN, tui.Style.BRIGHT),
+            ("", tui.Fore.WHITE, tui.Style.NORMAL),
+            ("1. Option", tui.Fore.GREEN, tui.Style.NORMAL),
+        ]
+        for text, color, style in lines:
+            tui.print_colored(text, color, style)
+        expected = capsys.readouterr().out
+
+        tui._render_buffer(lines)
+        assert capsys.readouterr().out == expected
+
+
+class TestPrompts:
+    """Test the re-asking input helpers"""
+
+    def _answers(self, monkeypatch, *answers):
+        feed = iter(answers)
+        monkeypatch.setattr("builtins.input", lambda prompt="": next(feed))
+
+    def test_prompt_int_default(self, monkeypatch):
+        """Should return the default for an empty answer"""
+        self._answers(monkeypatch, "")
+        assert tui.prompt_int("Pitch", default=0, lo=-24, hi=24) == 0
+
+    def test_prompt_int_reasks_until_valid(self, monkeypatch, capsys):
+        """Should re-ask on non-numbers and out-of-range values"""
+        self._answers(monkeypatch, "abc", "30", "-5")
+        assert tui.prompt_int("Pitch", default=0, lo=-24, hi=24) == -5
+        out = capsys.readouterr().out
+        assert "Invalid input" in out
+        assert "at most 24" in out
+
+    def test_prompt_float(self, monkeypatch):
+        """Should parse floats within range"""
+        self._answers(monkeypatch, "1.5", "0.5")
+        assert tui.prompt_float("Index rate", default=0.75, lo=0.0, hi=1.0) == 0.5
+
+    @pytest.mark.parametrize("answers,expected", [
+        (("",), True),
+        (("Y",), True),
+        (("no",), False),
+        (("maybe", "n"), False),
+    ])
+    def test_prompt_yn(self, monkeypatch, answers, expected):
+        """Should map y/n answers, default on empty, and re-ask otherwise"""
+        self._answers(monkeypatch, *answers)
+        assert tui.prompt_yn("Use RMVPE?") is expected
+
+
+class TestAudioDeviceListing:
+    """Test the cached device listing"""
+
+    def test_listing_cached_until_refresh(self, monkeypatch, capsys):
+        """Should enumerate devices once and reuse the listing"""
+        calls = []
+
+        def fake_enumerate():
+            calls.append(1)
+            return len(calls)
+
+        monkeypatch.setitem(
+            sys.modules, "rwc.utils.audio_devices",
+            types.SimpleNamespace(
+                enumerate_audio_devices=fake_enumerate,
+                format_audio_devices=lambda devices: f"Device listing {devices}\n",
+            ),
+        )
+        tui._devices_text.cache_clear()
+        try:
+            tui.list_audio_devices()
+            tui.list_audio_devices()
+            assert len(calls) == 1
+            assert capsys.readouterr().out == "Device listing 1\n" * 2
+
+            tui.list_audio_devices(refresh=True)
+            assert len(calls) == 2
+            assert capsys.readouterr().out == "Device listing 2\n"
+        finally:
+            tui._devices_text.cache_clear()
+
+
+class TestPrewarm:
+    """Test background warm-up of the conversion stack"""
+
+    def test_started_once(self, monkeypatch):
+        """Should start a single warm-up thread per session"""
+        calls = []
+        monkeypatch.setattr(tui, "_prewarm", lambda model_path=None, use_rmvpe=None: calls.append(model_path))
+        monkeypatch.setattr(tui, "_prewarm_thread", None)
+
+        tui.prewarm_converter()
+        tui.prewarm_converter()
+        tui._prewarm_thread.join(timeout=5)
+        assert calls == [None]
+
+    def test_selected_model_warmed(self, monkeypatch):
+        """Should start another warm-up to load a newly selected model with the RMVPE answer"""
+        calls = []
+        monkeypatch.setattr(
+            tui, "_prewarm", lambda model_path=None, use_rmvpe=None: calls.append((model_path, use_rmvpe))
+        )
+        monkeypatch.setattr(tui, "_prewarm_thread", None)
+
+        tui.prewarm_converter()
+        tui._prewarm_thread.join(timeout=5)
+        tui.prewarm_converter("models/voice/a.pth", False)
+        tui._prewarm_thread.join(timeout=5)
+        assert calls == [(None, None), ("models/voice/a.pth", False)]
+
+
+class TestSelectModel:
+    """Test the model picker"""
+
+    def test_listed_model_skips_check(self, models_dir, monkeypatch):
+        """Should return a listed model without asking for an existence check"""
+        (models_dir / "voice" / "a.pth").touch()
+        monkeypatch.setattr("builtins.input", lambda prompt="": "1")
+        assert tui.select_model() == ("models/voice/a.pth", False)
+
+    def test_custom_path_needs_check(self, models_dir, monkeypatch):
+        """Should flag a typed custom path for an existence check"""
+        (models_dir / "voice" / "a.pth").touch()
+        answers = iter(["2", "elsewhere/model.pth"])
+        monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+        assert tui.select_model() == ("elsewhere/model.pth", True)
+
+    def test_go_back(self, models_dir, monkeypatch):
+        """Should return no path when the user goes back"""
+        (models_dir / "voice" / "a.pth").touch()
+        monkeypatch.setattr("builtins.input", lambda prompt="": "3")
+        assert tui.select_model() == (None, False)
@@ -0,0 +1,368 @@
+"""Tests for the enhanced terminal UI"""
+import os
+import types
+
+import pytest
+
+from rwc import tui_enhanced
+from rwc.tui_enhanced import MenuItem, MenuScreen, TerminalApp
+
+
+@pytest.fixture(autouse=True)
+def cold_model_cache(monkeypatch):
+    """Start every test with an empty model cache"""
+    monkeypatch.setattr(tui_enhanced, "_MODEL_CACHE", {})
+
+
+@pytest.fixture
+def models_dir(temp_dir, monkeypatch):
+    """Run in a temp dir with an empty models/ tree"""
+    monkeypatch.chdir(temp_dir)
+    models = temp_dir / "models"
+    (models / "voice").mkdir(parents=True)
+    return models
+
+
+class TestModelListing:
+    """Test model enumeration"""
+
+    def test_filters_and_sorts(self, models_dir):
+        """Should list model files only, skipping hubert/rmvpe weights"""
+        (models_dir / "voice" / "b.pth").touch()
+        (models_dir / "a.onnx").touch()
+        (models_dir / "hubert_base.pt").touch()
+        (models_dir / "RMVPE.pt").touch()
+        (models_dir / "voice" / "notes.txt").touch()
+
+        assert TerminalApp.list_available_models() == [
+            "models/a.onnx",
+            "models/voice/b.pth",
+        ]
+
+    def test_missing_directory(self, temp_dir, monkeypatch):
+        """Should return an empty list without a models directory"""
+        monkeypatch.chdir(temp_dir)
+        assert TerminalApp.list_available_models() == []
+
+    def test_cached_until_directory_changes(self, models_dir, monkeypatch):
+        """Should reuse the last scan until a scanned directory changes"""
+        (models_dir / "voice" / "a.pth").touch()
+        first = TerminalApp.list_available_models()
+
+        scans = []
+        real_scandir = tui_enhanced.os.scandir
+        monkeypatch.setattr(
+            tui_enhanced.os, "scandir", lambda path: scans.append(path) or real_scandir(path)
+        )
+
+        assert TerminalApp.list_available_models() == first
+        assert scans == []
+
+        (models_dir / "voice" / "b.pth").touch()
+        assert TerminalApp.list_available_models() == first + ["models/voice/b.pth"]
+        assert len(scans) == 2
+
+    @pytest.mark.parametrize("have_fwalk", [True, False])
+    def test_walk_variants_agree(self, models_dir, monkeypatch, have_fwalk):
+        """Should list the same models and directory mtimes with or without os.fwalk"""
+        if have_fwalk and not hasattr(tui_enhanced.os, "fwalk"):
+            pytest.skip("os.fwalk not available")
+        monkeypatch.setattr(tui_enhanced, "_HAVE_FWALK", have_fwalk)
+        (models_dir / "voice" / "deep").mkdir()
+        (models_dir / "voice" / "deep" / "c.pt").touch()
+        (models_dir / "voice" / "b.pth").touch()
+        (models_dir / "voice" / "hubert.pt").touch()
+
+        mtimes = {}
+        found = sorted(TerminalApp._iter_model_files("models", mtimes))
+        assert found == ["models/voice/b.pth", "models/voice/deep/c.pt"]
+        assert sorted(mtimes) == ["models", "models/voice", "models/voice/deep"]
+
+    def test_count_available_models(self, models_dir):
+        """Should count models on both a cold and a warm cache"""
+        (models_dir / "voice" / "a.pth").touch()
+        (models_dir / "b.onnx").touch()
+        (models_dir / "rmvpe.pt").touch()
+        assert TerminalApp.count_available_models() == 2
+        TerminalApp.list_available_models()
+        assert TerminalApp.count_available_models() == 2
+
+
+class FakePyAudio:
+    """Minimal PyAudio stand-in that counts PortAudio initializations"""
+    instances = 0
+
+    def __init__(self):
+        FakePyAudio.instances += 1
+        self.terminated = False
+
+    def get_device_count(self):
+        return 1
+
+    def get_device_info_by_index(self, idx):
+        return {"name": "Mic", "maxInputChannels": 1, "maxOutputChannels": 0,
+                "defaultSampleRate": 48000.0}
+
+    def get_default_input_device_info(self):
+        return {"index": 0}
+
+    def get_default_output_device_info(self):
+        raise OSError("no output")
+
+    def terminate(self):
+        self.terminated = True
+
+
+class TestAudioDevices:
+    """Test the shared PortAudio session and device cache"""
+
+    @pytest.fixture
+    def app(self, monkeypatch):
+        FakePyAudio.instances = 0
+        monkeypatch.setattr(tui_enhanced, "PYAUDIO_AVAILABLE", True)
+        monkeypatch.setattr(tui_enhanced, "pyaudio", types.SimpleNamespace(PyAudio=FakePyAudio),
+                            raising=False)
+        app = TerminalApp()
+        yield app
+        app.refresh_audio_devices()
+
+    def test_single_portaudio_session(self, app):
+        """Should enumerate once and reuse PyAudio for default detection"""
+        devices = app.get_audio_devices()
+        assert app.get_audio_devices() is devices
+        assert devices[0]["name"] == "Mic"
+        assert app.detect_default_devices() == (0, None)
+        assert FakePyAudio.instances == 1
+
+    def test_refresh_reinitializes(self, app):
+        """Should terminate PortAudio and enumerate again after a refresh"""
+        app.get_audio_devices()
+        pa = app._pa
+        app.refresh_audio_devices()
+        assert pa.terminated
+        app.get_audio_devices()
+        assert FakePyAudio.instances == 2
+
+
+WPCTL_STATUS = """\
+PipeWire 'pipewire-0' [1.0.5, user@host, cookie:1]
+ └─ Clients:
+        33. WirePlumber                         [1.0.5, user@host, pid:1]
+
+Audio
+ ├─ Devices:
+ │      45. Built-in Audio                      [alsa]
+ │  
+ ├─ Sinks:
+ │  *   56. Built-in Audio Analog Stereo        [vol: 0.40]
+ │      60. HDMI Output                         [vol: 1.00]
+ │  
+ ├─ Sink endpoints:
+ │  
+ ├─ Sources:
+ │  *   57. Built-in Audio Analog Stereo        [vol: 1.00]
+ │  
+ ├─ Source endpoints:
+ │  
+ └─ Streams:
+
+Video
+ ├─ Devices:
+ │      50. Webcam                              [v4l2]
+ │  
+ ├─ Sinks:
+ │  
+ ├─ Sink endpoints:
+ │  
+ ├─ Sources:
+ │  *   70. Webcam (V4L2)
+ │  
+ ├─ Source endpoints:
+ │  
+ └─ Streams:
+"""
+
+
+class TestPipeWireNodes:
+    """Test parsing of `wpctl status`"""
+
+    @pytest.fixture
+    def fake_wpctl(self, temp_dir, monkeypatch):
+        """Put a wpctl on PATH that prints a canned status report"""
+        (temp_dir / "status.txt").write_text(WPCTL_STATUS)
+        script = temp_dir / "wpctl"
+        script.write_text(f"#!/bin/sh\ncat '{temp_dir / 'status.txt'}'\n")
+        script.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{temp_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+
+    @pytest.mark.skipif(os.name != "posix", reason="needs a POSIX shell script")
+    def test_audio_sinks_and_sources(self, fake_wpctl):
+        """Should parse audio sinks/sources with their default markers"""
+        nodes = TerminalApp().get_pipewire_nodes()
+        assert nodes["sinks"] == [
+            {"id": 56, "name": "Built-in Audio Analog Stereo", "default": True},
+            {"id": 60, "name": "HDMI Output", "default": False},
+        ]
+        assert nodes["sources"] == [
+            {"id": 57, "name": "Built-in Audio Analog Stereo", "default": True},
+        ]
+
+    def test_without_wpctl(self, temp_dir, monkeypatch):
+        """Should return empty node lists when wpctl is not installed"""
+        monkeypatch.setenv("PATH", str(temp_dir))
+        assert TerminalApp().get_pipewire_nodes() == {"sinks": [], "sources": []}
+
+
+class TestMenuScreen:
+    """Test menu key lookup"""
+
+    def test_get_item_case_insensitive(self):
+        """Should find items by key regardless of case, first match winning"""
+        first = MenuItem("A", "First", "", lambda: None)
+        second = MenuItem("a", "Second", "", lambda: None)
+        screen = MenuScreen(title="Menu", items=[first, second])
+        assert screen.get_item("a") is first
+        assert screen.get_item("A") is first
+        assert screen.get_item("z") is None
+
+    def test_add_item(self):
+        """Should index items added after construction"""
+        screen = MenuScreen(title="Menu")
+        item = MenuItem("x", "Extra", "", lambda: None)
+        screen.add_item(item)
+        assert screen.items == (item,)
+        assert screen.get_item("X") is item
+
+
+class TestRendering:
+    """Test single-write frame rendering"""
+
+    def test_render_buffer_matches_print_colored(self, capsys):
+        """Should produce the same output as one print_colored() per line"""
+        lines = [
+            ("Title", tui_enhanced.Fore.CYAN, tui_enhanced.Style.BRIGHT),
+            ("", tui_enhanced.Fore.WHITE, tui_enhanced.Style.NORMAL),
+            ("[1] Item", tui_enhanced.Fore.GREEN, tui_enhanced.Style.BRIGHT),
+        ]
+        for text, color, style in lines:
+            tui_enhanced.print_colored(text, color, style)
+        expected = capsys.readouterr().out
+
+        tui_enhanced._render_buffer(lines)
+        assert capsys.readouterr().out == expected
+
+    def test_render_screen(self, capsys, monkeypatch):
+        """Should draw the header, items and navigation keys"""
+        monkeypatch.setattr(tui_enhanced, "clear_screen", lambda: None)
+        app = TerminalApp()
+        app.render_screen(app._main_menu)
+        out = capsys.readouterr().out
+        assert "RWC - Real-time Voice Conversion" in out
+        assert "[1] File Conversion" in out
+        assert "[q] Quit" in out
+        assert "[b]" not in out
+
+
+class TestReadKey:
+    """Test single-key menu input"""
+
+    def test_falls_back_to_input_without_tty(self, monkeypatch):
+        """Should read a whole line when stdin is not a terminal"""
+        monkeypatch.setattr(tui_enhanced.sys, "stdin", types.SimpleNamespace(isatty=lambda: False))
+        monkeypatch.setattr("builtins.input", lambda prompt="": "q")
+        assert tui_enhanced.read_key("> ") == "q"
+
+
+class TestStreamCommand:
+    """Test download script execution"""
+
+    @pytest.mark.skipif(os.name != "posix", reason="uses POSIX shell utilities")
+    def test_relays_output_and_status(self, capfd):
+        """Should pass the script's output through and return its exit status"""
+        assert TerminalApp._stream_command("sh -c 'echo downloading; exit 3'") == 3
+        assert "downloading" in capfd.readouterr().out
+
+    def test_download_drops_stale_caches(self, monkeypatch):
+        """Should forget scanned models and loaded converters after a download"""
+        cleared = []
+        monkeypatch.setattr(tui_enhanced, "_MODEL_CACHE", {"models": ({}, [])})
+        monkeypatch.setattr(tui_enhanced, "clear_converter_cache", lambda: cleared.append(True))
+        monkeypatch.setattr(tui_enhanced, "clear_screen", lambda: None)
+        monkeypatch.setattr(TerminalApp, "_stream_command", staticmethod(lambda command: 0))
+        monkeypatch.setattr(TerminalApp, "pause", staticmethod(lambda message="": None))
+
+        TerminalApp().run_download_script("bash download_models.sh")
+        assert tui_enhanced._MODEL_CACHE == {}
+        assert cleared == [True]
+
+
+class TestRealtimeProbe:
+    """Test concurrent device/model probing"""
+
+    def test_probe_pipewire(self, models_dir, monkeypatch):
+        """Should return PipeWire nodes and warm the model cache"""
+        nodes = {"sinks": [], "sources": [{"id": 1, "name": "Mic", "default": True}]}
+        (models_dir / "a.pth").touch()
+
+        app = TerminalApp()
+        monkeypatch.setattr(app, "get_pipewire_nodes", lambda: nodes)
+        assert tui_enhanced.asyncio.run(app._probe_realtime(True)) is nodes
+        assert "models" in tui_enhanced._MODEL_CACHE
+
+    def test_probe_portaudio(self, models_dir, monkeypatch):
+        """Should return the default PortAudio devices"""
+        app = TerminalApp()
+        monkeypatch.setattr(app, "_probe_portaudio", lambda: (2, 5))
+        assert tui_enhanced.asyncio.run(app._probe_realtime(False)) == (2, 5)
+
+
+class TestModelSelection:
+    """Test the model picker"""
+
+    def test_redraws_cached_frame(self, models_dir, monkeypatch, capsys):
+        """Should redraw the same catalog after an invalid entry and return the pick"""
+        (models_dir / "voice" / "a.pth").touch()
+        monkeypatch.setattr(tui_enhanced, "clear_screen", lambda: None)
+        monkeypatch.setattr(tui_enhanced.time, "sleep", lambda s: None)
+        answers = iter(["9", "1"])
+        monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+
+        assert TerminalApp().prompt_model_selection() == "models/voice/a.pth"
+        out = capsys.readouterr().out
+        assert out.count(" 1. voice/a.pth") == 2
+        assert "Invalid selection" in out
+
+
+class TestStdoutBuffering:
+    """Test block buffering of a terminal stdout while the app runs"""
+
+    class FakeStream:
+        def __init__(self, tty):
+            self.tty = tty
+            self.line_buffering = True
+            self.flushed = False
+
+        def isatty(self):
+            return self.tty
+
+        def reconfigure(self, line_buffering):
+            self.line_buffering = line_buffering
+
+        def flush(self):
+            self.flushed = True
+
+    def test_terminal_block_buffered_then_restored(self, monkeypatch):
+        """Should disable line buffering on a TTY and restore it afterwards"""
+        stream = self.FakeStream(tty=True)
+        monkeypatch.setattr(tui_enhanced.sys, "stdout", stream)
+        with tui_enhanced._block_buffered_stdout():
+            assert stream.line_buffering is False
+        assert stream.line_buffering is True
+        assert stream.flushed
+
+    def test_pipe_untouched(self, monkeypatch):
+        """Should leave a non-terminal stdout alone"""
+        stream = self.FakeStream(tty=False)
+        monkeypatch.setattr(tui_enhanced.sys, "stdout", stream)
+        with tui_enhanced._block_buffered_stdout():
+            assert stream.line_buffering is True
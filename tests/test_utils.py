@@ -0,0 +1,42 @@
+"""Tests for the model download utility"""
+import sys
+import types
+
+from rwc.utils import MODEL_REPOS, download_models
+
+
+class TestDownloadModels:
+    """Test in-process model downloads"""
+
+    def _fake_hub(self, monkeypatch, fail=()):
+        calls = []
+
+        def snapshot_download(repo_id, local_dir, max_workers):
+            calls.append((repo_id, local_dir, max_workers))
+            if repo_id in fail:
+                raise OSError("offline")
+            return local_dir
+
+        monkeypatch.setitem(
+            sys.modules, "huggingface_hub",
+            types.SimpleNamespace(snapshot_download=snapshot_download),
+        )
+        return calls
+
+    def test_downloads_every_repo(self, temp_dir, monkeypatch):
+        """Should fetch each repo into its models/ subdirectory"""
+        calls = self._fake_hub(monkeypatch)
+        models_dir = temp_dir / "models"
+
+        assert download_models(models_dir) is True
+        assert sorted(calls) == sorted(
+            (repo_id, str(models_dir / subdir), 8) for repo_id, subdir, _ in MODEL_REPOS
+        )
+
+    def test_reports_failed_repo(self, temp_dir, monkeypatch, capsys):
+        """Should finish the other repos and report a failure"""
+        calls = self._fake_hub(monkeypatch, fail={"Rejekts/uvr-models"})
+
+        assert download_models(temp_dir / "models") is False
+        assert len(calls) == len(MODEL_REPOS)
+        assert "Failed to download Rejekts/uvr-models: offline" in capsys.readouterr().out
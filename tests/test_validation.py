@@ -1,12 +1,16 @@
 """Tests for validation utilities"""
+import os
 import pytest
 from pathlib import Path
 from rwc.utils.validation import (
     ValidationError,
+    batch_output_jobs,
+    expand_audio_inputs,
     validate_audio_file_path,
     validate_model_path,
     validate_pitch_change,
     validate_index_rate,
+    validate_pitch_method,
     validate_audio_device_id,
     validate_pipewire_device_id,
     validate_sample_rate,
@@ -69,6 +73,43 @@ class TestAudioFileValidation:
         assert result.suffix == '.wav'
 
 
+class TestAudioInputExpansion:
+    """Test multi-file input expansion"""
+
+    def test_paths_and_globs(self, temp_dir):
+        """Should expand globs to sorted audio files and keep plain paths"""
+        for name in ("b.wav", "a.wav", "notes.txt"):
+            (temp_dir / name).touch()
+        spec = f"missing.wav, {temp_dir}/*, {temp_dir}/a.wav"
+
+        assert expand_audio_inputs(spec) == [
+            "missing.wav", str(temp_dir / "a.wav"), str(temp_dir / "b.wav")
+        ]
+
+    def test_unmatched_glob(self, temp_dir):
+        """Should reject a pattern that matches no audio files"""
+        with pytest.raises(ValidationError, match="No audio files match"):
+            expand_audio_inputs(f"{temp_dir}/*.flac")
+
+    def test_empty(self):
+        """Should reject an empty specification"""
+        with pytest.raises(ValidationError):
+            expand_audio_inputs(" , ")
+
+    def test_batch_output_jobs(self):
+        """Should name each output after its input"""
+        jobs = batch_output_jobs(["a/take1.wav", "b/take2.flac"], "out")
+        assert jobs == [
+            ("a/take1.wav", os.path.join("out", "take1_converted.wav")),
+            ("b/take2.flac", os.path.join("out", "take2_converted.wav")),
+        ]
+
+    def test_batch_output_jobs_collision(self):
+        """Should reject inputs that would overwrite each other's output"""
+        with pytest.raises(ValidationError, match="take1_converted.wav"):
+            batch_output_jobs(["a/take1.wav", "b/take1.wav"], "out")
+
+
 class TestModelValidation:
     """Test model file path validation"""
 
@@ -157,6 +198,30 @@ class TestIndexRateValidation:
             validate_index_rate("0.5")
 
 
+class TestPitchMethodValidation:
+    """Test pitch method validation"""
+
+    def test_valid_pitch_methods(self):
+        """Should accept known pitch methods"""
+        assert validate_pitch_method('auto') == 'auto'
+        assert validate_pitch_method('rmvpe') == 'rmvpe'
+        assert validate_pitch_method('fcpe') == 'fcpe'
+
+    def test_normalizes_case(self):
+        """Should normalize case and whitespace"""
+        assert validate_pitch_method(' FCPE ') == 'fcpe'
+
+    def test_unknown_pitch_method(self):
+        """Should reject unknown pitch methods"""
+        with pytest.raises(ValidationError, match="Invalid pitch method"):
+            validate_pitch_method('yin')
+
+    def test_non_string_pitch_method(self):
+        """Should reject non-string pitch methods"""
+        with pytest.raises(ValidationError, match="must be string"):
+            validate_pitch_method(1)
+
+
 class TestAudioDeviceValidation:
     """Test audio device ID validation"""
 